@@ -0,0 +1,121 @@
+"""Helpers shared by the benchmark scripts."""
+
+import ctypes
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)
+
+from PySide6.QtCore import QEvent, QObject, QPointF, Qt, qInstallMessageHandler
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QMainWindow, QVBoxLayout, QWidget
+
+from custom_title_bar import CustomTitleBar
+
+ICON_DIR = os.path.join(REPO_DIR, "icons")
+TITLE_BAR_KWARGS = dict(
+    change_btns_on_hover=True,
+    close_btn_default_img_path=os.path.join(ICON_DIR, "close-btn-default.svg"),
+    close_btn_hover_img_path=os.path.join(ICON_DIR, "close-btn-hover.svg"),
+    min_btn_default_img_path=os.path.join(ICON_DIR, "min-btn-default.svg"),
+    min_btn_hover_img_path=os.path.join(ICON_DIR, "min-btn-hover.svg"),
+    max_btn_default_img_path=os.path.join(ICON_DIR, "max-btn-default.svg"),
+    max_btn_hover_img_path=os.path.join(ICON_DIR, "max-btn-hover.svg"),
+    normal_btn_default_img_path=os.path.join(ICON_DIR, "max-btn-default.svg"),
+    normal_btn_hover_img_path=os.path.join(ICON_DIR, "normal-btn-hover.svg"),
+    disabled_btn_img_path=os.path.join(ICON_DIR, "disabled-btn.svg"),
+    title_bar_text_title_text="Benchmark",
+)
+
+
+def make_main_window(pool=None, **kwargs) -> tuple[QMainWindow, CustomTitleBar]:
+    """Builds a `QMainWindow` root with a `CustomTitleBar` (created by `pool` if given), following the README structure."""
+    root = QMainWindow()
+    root.resize(400, 300)
+    central_widget = QWidget()
+    root.setCentralWidget(central_widget)
+    central_widget_layout = QVBoxLayout(central_widget)
+    if pool is not None:
+        title_bar = pool.create(root, **kwargs)
+    else:
+        title_bar = CustomTitleBar(root=root, **{**TITLE_BAR_KWARGS, **kwargs})
+    central_widget_layout.addWidget(title_bar)
+    central_widget_layout.addStretch()
+    return root, title_bar
+
+
+def make_widget_window(**kwargs) -> tuple[QWidget, CustomTitleBar]:
+    """Builds a `QWidget` root with a `CustomTitleBar`, following the README structure."""
+    root = QWidget()
+    root.resize(400, 300)
+    container_layout = QVBoxLayout(root)
+    central_widget = QWidget(root)
+    container_layout.addWidget(central_widget)
+    central_widget_layout = QVBoxLayout(central_widget)
+    title_bar = CustomTitleBar(root=root, **{**TITLE_BAR_KWARGS, **kwargs})
+    central_widget_layout.addWidget(title_bar)
+    central_widget_layout.addStretch()
+    return root, title_bar
+
+
+def mouse_event(event_type: QEvent.Type, x: float, y: float) -> QMouseEvent:
+    """Builds a left-button mouse event at the given local position."""
+    pos = QPointF(x, y)
+    return QMouseEvent(
+        event_type,
+        pos,
+        pos,
+        Qt.MouseButton.LeftButton,
+        Qt.MouseButton.LeftButton,
+        Qt.KeyboardModifier.NoModifier,
+    )
+
+
+def rss_bytes() -> int | None:
+    """The resident set size of the process, if it can be read (Linux only)."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+def none_refs_dropped_per_call() -> int:
+    """Gives how many references to `None` a direct call of a C++ method from Python drops (0 on unaffected builds)."""
+    probe = QObject()
+    before = sys.getrefcount(None)
+    for _ in range(100):
+        probe.setObjectName("")
+    return max(0, (before - sys.getrefcount(None)) // 100)
+
+
+def pin_none(count: int) -> int:
+    """
+    Adds `count` permanent references to `None` if this PySide6 build drops them, and gives the number added.
+
+    PySide6 6.12.0 on CPython 3.11 drops a reference to `None` every time Python calls a C++ method directly (e.g. `super().mouseMoveEvent(event)` or `root.move(x, y)`). In a normal app this goes unnoticed, but a benchmark making hundreds of thousands of such calls aborts the interpreter once the count reaches zero. Nothing is pinned on Python >= 3.12 (where `None` is immortal) nor on builds that don't show the leak.
+    """
+    if sys.version_info >= (3, 12) or not none_refs_dropped_per_call():
+        return 0
+    incref = ctypes.pythonapi.Py_IncRef
+    incref.argtypes = [ctypes.py_object]
+    for _ in range(count):
+        incref(None)
+    return count
+
+
+def silence_offscreen_warnings():
+    """Drops the "does not support propagateSizeHints()" warning the offscreen platform prints for every shown window."""
+    previous = None
+
+    def handler(mode, context, message):
+        if "propagateSizeHints" in message:
+            return
+        if previous is not None:
+            previous(mode, context, message)
+        else:
+            sys.stderr.write(message + "\n")
+
+    previous = qInstallMessageHandler(handler)
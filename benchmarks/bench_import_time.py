@@ -0,0 +1,102 @@
+"""
+Checks the cold import time of the package against a budget, using `python -X importtime` in fresh interpreters.
+
+Importing the package or its theme and config layer must stay cheap for launchers that import it on every start: they must not pull in `PySide6.QtWidgets` (or, for the theme and config, PySide6 at all), and their import time must stay within budget. Importing `CustomTitleBar` (which loads Qt) is only reported. Exits with status 1 if a check fails.
+
+Run from the repository root::
+
+    python benchmarks/bench_import_time.py
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (statement, budget in ms or None, module prefix that must not be imported or None)
+CASES = [
+    ("import custom_title_bar", 50, "PySide6.QtWidgets"),
+    ("import custom_title_bar.theme", 50, "PySide6"),
+    ("from custom_title_bar import TitleBarTheme", 50, "PySide6"),
+    ("from custom_title_bar import TitleBarConfig", 50, "PySide6"),
+    ("from custom_title_bar import CustomTitleBar", None, None),
+]
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def measure(statement: str) -> tuple[float, set[str]]:
+    """Runs `statement` in a fresh interpreter and gives the time its imports took (in ms) and the modules it imported."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    total_us = 0
+    modules = set()
+    started = False
+    for match in IMPORTTIME_LINE.finditer(output):
+        cumulative, indent, module = int(match[2]), match[3], match[4]
+        if not started:
+            # Everything up to `site` is imported by the interpreter's startup.
+            started = len(indent) == 1 and module == "site"
+            continue
+        modules.add(module)
+        # Top-level entries only, as nested ones are part of their parent's cumulative time.
+        if len(indent) == 1:
+            total_us += cumulative
+    return total_us / 1000, modules
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Fresh interpreters per case; the fastest one counts (default: 5).",
+    )
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="Factor applied to every budget, for slow machines (default: 1.0).",
+    )
+    args = parser.parse_args(argv)
+
+    failures = []
+    for statement, budget_ms, forbidden in CASES:
+        runs = [measure(statement) for _ in range(args.repeat)]
+        best_ms = min(ms for ms, _ in runs)
+        modules = runs[0][1]
+        problems = []
+        if budget_ms is not None and best_ms > budget_ms * args.budget_scale:
+            problems.append(f"over budget of {budget_ms * args.budget_scale:.0f} ms")
+        if forbidden is not None:
+            leaked = sorted(
+                module
+                for module in modules
+                if module == forbidden or module.startswith(f"{forbidden}.")
+            )
+            if leaked:
+                problems.append(f"imports {', '.join(leaked)}")
+        budget = "-" if budget_ms is None else f"{budget_ms * args.budget_scale:.0f} ms"
+        print(
+            f"{statement:<48}{best_ms:>9.1f} ms  (budget {budget})  {'; '.join(problems) or 'ok'}"
+        )
+        if problems:
+            failures.append(statement)
+
+    if failures:
+        print(f"\n{len(failures)} check(s) failed")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
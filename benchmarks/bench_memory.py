@@ -0,0 +1,134 @@
+"""
+Measures the memory cost per window of `CustomTitleBar`, with and without a `TitleBarPool`.
+
+For growing numbers of shown windows, reports the Python memory (tracemalloc), the number of Qt objects and the process RSS per window, plus the marginal cost of one more window (the slope between the two largest counts). With the shared resources the cost should grow linearly with a small constant.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_memory.py
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QObject
+from PySide6.QtWidgets import QApplication
+
+from _support import (
+    TITLE_BAR_KWARGS,
+    make_main_window,
+    rss_bytes,
+    silence_offscreen_warnings,
+)
+from custom_title_bar import TitleBarPool
+
+
+def measure(count: int, pool: TitleBarPool | None) -> dict:
+    """Builds and shows `count` windows and gives their total Python memory, Qt object count and RSS growth."""
+    app = QApplication.instance()
+    gc.collect()
+    rss_before = rss_bytes()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    windows = [make_main_window(pool=pool) for _ in range(count)]
+    for root, _ in windows:
+        root.show()
+    app.processEvents()
+
+    gc.collect()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = rss_bytes()
+    qt_objects = sum(len(root.findChildren(QObject)) + 1 for root, _ in windows)
+
+    for root, _ in windows:
+        root.deleteLater()
+    windows.clear()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+    return {
+        "python_bytes": after - before,
+        "qt_objects": qt_objects,
+        "rss_bytes": None if rss_before is None else rss_after - rss_before,
+    }
+
+
+VARIANTS = {
+    "CustomTitleBar": lambda: None,
+    "TitleBarPool": lambda: TitleBarPool(**TITLE_BAR_KWARGS),
+}
+
+
+def measure_in_subprocess(variant: str, count: int) -> dict:
+    """Runs `measure` in a fresh interpreter, so memory freed by earlier measurements can't be reused and hide the RSS growth."""
+    output = subprocess.run(
+        [sys.executable, __file__, "--variant", variant, "--counts", str(count)],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--counts",
+        type=int,
+        nargs="+",
+        default=[1, 10, 50, 100],
+        help="Numbers of windows to measure (default: 1 10 50 100).",
+    )
+    parser.add_argument(
+        "--variant",
+        choices=VARIANTS,
+        help="Measure only this variant, in this process, and print the result as JSON.",
+    )
+    args = parser.parse_args(argv)
+
+    if args.variant is not None:
+        QApplication.instance() or QApplication([])
+        silence_offscreen_warnings()
+        make_pool = VARIANTS[args.variant]
+        # Warm up the process-wide caches so they don't count towards the measurement.
+        measure(1, make_pool())
+        print(json.dumps(measure(args.counts[0], make_pool())))
+        return 0
+
+    for variant in VARIANTS:
+        print(f"\n{variant}")
+        print(f"{'windows':>8}{'python/window':>16}{'qt objects/window':>20}{'rss/window':>14}")
+        results = {}
+        for count in args.counts:
+            result = measure_in_subprocess(variant, count)
+            results[count] = result
+            rss = (
+                "-"
+                if result["rss_bytes"] is None
+                else f"{result['rss_bytes'] / count / 1024:.1f} KiB"
+            )
+            print(
+                f"{count:>8}{result['python_bytes'] / count / 1024:>12.1f} KiB"
+                f"{result['qt_objects'] / count:>20.1f}{rss:>14}"
+            )
+
+        if len(args.counts) > 1:
+            low, high = sorted(args.counts)[-2:]
+            slope = (
+                results[high]["python_bytes"] - results[low]["python_bytes"]
+            ) / (high - low)
+            print(f"marginal python memory per window: {slope / 1024:.1f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
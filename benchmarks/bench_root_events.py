@@ -0,0 +1,93 @@
+"""
+Measures the per-event overhead the title bar adds to its root window's events.
+
+Compares a plain root, a root whose ``changeEvent`` is replaced by a Python closure (how earlier versions of `CustomTitleBar` watched window state changes) and a root watched through a `RootEventFilter`: once the root's native window exists, the window state is followed through its `windowStateChanged` signal and no other event should cost anything. The last variant shows the cost while an actual event filter is installed, which is only the case while a title bar waits for its root's central widget or layout.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_root_events.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from _support import pin_none
+from custom_title_bar import RootEventFilter
+
+EVENTS = 50_000
+# A change event (reaches changeEvent) and an event that doesn't.
+EVENT_TYPES = (QEvent.Type.FontChange, QEvent.Type.User)
+
+
+def monkeypatch_change_event(root: QWidget):
+    """Replaces `root.changeEvent` with a closure, like `TitleBtns` used to."""
+    super_change_event = root.changeEvent
+
+    def adjust_btn_display(event):
+        if event.type() == QEvent.Type.WindowStateChange:
+            pass
+        super_change_event(event)
+        event.accept()
+
+    root.changeEvent = adjust_btn_display
+
+
+def watch_window_state(root: QWidget):
+    RootEventFilter.for_root(root).add_handler(
+        QEvent.Type.WindowStateChange, lambda event: None
+    )
+
+
+def wait_for_child(root: QWidget):
+    RootEventFilter.for_root(root).add_handler(QEvent.Type.ChildAdded, lambda event: None)
+
+
+VARIANTS = {
+    "plain": lambda root: None,
+    "changeEvent closure": monkeypatch_change_event,
+    "RootEventFilter": watch_window_state,
+    "RootEventFilter (wait)": wait_for_child,
+}
+
+
+def time_events(root: QWidget, event_type: QEvent.Type) -> float:
+    """Gives the time (in nanoseconds) per event of sending `event_type` events to `root`."""
+    event = QEvent(event_type)
+    start = time.perf_counter()
+    for _ in range(EVENTS):
+        QApplication.sendEvent(root, event)
+    return (time.perf_counter() - start) / EVENTS * 1e9
+
+
+def main():
+    app = QApplication.instance() or QApplication(sys.argv)
+    # Only the closure calls a C++ method (the original `changeEvent`) directly, once per event.
+    pin_none(len(EVENT_TYPES) * EVENTS)
+
+    results = {}
+    for name, setup in VARIANTS.items():
+        root = QWidget()
+        # Creates the native window, as showing the root would.
+        root.winId()
+        setup(root)
+        results[name] = [time_events(root, event_type) for event_type in EVENT_TYPES]
+
+    plain = results["plain"]
+    print(f"{'':<22}" + "".join(f"{t.name:>24}" for t in EVENT_TYPES))
+    for name, timings in results.items():
+        cells = "".join(
+            f"{timing:>10.0f} ns (+{timing - base:>5.0f})"
+            for timing, base in zip(timings, plain)
+        )
+        print(f"{name:<22}{cells}")
+    del app
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""
+Opens and closes many windows with a `CustomTitleBar` over many cycles, to catch memory that isn't given back.
+
+Every cycle builds `--windows` windows (alternating `QMainWindow` and `QWidget` roots), shows them, replays a drag, hover and focus flips on each, then closes and deletes them all. Per cycle it reports the construction time, the peak RSS while the windows were open, the steady-state RSS and the tracemalloc growth once they are gone, and the number of live Qt objects left behind (widgets known to the application and Python wrappers of `QObject`s). After the warm-up cycles, all of these should stay flat; the growth per cycle (a least-squares slope over the measured cycles) is printed at the end, and `--max-growth` turns it into a failure.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_stress.py --windows 20 --cycles 50
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QEvent, QObject, QPointF
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtWidgets import QApplication
+
+from _support import (
+    make_main_window,
+    make_widget_window,
+    mouse_event,
+    rss_bytes,
+    silence_offscreen_warnings,
+)
+
+# Mouse positions of a replayed drag, relative to the press at (50, 10); the window ends where it started.
+DRAG_OFFSETS = (3, 8, 15, 24, 15, 8, 3, 0)
+
+
+def open_windows(count: int) -> list:
+    """Builds and shows `count` windows, alternating `QMainWindow` and `QWidget` roots."""
+    windows = [
+        make_main_window() if i % 2 == 0 else make_widget_window() for i in range(count)
+    ]
+    for root, _ in windows:
+        root.show()
+    QApplication.processEvents()
+    return windows
+
+
+def interaction_events() -> dict:
+    """
+    Builds the events replayed on every window: the drag's press, moves and release, and the hover's enter and leave.
+
+    They are built once and sent again and again, since PySide keeps a little memory for every event built from Python, which would show up as growth.
+    """
+    return {
+        "drag": [
+            mouse_event(QEvent.Type.MouseButtonPress, 50, 10),
+            *(mouse_event(QEvent.Type.MouseMove, 50 + dx, 10) for dx in DRAG_OFFSETS),
+            mouse_event(QEvent.Type.MouseButtonRelease, 50, 10),
+        ],
+        "hover": [
+            QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1)),
+            QEvent(QEvent.Type.Leave),
+        ],
+    }
+
+
+def replay_interactions(windows: list, events: dict):
+    """Drags every window back and forth, hovers its buttons and makes it the active window."""
+    app = QApplication.instance()
+    for root, title_bar in windows:
+        for event in events["drag"]:
+            app.sendEvent(title_bar, event)
+        for event in events["hover"]:
+            app.sendEvent(title_bar.title_btns, event)
+        root.activateWindow()
+        app.processEvents()
+
+
+def close_windows(windows: list):
+    """Closes and deletes the windows, and collects what they left behind."""
+    app = QApplication.instance()
+    for root, _ in windows:
+        root.close()
+        root.deleteLater()
+    windows.clear()
+    app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+    gc.collect()
+
+
+def live_qt_objects() -> tuple[int, int]:
+    """The number of widgets the application knows of and of Python wrappers of `QObject`s that are alive."""
+    wrappers = sum(isinstance(obj, QObject) for obj in gc.get_objects())
+    return len(QApplication.allWidgets()), wrappers
+
+
+def run_cycle(window_count: int, traced: bool, events: dict) -> dict:
+    """Opens, exercises and closes `window_count` windows, and measures the cycle."""
+    start = time.perf_counter()
+    windows = open_windows(window_count)
+    construction = time.perf_counter() - start
+    peak_rss = rss_bytes()
+
+    replay_interactions(windows, events)
+    if peak_rss is not None:
+        peak_rss = max(peak_rss, rss_bytes())
+
+    close_windows(windows)
+    widgets, wrappers = live_qt_objects()
+    return {
+        "construction_ms": construction * 1000,
+        "peak_rss_bytes": peak_rss,
+        "steady_rss_bytes": rss_bytes(),
+        "python_bytes": tracemalloc.get_traced_memory()[0] if traced else None,
+        "live_widgets": widgets,
+        "live_qobject_wrappers": wrappers,
+    }
+
+
+def slope(values: list[float]) -> float:
+    """The least-squares growth of `values` per step."""
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(count))
+    return numerator / denominator
+
+
+def format_kib(value: int | float | None) -> str:
+    """Formats a number of bytes in KiB, or `-` if it wasn't measured."""
+    return "-" if value is None else f"{value / 1024:.1f}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--windows", type=int, default=20, help="Windows opened per cycle (default: 20)."
+    )
+    parser.add_argument(
+        "--cycles", type=int, default=50, help="Measured cycles (default: 50)."
+    )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=3,
+        help="Cycles run before measuring, to fill the process-wide caches (default: 3).",
+    )
+    parser.add_argument(
+        "--no-tracemalloc",
+        action="store_true",
+        help="Don't trace Python allocations (which slows construction down); the Python memory isn't reported then.",
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        metavar="KIB",
+        help="Fail if the steady-state Python memory (or RSS, without tracemalloc) grows by more than this many KiB per cycle.",
+    )
+    parser.add_argument("--output", help="Path of the JSON file to write the cycles to.")
+    args = parser.parse_args(argv)
+
+    QApplication.instance() or QApplication([])
+    silence_offscreen_warnings()
+
+    events = interaction_events()
+    for _ in range(args.warmup):
+        run_cycle(args.windows, traced=False, events=events)
+    traced = not args.no_tracemalloc
+    if traced:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0] if traced else 0
+
+    print(
+        f"{'cycle':>6}{'construct ms':>14}{'peak rss KiB':>14}{'rss KiB':>12}"
+        f"{'python KiB':>12}{'widgets':>9}{'wrappers':>10}"
+    )
+    cycles = []
+    for index in range(args.cycles):
+        cycle = run_cycle(args.windows, traced, events)
+        if traced:
+            cycle["python_bytes"] -= baseline
+        cycles.append(cycle)
+        print(
+            f"{index + 1:>6}{cycle['construction_ms']:>14.1f}"
+            f"{format_kib(cycle['peak_rss_bytes']):>14}{format_kib(cycle['steady_rss_bytes']):>12}"
+            f"{format_kib(cycle['python_bytes']):>12}"
+            f"{cycle['live_widgets']:>9}{cycle['live_qobject_wrappers']:>10}"
+        )
+    if traced:
+        tracemalloc.stop()
+
+    growth = {
+        key: slope([cycle[key] for cycle in cycles])
+        for key in ("steady_rss_bytes", "python_bytes", "live_widgets", "live_qobject_wrappers")
+        if cycles and cycles[0][key] is not None
+    }
+    print(f"\ngrowth per cycle of {args.windows} windows:")
+    for key, value in growth.items():
+        unit = f"{value / 1024:.2f} KiB" if key.endswith("bytes") else f"{value:.2f}"
+        print(f"  {key}: {unit}")
+    peaks = [cycle["peak_rss_bytes"] for cycle in cycles if cycle["peak_rss_bytes"] is not None]
+    if peaks:
+        print(f"peak RSS: {format_kib(max(peaks))} KiB")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"windows": args.windows, "cycles": cycles, "growth": growth}, file, indent=2)
+
+    if args.max_growth is not None:
+        key = "python_bytes" if "python_bytes" in growth else "steady_rss_bytes"
+        if growth.get(key, 0.0) / 1024 > args.max_growth:
+            print(f"FAIL: {key} grows by more than {args.max_growth} KiB per cycle")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
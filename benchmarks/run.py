@@ -0,0 +1,397 @@
+"""
+Headless benchmark suite for the title bar's hot paths.
+
+Covers `CustomTitleBar` construction on `QWidget` and `QMainWindow` roots, drag throughput (`mouseMoveEvent`/`_check_stick` with synthesized `QMouseEvent`s, live and with an outline ghost), resize throughput (`WindowResizer.resize_to`, live and with a rubber band preview), full repaints on the translucent and the opaque render paths, focus-change fan-out with 1/10/100 windows, hover icon swaps, bursts of `set_title` calls, opening a 10,000-entry `LazyMenu` and command palette keystrokes over 5,000 actions. Results are written as JSON; `--compare` flags cases whose best round got slower than a stored baseline by more than `--threshold`.
+
+Run from the repository root::
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/run.py --output baseline.json
+    QT_QPA_PLATFORM=offscreen python benchmarks/run.py --compare baseline.json
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Callable
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import PySide6
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QEnterEvent
+from PySide6.QtWidgets import QApplication, QMenu
+
+from _support import make_main_window, make_widget_window, mouse_event, pin_none, silence_offscreen_warnings
+
+# References to `None` pinned per round on the PySide6 builds that drop them (see `pin_none`): the full suite drops about 55,000 over the default 7 rounds, mostly while constructing windows and swapping icons.
+NONE_REFS_PER_ROUND = 12_000
+
+# Benchmark cases: each one sets things up and returns `(run, number)`, where `run` is timed `number` times per round.
+
+
+def bench_construct_qmainwindow():
+    app = QApplication.instance()
+
+    def run():
+        root, _ = make_main_window()
+        root.deleteLater()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    return run, 20
+
+
+def bench_construct_qwidget():
+    app = QApplication.instance()
+
+    def run():
+        root, _ = make_widget_window()
+        root.deleteLater()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    return run, 20
+
+
+def bench_construct_qmainwindow_lazy():
+    app = QApplication.instance()
+
+    def run():
+        root, _ = make_main_window(lazy_init=True)
+        root.deleteLater()
+        app.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+    return run, 20
+
+
+def _drag_case(**kwargs):
+    root, title_bar = make_main_window(**kwargs)
+    root.show()
+    root.move(200, 200)
+    QApplication.processEvents()
+    title_bar.mousePressEvent(
+        mouse_event(QEvent.Type.MouseButtonPress, 50, 10)
+    )
+    # Alternate left and right so the window stays put and both stick branches run.
+    moves = [
+        mouse_event(QEvent.Type.MouseMove, 50 + dx, 10)
+        for dx in (3, -3, 5, -5, 1, -1, 7, -7)
+    ]
+    state = {"i": 0}
+
+    def run():
+        title_bar.mouseMoveEvent(moves[state["i"] % len(moves)])
+        state["i"] += 1
+
+    run.keep_alive = root
+    return run, 200
+
+
+def bench_drag_mouse_move():
+    return _drag_case(stick_to_sides=True)
+
+
+def bench_drag_mouse_move_coalesced():
+    return _drag_case(stick_to_sides=True, coalesce_drag_moves=True)
+
+
+def bench_drag_mouse_move_outline():
+    return _drag_case(stick_to_sides=True, drag_mode="outline")
+
+
+def _resize_case(**kwargs):
+    root, title_bar = make_main_window(resizable=True, **kwargs)
+    root.show()
+    root.move(200, 200)
+    QApplication.processEvents()
+    resizer = title_bar.resizer
+    start = root.geometry().bottomRight()
+    resizer.start(Qt.Edge.RightEdge | Qt.Edge.BottomEdge, start)
+    # Grow and shrink by turns so the window stays around the same size.
+    positions = [start + QPoint(d, d) for d in (3, -3, 5, -5, 1, -1, 7, -7)]
+    state = {"i": 0}
+
+    def run():
+        resizer.resize_to(positions[state["i"] % len(positions)])
+        state["i"] += 1
+
+    run.keep_alive = root
+    return run, 500
+
+
+def bench_resize_mouse_move():
+    return _resize_case()
+
+
+def bench_resize_mouse_move_preview():
+    return _resize_case(resize_preview=True)
+
+
+def _repaint_case(maximized=False, **kwargs):
+    root, _ = make_main_window(**kwargs)
+    # The same size on every path, so only the rendering differs.
+    root.setGeometry(root.screen().availableGeometry())
+    if maximized:
+        root.showMaximized()
+    else:
+        root.show()
+    QApplication.processEvents()
+
+    def run():
+        root.repaint()
+
+    run.keep_alive = root
+    return run, 30
+
+
+def bench_repaint_translucent():
+    return _repaint_case()
+
+
+def bench_repaint_opaque_maximized():
+    return _repaint_case(maximized=True)
+
+
+def bench_repaint_opaque_square():
+    return _repaint_case(root_border_radius=0)
+
+
+def bench_check_stick():
+    root, title_bar = make_main_window()
+    root.show()
+    root.move(0, 200)
+    QApplication.processEvents()
+    title_bar._get_screen_limits()
+    positions = [-40, -10, 5, 40]
+    state = {"i": 0}
+
+    def run():
+        title_bar._check_stick(positions[state["i"] % len(positions)])
+        state["i"] += 1
+
+    run.keep_alive = root
+    return run, 2000
+
+
+def _focus_fan_out(window_count: int):
+    windows = [make_main_window() for _ in range(window_count)]
+    for root, _ in windows:
+        root.show()
+    QApplication.processEvents()
+    state = {"i": 0}
+
+    def run():
+        windows[state["i"] % window_count][0].activateWindow()
+        QApplication.processEvents()
+        state["i"] += 1
+
+    run.keep_alive = windows
+    return run, 50
+
+
+def bench_focus_fan_out_1():
+    return _focus_fan_out(1)
+
+
+def bench_focus_fan_out_10():
+    return _focus_fan_out(10)
+
+
+def bench_focus_fan_out_100():
+    return _focus_fan_out(100)
+
+
+def bench_hover_icon_swap():
+    root, title_bar = make_main_window()
+    root.show()
+    QApplication.processEvents()
+    title_btns = title_bar.title_btns
+    enter = QEnterEvent(QPointF(1, 1), QPointF(1, 1), QPointF(1, 1))
+    leave = QEvent(QEvent.Type.Leave)
+
+    def run():
+        QApplication.sendEvent(title_btns, enter)
+        QApplication.sendEvent(title_btns, leave)
+
+    run.keep_alive = root
+    return run, 100
+
+
+def bench_set_title_burst():
+    root, title_bar = make_main_window()
+    root.show()
+    QApplication.processEvents()
+    state = {"i": 0}
+
+    def run():
+        # A progress-style burst: many titles in a row, then one event loop pass.
+        for _ in range(100):
+            title_bar.set_title(f"Job: {state['i'] % 100}%")
+            state["i"] += 1
+        QApplication.processEvents()
+
+    run.keep_alive = root
+    return run, 20
+
+
+def bench_open_lazy_menu_10k():
+    root, title_bar = make_main_window()
+    root.show()
+    QApplication.processEvents()
+    entries = [f"/home/user/projects/file_{i:05d}.txt" for i in range(10000)]
+    menu = title_bar.add_lazy_menu("Recent", lambda: entries)
+
+    def run():
+        # Invalidated every time, so the provider is called and the list rebuilt on each open.
+        menu.invalidate()
+        menu.popup(QPoint(100, 100))
+        QApplication.processEvents()
+        menu.hide()
+
+    run.keep_alive = root
+    return run, 20
+
+
+def bench_command_palette_keystroke():
+    root, title_bar = make_main_window()
+    words = "open save close export import print find replace select copy paste undo view layer filter image color brush tool script".split()
+    # 5,000 actions in 10 menus of 10 submenus each.
+    for menu_number in range(10):
+        menu = QMenu(f"Menu {menu_number}")
+        for submenu_number in range(10):
+            submenu = menu.addMenu(f"Submenu {submenu_number}")
+            for action_number in range(50):
+                number = (menu_number * 10 + submenu_number) * 50 + action_number
+                submenu.addAction(
+                    f"{words[number % 20]} {words[number // 20 % 20]} {words[number // 400 % 20]} {number}"
+                )
+        title_bar.add_menu_item(menu)
+    root.show()
+    title_bar.show_command_palette()
+    QApplication.processEvents()
+    palette = title_bar.command_palette
+    # Typing "export lay", one keystroke per call.
+    queries = ["export lay"[:length] for length in range(1, 11)]
+    state = {"i": 0}
+
+    def run():
+        palette.line_edit.setText(queries[state["i"] % len(queries)])
+        state["i"] += 1
+
+    run.keep_alive = root
+    return run, 100
+
+
+BENCHMARKS: dict[str, Callable] = {
+    name[len("bench_") :]: function
+    for name, function in globals().items()
+    if name.startswith("bench_")
+}
+
+
+def time_case(setup: Callable, repeat: int) -> dict:
+    """Times one case and gives its per-call statistics in microseconds."""
+    run, number = setup()
+    run()  # warm-up
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "median_us": statistics.median(timings),
+        "min_us": min(timings),
+        "max_us": max(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """
+    Gives the names of the cases whose best round is more than `threshold` (relative) slower than in `baseline`.
+
+    The best round is compared rather than the median since it is the one least disturbed by the rest of the machine.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        ratio = result["min_us"] / base["min_us"]
+        flag = "REGRESSION" if ratio > 1 + threshold else ""
+        print(
+            f"{name:<32}{base['min_us']:>12.1f}{result['min_us']:>12.1f}{ratio:>9.2f}x  {flag}"
+        )
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--output", help="Path of the JSON file to write the results to."
+    )
+    parser.add_argument(
+        "--compare", metavar="BASELINE", help="JSON results to compare against."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative slowdown of the best round that counts as a regression (default: 0.2).",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=7, help="Timed rounds per case (default: 7)."
+    )
+    parser.add_argument(
+        "-k", dest="filter", default="", help="Only run cases containing this text."
+    )
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication([])
+    none_pinned = pin_none(NONE_REFS_PER_ROUND * (args.repeat + 1))
+    silence_offscreen_warnings()
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+        results[name] = time_case(setup, args.repeat)
+        # The case's windows are only kept by reference cycles now. Deleting them here rather than whenever the collector next runs keeps that from happening in the middle of a later case's event dispatch (which crashes).
+        gc.collect()
+        print(
+            f"{name:<32}{results[name]['min_us']:>12.1f} us (median {results[name]['median_us']:.1f})"
+        )
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pyside6": PySide6.__version__,
+            "platform": platform.platform(),
+            "qpa": app.platformName(),
+            "none_refs_pinned": none_pinned,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)["results"]
+        print(f"\n{'':<32}{'baseline':>12}{'current':>12}{'ratio':>9}")
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
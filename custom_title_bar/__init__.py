@@ -0,0 +1,79 @@
+"""
+Implements a custom title bar which automatically replaces default title bar of a `QWidget` or `QMainWindow`.
+
+The names below are loaded from their submodule on first access, so importing the package (or `custom_title_bar.theme` and `custom_title_bar.config`) doesn't import `PySide6.QtWidgets`; only the widget classes do.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import TitleBarConfig
+    from .animation import WindowStateAnimator
+    from .drag import DragGhost
+    from .drag_trace import DragSummary, DragTracer
+    from .events import FocusDispatcher, FrameCoalescer, RootEventFilter, focus_dispatcher
+    from .geometry import (
+        ScreenEdgeIndex,
+        WindowEdgeIndex,
+        screen_edge_index,
+        window_edge_index,
+    )
+    from .icons import IconCache, icon_cache, rasterize_icon
+    from .instrumentation import Instrumentation
+    from .menus import LazyEntryModel, LazyMenu
+    from .palette import ActionIndex, CommandPalette
+    from .pool import TitleBarPool
+    from .resize import ResizeGrip, WindowResizer
+    from .theme import TitleBarTheme
+    from .title_bar import CustomTitleBar
+    from .widgets import TitleBtns, TitleMenuBar, TitleText
+
+# Public name -> submodule it is defined in.
+_LAZY_NAMES = {
+    "CustomTitleBar": "title_bar",
+    "TitleBarPool": "pool",
+    "TitleBtns": "widgets",
+    "TitleText": "widgets",
+    "TitleMenuBar": "widgets",
+    "TitleBarTheme": "theme",
+    "TitleBarConfig": "config",
+    "IconCache": "icons",
+    "icon_cache": "icons",
+    "rasterize_icon": "icons",
+    "DragGhost": "drag",
+    "WindowStateAnimator": "animation",
+    "FrameCoalescer": "events",
+    "RootEventFilter": "events",
+    "FocusDispatcher": "events",
+    "focus_dispatcher": "events",
+    "ScreenEdgeIndex": "geometry",
+    "WindowEdgeIndex": "geometry",
+    "screen_edge_index": "geometry",
+    "window_edge_index": "geometry",
+    "ResizeGrip": "resize",
+    "WindowResizer": "resize",
+    "LazyMenu": "menus",
+    "LazyEntryModel": "menus",
+    "ActionIndex": "palette",
+    "CommandPalette": "palette",
+    "Instrumentation": "instrumentation",
+    "DragTracer": "drag_trace",
+    "DragSummary": "drag_trace",
+}
+
+__all__ = list(_LAZY_NAMES)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module_name}", __name__), name)
+    # Cache it so later lookups don't go through `__getattr__` again.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
@@ -0,0 +1,173 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt, QElapsedTimer, QEasingCurve, QObject, QRect, QTimer
+from typing import Optional
+
+from .drag import DragGhost
+from .events import connect_slot, frame_interval
+
+
+def interpolate_rect(start: QRect, end: QRect, progress: float) -> QRect:
+    """Gives the rectangle `progress` (0 to 1) of the way from `start` to `end`."""
+    return QRect(
+        round(start.x() + (end.x() - start.x()) * progress),
+        round(start.y() + (end.y() - start.y()) * progress),
+        round(start.width() + (end.width() - start.width()) * progress),
+        round(start.height() + (end.height() - start.height()) * progress),
+    )
+
+
+class WindowStateAnimator(QObject):
+    """
+    Animates the maximize, restore and minimize transitions of a window with a snapshot of it.
+
+    The window is grabbed into a pixmap once, a `DragGhost` showing that pixmap is animated to the target geometry at the display's refresh rate while the window itself is made invisible, and the window's state only changes once, at the end. Animating the real geometry instead would lay out the whole content on every frame.
+
+    There is one animator per window (see `for_window`), created on first use.
+
+    :param window: The top-level window to animate.
+    :type window: QWidget
+
+    :param duration: The length of the transitions in milliseconds. Defaults to `150`.
+    :type duration: Optional[int]
+    """
+
+    OBJECT_NAME = "title-bar-window-state-animator"
+
+    # Size of the window's snapshot at the end of the minimize transition, relative to the window.
+    MINIMIZED_SCALE = 0.2
+
+    def __init__(self, window: QWidget, duration: Optional[int] = 150):
+        super().__init__(window)
+        self.setObjectName(self.OBJECT_NAME)
+        self.window = window
+        self.duration = duration
+        self._ghost: Optional[DragGhost] = None
+        # Set while a transition is running.
+        self._target_state: Optional[Qt.WindowState] = None
+        self._start_geometry = QRect()
+        self._end_geometry = QRect()
+        self._window_opacity = 1.0
+        self._easing = QEasingCurve(QEasingCurve.Type.OutCubic)
+        self._clock = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._step)
+
+    @classmethod
+    def for_window(
+        cls, window: QWidget, duration: Optional[int] = 150
+    ) -> "WindowStateAnimator":
+        """Gives the animator of `window`, creating one if there is none yet."""
+        animator = window.findChild(
+            cls, cls.OBJECT_NAME, Qt.FindChildOption.FindDirectChildrenOnly
+        )
+        if animator is None:
+            animator = cls(window, duration=duration)
+        return animator
+
+    def is_running(self) -> bool:
+        """Whether a transition is running."""
+        return self._target_state is not None
+
+    @property
+    def target_state(self) -> Qt.WindowState:
+        """The state the window is in, or is being animated to if a transition is running."""
+        if self._target_state is not None:
+            return self._target_state
+        return self.window.windowState()
+
+    def show_maximized(self):
+        """Maximizes the window with a transition."""
+        self.animate(Qt.WindowState.WindowMaximized)
+
+    def show_minimized(self):
+        """Minimizes the window with a transition."""
+        self.animate(Qt.WindowState.WindowMinimized)
+
+    def show_normal(self):
+        """Restores the window with a transition."""
+        self.animate(Qt.WindowState.WindowNoState)
+
+    def animate(self, state: Qt.WindowState):
+        """
+        Changes the window's state to `state` (`WindowMaximized`, `WindowMinimized` or `WindowNoState`) with a transition. A transition that is still running is finished first. Hidden windows change state straight away.
+
+        :param state: The target state.
+        :type state: Qt.WindowState
+        """
+        self.finish()
+        window = self.window
+        start = window.geometry()
+        end = self._target_geometry(state)
+        if not window.isVisible() or self.duration <= 0 or end == start:
+            self._apply_state(state)
+            return
+
+        if self._ghost is None:
+            self._ghost = DragGhost("snapshot", opacity=1.0)
+            # The ghost is a top-level widget, so it isn't deleted along with the window.
+            connect_slot(window, "destroyed()", self._ghost, "deleteLater()")
+        self._ghost.start(window)
+        self._window_opacity = window.windowOpacity()
+        window.setWindowOpacity(0.0)
+
+        self._target_state = state
+        self._start_geometry = start
+        self._end_geometry = end
+        self._clock.start()
+        self._timer.start(frame_interval(window))
+
+    def finish(self):
+        """Ends the running transition (if any) right away, applying its window state."""
+        if self._target_state is None:
+            return
+        state = self._target_state
+        self._target_state = None
+        self._timer.stop()
+        self._apply_state(state)
+        self.window.setWindowOpacity(self._window_opacity)
+        self._ghost.finish()
+
+    def _step(self):
+        progress = min(1.0, self._clock.elapsed() / self.duration)
+        self._ghost.setGeometry(
+            interpolate_rect(
+                self._start_geometry,
+                self._end_geometry,
+                self._easing.valueForProgress(progress),
+            )
+        )
+        if progress >= 1.0:
+            self.finish()
+
+    def _target_geometry(self, state: Qt.WindowState) -> QRect:
+        window = self.window
+        geometry = window.geometry()
+        if state == Qt.WindowState.WindowMaximized:
+            return window.screen().availableGeometry()
+        if state == Qt.WindowState.WindowMinimized:
+            # Shrink towards the bottom of the screen, where the task bar or dock usually is.
+            available = window.screen().availableGeometry()
+            width = round(geometry.width() * self.MINIMIZED_SCALE)
+            height = round(geometry.height() * self.MINIMIZED_SCALE)
+            return QRect(
+                geometry.center().x() - width // 2,
+                available.bottom() - height,
+                width,
+                height,
+            )
+        if window.windowState() & (
+            Qt.WindowState.WindowMaximized | Qt.WindowState.WindowFullScreen
+        ):
+            normal_geometry = window.normalGeometry()
+            if normal_geometry.isValid():
+                return normal_geometry
+        return geometry
+
+    def _apply_state(self, state: Qt.WindowState):
+        if state == Qt.WindowState.WindowMaximized:
+            self.window.showMaximized()
+        elif state == Qt.WindowState.WindowMinimized:
+            self.window.showMinimized()
+        else:
+            self.window.showNormal()
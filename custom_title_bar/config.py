@@ -0,0 +1,88 @@
+from dataclasses import dataclass, fields, replace
+from typing import TYPE_CHECKING, Any, Optional
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import Qt
+
+# Values of `TitleBarConfig.drag_mode`.
+DRAG_MODES = ("live", "outline", "snapshot")
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
+class TitleBarConfig:
+    """
+    The (non-styling) settings of a `CustomTitleBar` and its `TitleBtns`, in one immutable object that the components read from instead of each keeping its own copies. The styling settings live in `TitleBarTheme`.
+
+    Title bars with equal settings share a single instance (see `interned`) for as long as one of them uses it, so a window only costs a reference to it. Use `dataclasses.replace` (or `CustomTitleBar.update_style` for the paddings) to derive changed settings.
+
+    The parameters have the same meaning and defaults as the corresponding parameters of `CustomTitleBar`, except for `btn_hover_cursor_shape`, where `None` stands for `Qt.CursorShape.PointingHandCursor` (so that this module doesn't import Qt).
+    """
+
+    # title bar settings
+    stick_to_sides: bool = True
+    title_bar_bottom_padding: int = 0
+    title_bar_right_padding: int = 12
+    title_bar_left_padding: int = 6
+    title_bar_top_padding: int = 10
+    title_bar_to_menu_bar_padding: int = 5
+    stick_to_windows: bool = False
+    window_stick_threshold: int = 10
+    coalesce_drag_moves: bool = False
+    lazy_init: bool = False
+    resizable: bool = False
+    resize_margin: int = 5
+    resize_preview: bool = False
+    drag_mode: str = "live"
+    animate_window_state: bool = False
+    window_state_animation_duration: int = 150
+    maximize_on_double_click: bool = True
+    command_palette_shortcut: Optional[str] = None
+    # btn settings
+    btn_to_title_margin: int = 10
+    close_btn_default_img_path: Optional[str] = None
+    min_btn_default_img_path: Optional[str] = None
+    max_btn_default_img_path: Optional[str] = None
+    normal_btn_default_img_path: Optional[str] = None
+    disabled_btns_on_focus_out: bool = True
+    disabled_btn_img_path: Optional[str] = None
+    btn_size: tuple[int, int] = (12, 12)
+    change_btns_on_hover: bool = False
+    use_icon_modes: bool = False
+    change_cursor_on_btn_hover: bool = False
+    btn_hover_cursor_shape: Optional["Qt.CursorShape"] = None
+    close_btn_hover_img_path: Optional[str] = None
+    min_btn_hover_img_path: Optional[str] = None
+    max_btn_hover_img_path: Optional[str] = None
+    normal_btn_hover_img_path: Optional[str] = None
+
+    def __post_init__(self):
+        # Keeps the config hashable when the size is given as a list.
+        object.__setattr__(self, "btn_size", tuple(self.btn_size))
+        if self.drag_mode not in DRAG_MODES:
+            raise ValueError(
+                f"drag_mode must be one of {', '.join(map(repr, DRAG_MODES))}, not {self.drag_mode!r}"
+            )
+
+    @classmethod
+    def field_names(cls) -> tuple[str, ...]:
+        """The names of all settings."""
+        return _FIELD_NAMES
+
+    def interned(self) -> "TitleBarConfig":
+        """Gives the instance shared by every title bar with settings equal to this one's."""
+        # Keyed by the values rather than by the config, which the dictionary would keep alive.
+        key = tuple(getattr(self, name) for name in _FIELD_NAMES)
+        config = _interned.get(key)
+        if config is None:
+            config = _interned[key] = self
+        return config
+
+    def replace(self, **changes: Any) -> "TitleBarConfig":
+        """Gives the shared config with `changes` applied."""
+        return replace(self, **changes).interned()
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(TitleBarConfig))
+# Shared between all title bars: one config per distinct set of settings in use, held weakly.
+_interned: WeakValueDictionary[tuple, TitleBarConfig] = WeakValueDictionary()
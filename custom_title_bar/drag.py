@@ -0,0 +1,60 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPainter, QPen, QPixmap
+from typing import Optional
+
+
+class DragGhost(QWidget):
+    """
+    A lightweight stand-in that follows the mouse while a window is dragged with a deferred `drag_mode`, so the window itself (and its content) is only moved once, on release. `WindowStateAnimator` also uses it to animate a snapshot of a window.
+
+    It is a frameless, input-transparent top-level widget showing either an outline of the window (`"outline"`) or a snapshot of it, grabbed once when the drag starts (`"snapshot"`) and scaled to the ghost's size. Moving or resizing it only repaints the ghost.
+
+    :param mode: `"outline"` or `"snapshot"`.
+    :type mode: str
+
+    :param opacity: The opacity of the snapshot. Defaults to `0.75`.
+    :type opacity: Optional[float]
+    """
+
+    def __init__(self, mode: str, opacity: Optional[float] = 0.75):
+        super().__init__(
+            None,
+            Qt.WindowType.Tool
+            | Qt.WindowType.FramelessWindowHint
+            | Qt.WindowType.NoDropShadowWindowHint
+            | Qt.WindowType.WindowStaysOnTopHint
+            | Qt.WindowType.WindowTransparentForInput,
+        )
+        self.mode = mode
+        self.opacity = opacity
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        self._snapshot: Optional[QPixmap] = None
+
+    def start(self, window: QWidget):
+        """Shows the ghost over `window`."""
+        if self.mode == "snapshot":
+            self._snapshot = window.grab()
+        self.setGeometry(window.geometry())
+        self.show()
+
+    def finish(self):
+        """Hides the ghost and drops its snapshot."""
+        self.hide()
+        self._snapshot = None
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        if self._snapshot is not None:
+            painter.setOpacity(self.opacity)
+            painter.drawPixmap(self.rect(), self._snapshot)
+        else:
+            highlight = self.palette().highlight().color()
+            fill = QColor(highlight)
+            fill.setAlpha(40)
+            painter.setPen(QPen(highlight, 2))
+            painter.setBrush(fill)
+            painter.drawRect(self.rect().adjusted(1, 1, -1, -1))
+        painter.end()
@@ -0,0 +1,154 @@
+import logging
+import math
+from collections import Counter
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    # Nearest-rank percentile of sorted `values`.
+    if not values:
+        return 0.0
+    return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+
+@dataclass(frozen=True)
+class DragSummary:
+    """
+    The input-to-move latency and frame pacing of one window drag, as measured by a `DragTracer`.
+
+    The latency of a mouse move event runs from when it was created (its `timestamp()`, aligned with the clock of the drag by its least delayed event, so queueing in the event loop counts) to when the `move()` of the window (or of its ghost) that carries its position returned. Events without timestamps (e.g. synthetic ones) are measured from when the title bar received them.
+    """
+
+    events: int
+    moves: int
+    duration_ms: float
+    frame_interval_ms: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+    latency_p99_ms: float
+    latency_max_ms: float
+    # Frames in which mouse move events came in but no move took effect.
+    missed_frames: int
+    # Over the frames in which mouse move events came in.
+    events_per_frame: float
+    max_events_per_frame: int
+    # Events whose position was never moved to (e.g. superseded when the drag ended).
+    unapplied_events: int
+
+    def __str__(self) -> str:
+        return (
+            f"drag: {self.events} events, {self.moves} moves in {self.duration_ms:.1f} ms; "
+            f"latency p50 {self.latency_p50_ms:.2f} ms, p95 {self.latency_p95_ms:.2f} ms, "
+            f"p99 {self.latency_p99_ms:.2f} ms, max {self.latency_max_ms:.2f} ms; "
+            f"{self.missed_frames} missed frames of {self.frame_interval_ms:.1f} ms; "
+            f"{self.events_per_frame:.2f} events per frame (max {self.max_events_per_frame})"
+        )
+
+
+class DragTracer:
+    """
+    Measures the input-to-move latency and the dropped frames of window drags, one `DragSummary` per drag. Installed on a title bar with `CustomTitleBar.trace_drags`, which feeds it the press, move and release events of its drags.
+
+    :param callback: Called with the `DragSummary` of every finished drag. Defaults to `None` (the summary is logged on the `custom_title_bar.drag_trace` logger at `INFO` level instead).
+    :type callback: Optional[Callable[[DragSummary], None]]
+    """
+
+    def __init__(self, callback: Optional[Callable[[DragSummary], None]] = None):
+        self.callback = callback
+        self.last_summary: Optional[DragSummary] = None
+        # Set while a drag is traced.
+        self._start_ns: Optional[int] = None
+        self._frame_ns = 0
+        # Per event: its timestamp (ms), when it was received and when its position was moved to (0 until then).
+        self._timestamps: list[int] = []
+        self._received: list[int] = []
+        self._moved: list[int] = []
+        # Index of the first event not moved to yet.
+        self._pending = 0
+        self._move_times: list[int] = []
+
+    def is_tracing(self) -> bool:
+        """Whether a drag is being traced."""
+        return self._start_ns is not None
+
+    def begin(self, frame_interval_ms: int):
+        """
+        Starts tracing a drag (on mouse press).
+
+        :param frame_interval_ms: The length of a display frame of the dragged window's screen.
+        :type frame_interval_ms: int
+        """
+        self._start_ns = perf_counter_ns()
+        self._frame_ns = frame_interval_ms * 1_000_000
+        self._timestamps.clear()
+        self._received.clear()
+        self._moved.clear()
+        self._pending = 0
+        self._move_times.clear()
+
+    def event(self, timestamp_ms: int):
+        """Records a mouse move event of the drag, with its `timestamp()`."""
+        self._timestamps.append(timestamp_ms)
+        self._received.append(perf_counter_ns())
+        self._moved.append(0)
+
+    def moved(self):
+        """Records that the window (or its ghost) was just moved to the position of the latest event."""
+        now = perf_counter_ns()
+        moved = self._moved
+        for index in range(self._pending, len(moved)):
+            moved[index] = now
+        self._pending = len(moved)
+        self._move_times.append(now)
+
+    def end(self) -> Optional[DragSummary]:
+        """Finishes the traced drag (on mouse release) and reports its summary, unless the mouse didn't move."""
+        if self._start_ns is None:
+            return None
+        end_ns = perf_counter_ns()
+        start_ns = self._start_ns
+        self._start_ns = None
+        if not self._timestamps:
+            return None
+
+        created = self._created_times()
+        frame_ns = self._frame_ns
+        latencies = sorted(
+            (moved - created) / 1e6 for moved, created in zip(self._moved, created) if moved
+        )
+        events_by_frame = Counter((time - start_ns) // frame_ns for time in created)
+        move_frames = {(time - start_ns) // frame_ns for time in self._move_times}
+        summary = DragSummary(
+            events=len(created),
+            moves=len(self._move_times),
+            duration_ms=(end_ns - start_ns) / 1e6,
+            frame_interval_ms=frame_ns / 1e6,
+            latency_p50_ms=_percentile(latencies, 50),
+            latency_p95_ms=_percentile(latencies, 95),
+            latency_p99_ms=_percentile(latencies, 99),
+            latency_max_ms=latencies[-1] if latencies else 0.0,
+            missed_frames=len(events_by_frame.keys() - move_frames),
+            events_per_frame=len(created) / len(events_by_frame),
+            max_events_per_frame=max(events_by_frame.values()),
+            unapplied_events=len(created) - len(latencies),
+        )
+        self.last_summary = summary
+        if self.callback is not None:
+            self.callback(summary)
+        else:
+            logger.info("%s", summary)
+        return summary
+
+    def _created_times(self) -> list[int]:
+        """Gives when each event was created on the `perf_counter_ns` clock, or when it was received if the events have no (increasing) timestamps."""
+        timestamps = self._timestamps
+        received = self._received
+        if not timestamps[0] or any(b < a for a, b in zip(timestamps, timestamps[1:])):
+            return list(received)
+        # The event received soonest after its creation gives the offset between the clocks.
+        offset = min(time - timestamp * 1_000_000 for time, timestamp in zip(received, timestamps))
+        return [timestamp * 1_000_000 + offset for timestamp in timestamps]
@@ -0,0 +1,340 @@
+from PySide6.QtWidgets import QWidget, QApplication
+from PySide6.QtCore import Qt, QEvent, QObject, QTimer, SIGNAL, SLOT, Slot
+from PySide6.QtGui import QGuiApplication, QWindow
+from shiboken6 import isValid
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Optional
+from weakref import WeakKeyDictionary, WeakSet, ref
+
+from .probes import probes
+
+if TYPE_CHECKING:
+    from .widgets import TitleBtns
+
+
+def frame_interval(widget: Optional[QWidget] = None) -> int:
+    """Gives the length of a display frame in milliseconds, based on the refresh rate of the screen `widget` is on (or of the primary screen)."""
+    screen = widget.screen() if widget is not None else QGuiApplication.primaryScreen()
+    refresh_rate = screen.refreshRate() if screen is not None else 0
+    return max(1, round(1000 / (refresh_rate or 60)))
+
+
+def connect_slot(sender: QObject, signal: str, receiver: QObject, slot: str):
+    """
+    Connects `signal` of `sender` to `slot` of `receiver`, both given by their C++ signatures (e.g. `"clicked()"` and `"close()"`).
+
+    Meant for Qt's own signals and slots on objects made per window: the connection stays on the C++ side, so no Python runs when the signal fires, and PySide keeps nothing for the sender after it is deleted (which it does for every object whose signals are connected with `signal.connect`).
+    """
+    QObject.connect(sender, SIGNAL(signal), receiver, SLOT(slot))
+
+
+class FrameCoalescer(QObject):
+    """
+    Throttles a stream of values (e.g. window positions from mouse events) so that `callback` runs at most once per display frame, always with the latest submitted value.
+
+    The first value after an idle frame is delivered immediately (no added latency); values submitted while a frame is still running are coalesced and only the last one is delivered when the frame ends.
+
+    :param callback: Called with the latest submitted value.
+    :type callback: Callable[[Any], None]
+
+    :param parent: The owner of the coalescer. If it is a widget, the refresh rate of its screen is used for the frame interval.
+    :type parent: Optional[QObject]
+    """
+
+    def __init__(
+        self, callback: Callable[[Any], None], parent: Optional[QObject] = None
+    ):
+        super().__init__(parent)
+        self.callback = callback
+        self.submitted = 0
+        self.delivered = 0
+        self._pending = None
+        self._has_pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._end_frame)
+
+    @property
+    def coalesced(self) -> int:
+        """The number of submitted values that were dropped in favour of a later one."""
+        return self.submitted - self.delivered - (1 if self._has_pending else 0)
+
+    def frame_interval(self) -> int:
+        """The length of a display frame in milliseconds, based on the screen's refresh rate."""
+        parent = self.parent()
+        return frame_interval(parent if isinstance(parent, QWidget) else None)
+
+    def submit(self, value: Any):
+        """Submits a new value. It is delivered now if the current frame is idle, otherwise at the end of the frame."""
+        self.submitted += 1
+        self._pending = value
+        self._has_pending = True
+        if not self._timer.isActive():
+            self._deliver()
+
+    def flush(self):
+        """Delivers the pending value (if any) immediately."""
+        self._timer.stop()
+        if self._has_pending:
+            self._deliver()
+            self._timer.stop()
+
+    def reset_counters(self):
+        """Resets the `submitted`/`delivered` counters."""
+        self.submitted = 1 if self._has_pending else 0
+        self.delivered = 0
+
+    def _end_frame(self):
+        if self._has_pending:
+            self._deliver()
+
+    def _deliver(self):
+        value = self._pending
+        self._pending = None
+        self._has_pending = False
+        self.delivered += 1
+        self._timer.start(self.frame_interval())
+        self.callback(value)
+
+
+class RootEventFilter(QObject):
+    """
+    The hub through which everything that reacts to a root window's events (window state changes, geometry and visibility for resizing and snapping, pending initialization) is notified, shared by all of them.
+
+    The window-level events (`WINDOW_SIGNALS`) are delivered from the signals of the root's native window (`windowHandle()`), which are only connected while there are handlers for them, so none of the root's events runs Python code just to be ignored. An actual event filter is only installed on the root while handlers for other event types are registered (e.g. the title bar waiting for its root's central widget or layout) and until the native window is created (when the root is first shown); it is removed again as soon as it isn't needed. The hub is a child of the root and is deleted once its last handler is removed.
+    """
+
+    OBJECT_NAME = "title-bar-root-event-filter"
+
+    # Event types delivered from the native window -> the names of its signals they come from.
+    WINDOW_SIGNALS = {
+        QEvent.Type.WindowStateChange: ("windowStateChanged",),
+        QEvent.Type.Move: ("xChanged", "yChanged"),
+        QEvent.Type.Resize: ("widthChanged", "heightChanged"),
+        QEvent.Type.Show: ("visibleChanged",),
+        QEvent.Type.Hide: ("visibleChanged",),
+    }
+
+    def __init__(self, root: QWidget):
+        super().__init__(root)
+        self.setObjectName(self.OBJECT_NAME)
+        self.root = root
+        self._handlers: dict[QEvent.Type, list[Callable[[QEvent], None]]] = {}
+        # Passed to the handlers of the events delivered from signals.
+        self._events: dict[QEvent.Type, QEvent] = {}
+        self._handle: Optional[QWindow] = None
+        self._connected: set[str] = set()
+        self._filtering = False
+        self._slots = {
+            "windowStateChanged": self._on_window_state_changed,
+            "xChanged": self._on_moved,
+            "yChanged": self._on_moved,
+            "widthChanged": self._on_resized,
+            "heightChanged": self._on_resized,
+            "visibleChanged": self._on_visible_changed,
+        }
+
+    @classmethod
+    def for_root(cls, root: QWidget) -> "RootEventFilter":
+        """Gives the hub of `root`, creating one if there is none yet."""
+        event_filter = root.findChild(
+            cls, cls.OBJECT_NAME, Qt.FindChildOption.FindDirectChildrenOnly
+        )
+        return event_filter if event_filter is not None else cls(root)
+
+    def add_handler(self, event_type: QEvent.Type, handler: Callable[[QEvent], None]):
+        """Calls `handler` with every event of `event_type` sent to the root (or, for the `WINDOW_SIGNALS` types, on the matching change of its native window)."""
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._update()
+
+    def remove_handler(
+        self, event_type: QEvent.Type, handler: Callable[[QEvent], None]
+    ):
+        """Stops calling `handler` for events of `event_type`. Once no handlers are left, the hub is removed from the root."""
+        handlers = self._handlers.get(event_type)
+        if handlers is not None and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event_type]
+        self._update()
+        if not self._handlers:
+            self._delete()
+
+    def _update(self):
+        """Connects the native window's signals that have handlers (and only those), and installs the event filter if it is needed."""
+        if self._handle is None and self.root.windowHandle() is not None:
+            self._attach(self.root.windowHandle())
+        if self._handle is not None:
+            needed = {
+                name
+                for event_type in self._handlers
+                for name in self.WINDOW_SIGNALS.get(event_type, ())
+            }
+            for name in needed - self._connected:
+                getattr(self._handle, name).connect(self._slots[name])
+            for name in self._connected - needed:
+                getattr(self._handle, name).disconnect(self._slots[name])
+            self._connected = needed
+
+        filtering = any(
+            event_type not in self.WINDOW_SIGNALS or self._handle is None
+            for event_type in self._handlers
+        )
+        if filtering != self._filtering:
+            if filtering:
+                self.root.installEventFilter(self)
+            else:
+                self.root.removeEventFilter(self)
+            self._filtering = filtering
+
+    def _attach(self, handle: QWindow):
+        self._handle = handle
+        self._connected = set()
+        handle.destroyed.connect(self._on_handle_destroyed)
+
+    def _torn_down(self) -> bool:
+        # While the root is being deleted, its Python side (and with it the hub's state) is gone before the hub itself, but the native window may still signal (e.g. `visibleChanged` as it is hidden) and the root still gets events.
+        return "_handlers" not in self.__dict__
+
+    # The slots are declared, so that Qt disconnects them once the hub is deleted (it is deleted before the native window when the root goes away).
+    @Slot()
+    def _on_handle_destroyed(self):
+        if self._torn_down():
+            return
+        self._handle = None
+        self._connected = set()
+        if isValid(self.root):
+            # The root's native window was destroyed without the root (e.g. it was made a child widget); catch the next one.
+            QTimer.singleShot(0, self, self._update)
+
+    def _delete(self):
+        if self._filtering:
+            self.root.removeEventFilter(self)
+            self._filtering = False
+        if self._handle is not None:
+            for name in self._connected:
+                getattr(self._handle, name).disconnect(self._slots[name])
+            self._handle.destroyed.disconnect(self._on_handle_destroyed)
+            self._handle = None
+        self._connected = set()
+        # So that `for_root` creates a new hub from now on.
+        self.setObjectName("")
+        self.setParent(None)
+        self.deleteLater()
+
+    def _dispatch(self, event_type: QEvent.Type):
+        if self._torn_down():
+            return
+        handlers = self._handlers.get(event_type)
+        if handlers is None:
+            return
+        event = self._events.get(event_type)
+        if event is None:
+            event = self._events[event_type] = QEvent(event_type)
+        for handler in tuple(handlers):
+            handler(event)
+
+    @Slot(Qt.WindowState)
+    def _on_window_state_changed(self, *_):
+        self._dispatch(QEvent.Type.WindowStateChange)
+
+    @Slot(int)
+    def _on_moved(self, *_):
+        self._dispatch(QEvent.Type.Move)
+
+    @Slot(int)
+    def _on_resized(self, *_):
+        self._dispatch(QEvent.Type.Resize)
+
+    @Slot(bool)
+    def _on_visible_changed(self, visible: bool):
+        self._dispatch(QEvent.Type.Show if visible else QEvent.Type.Hide)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if self._torn_down():
+            return False
+        event_type = event.type()
+        if event_type == QEvent.Type.WinIdChange and self._handle is None:
+            # The native window was just created: the window-level events come from its signals from now on.
+            self._update()
+        elif self._handle is None or event_type not in self.WINDOW_SIGNALS:
+            handlers = self._handlers.get(event_type)
+            if handlers is not None:
+                for handler in tuple(handlers):
+                    handler(event)
+        return False
+
+
+class FocusDispatcher(QObject):
+    """
+    Process-wide dispatcher of window activation changes to the `TitleBtns` that grey out their buttons when their window is inactive.
+
+    Instead of every title bar reacting to every `focusChanged` signal, the dispatcher listens once to `focusWindowChanged` and `applicationStateChanged`, works out which window lost and which gained activation, and only notifies the buttons of those windows.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._connected = False
+        # Held weakly, so that closed windows and their buttons drop out on their own.
+        self._listeners: WeakKeyDictionary[QWidget, WeakSet["TitleBtns"]] = WeakKeyDictionary()
+        self._active_window: Optional[ref[QWidget]] = None
+        # Windows registered while no window was active; their state is synced on the next change.
+        self._unsynced: WeakSet[QWidget] = WeakSet()
+
+    def register(self, window: QWidget, title_btns: "TitleBtns"):
+        """Starts notifying `title_btns` when `window` is activated or deactivated."""
+        if not self._connected:
+            app = QApplication.instance()
+            app.focusWindowChanged.connect(self._on_activation_changed)
+            app.applicationStateChanged.connect(self._on_activation_changed)
+            self._connected = True
+
+        listeners = self._listeners.get(window)
+        if listeners is None:
+            listeners = self._listeners[window] = WeakSet()
+        listeners.add(title_btns)
+        active_window = QApplication.activeWindow()
+        if active_window is None:
+            self._unsynced.add(window)
+        else:
+            title_btns.set_window_active(active_window is window)
+
+    def listener_count(self) -> int:
+        """Gives the number of registered `TitleBtns`."""
+        return sum(len(listeners) for listeners in self._listeners.values())
+
+    def _on_activation_changed(self, *_):
+        start = perf_counter_ns() if probes.enabled else 0
+        active_window = QApplication.activeWindow()
+        if (
+            QApplication.applicationState()
+            != Qt.ApplicationState.ApplicationActive
+        ):
+            active_window = None
+
+        if active_window is not None and self._unsynced:
+            for window in tuple(self._unsynced):
+                if window is not active_window:
+                    self._notify(window, False)
+            self._unsynced.clear()
+        previous_window = self._active_window() if self._active_window is not None else None
+        if active_window is not previous_window:
+            self._notify(previous_window, False)
+            self._notify(active_window, True)
+            self._active_window = ref(active_window) if active_window is not None else None
+        if start:
+            probes.record("_on_activation_changed", None, start)
+
+    def _notify(self, window: Optional[QWidget], active: bool):
+        listeners = self._listeners.get(window) if window is not None else None
+        if listeners is None:
+            return
+        for title_btns in tuple(listeners):
+            # Skips buttons that were deleted while their Python object is still referenced somewhere.
+            if isValid(title_btns):
+                title_btns.set_window_active(active)
+
+
+focus_dispatcher = FocusDispatcher()
@@ -0,0 +1,288 @@
+from PySide6.QtWidgets import QWidget
+from PySide6.QtCore import QEvent, QPoint, QRect
+from PySide6.QtGui import QGuiApplication, QScreen
+from bisect import bisect_left, bisect_right, insort
+from typing import Callable, Optional
+from weakref import ref
+
+from .events import RootEventFilter
+
+
+class ScreenEdgeIndex:
+    """
+    Process-wide index of the outer edges of all screens, used by `CustomTitleBar` to stick windows to the sides of whichever monitor they are on.
+
+    Edges shared by two adjacent screens are left out (a window moving from one monitor to its neighbour shouldn't stick in the middle of the desktop). Each remaining edge is kept in a list sorted by its coordinate, so the nearest edge is found with a binary search. The index is rebuilt lazily after `screenAdded`, `screenRemoved` or a screen's `geometryChanged`.
+    """
+
+    def __init__(self):
+        self._valid = False
+        self._connected = False
+        self._watched_screens: list[QScreen] = []
+        self.geometries: list[QRect] = []
+        # Sorted (edge, span start, span end) tuples plus their edge coordinates for bisecting.
+        self._left_edges: list[tuple[int, int, int]] = []
+        self._left_xs: list[int] = []
+        self._right_edges: list[tuple[int, int, int]] = []
+        self._right_xs: list[int] = []
+        self._top_edges: list[tuple[int, int, int]] = []
+        self._top_ys: list[int] = []
+        self._bottom_edges: list[tuple[int, int, int]] = []
+        self._bottom_ys: list[int] = []
+
+    def invalidate(self, *_):
+        """Marks the index as stale; it is rebuilt on the next lookup."""
+        self._valid = False
+
+    def screen_geometry_at(self, point: QPoint) -> QRect:
+        """Gives the geometry of the screen containing `point`, or of the primary screen if no screen contains it."""
+        screen = QGuiApplication.screenAt(point) or QGuiApplication.primaryScreen()
+        return screen.geometry()
+
+    def next_left_edge(self, x: int, top: int, bottom: int) -> Optional[int]:
+        """Gives the closest outer left screen edge at or to the right of `x` whose screen overlaps the vertical span `top`-`bottom`."""
+        self._ensure_built()
+        for i in range(bisect_left(self._left_xs, x), len(self._left_xs)):
+            edge, start, end = self._left_edges[i]
+            if start < bottom and top < end:
+                return edge
+        return None
+
+    def previous_right_edge(self, x: int, top: int, bottom: int) -> Optional[int]:
+        """Gives the closest outer right screen edge at or to the left of `x` whose screen overlaps the vertical span `top`-`bottom`."""
+        self._ensure_built()
+        for i in range(bisect_right(self._right_xs, x) - 1, -1, -1):
+            edge, start, end = self._right_edges[i]
+            if start < bottom and top < end:
+                return edge
+        return None
+
+    def next_top_edge(self, y: int, left: int, right: int) -> Optional[int]:
+        """Gives the closest outer top screen edge at or below `y` whose screen overlaps the horizontal span `left`-`right`."""
+        self._ensure_built()
+        for i in range(bisect_left(self._top_ys, y), len(self._top_ys)):
+            edge, start, end = self._top_edges[i]
+            if start < right and left < end:
+                return edge
+        return None
+
+    def previous_bottom_edge(self, y: int, left: int, right: int) -> Optional[int]:
+        """Gives the closest outer bottom screen edge at or above `y` whose screen overlaps the horizontal span `left`-`right`."""
+        self._ensure_built()
+        for i in range(bisect_right(self._bottom_ys, y) - 1, -1, -1):
+            edge, start, end = self._bottom_edges[i]
+            if start < right and left < end:
+                return edge
+        return None
+
+    def _ensure_built(self):
+        if self._valid:
+            return
+
+        app = QGuiApplication.instance()
+        if not self._connected:
+            app.screenAdded.connect(self._watch_screen)
+            app.screenRemoved.connect(self._unwatch_screen)
+            self._connected = True
+        for screen in app.screens():
+            if screen not in self._watched_screens:
+                self._watch_screen(screen)
+
+        self.geometries = [screen.geometry() for screen in app.screens()]
+        left_edges, right_edges, top_edges, bottom_edges = [], [], [], []
+        for geo in self.geometries:
+            others = [other for other in self.geometries if other is not geo]
+            x_span = (geo.left(), geo.right() + 1)
+            y_span = (geo.top(), geo.bottom() + 1)
+
+            if not any(
+                other.right() + 1 == geo.left() and _overlaps(other, y_span, False)
+                for other in others
+            ):
+                left_edges.append((geo.left(), *y_span))
+            if not any(
+                other.left() == geo.right() + 1 and _overlaps(other, y_span, False)
+                for other in others
+            ):
+                right_edges.append((geo.right(), *y_span))
+            if not any(
+                other.bottom() + 1 == geo.top() and _overlaps(other, x_span, True)
+                for other in others
+            ):
+                top_edges.append((geo.top(), *x_span))
+            if not any(
+                other.top() == geo.bottom() + 1 and _overlaps(other, x_span, True)
+                for other in others
+            ):
+                bottom_edges.append((geo.bottom(), *x_span))
+
+        self._left_edges = sorted(left_edges)
+        self._left_xs = [edge[0] for edge in self._left_edges]
+        self._right_edges = sorted(right_edges)
+        self._right_xs = [edge[0] for edge in self._right_edges]
+        self._top_edges = sorted(top_edges)
+        self._top_ys = [edge[0] for edge in self._top_edges]
+        self._bottom_edges = sorted(bottom_edges)
+        self._bottom_ys = [edge[0] for edge in self._bottom_edges]
+        self._valid = True
+
+    def _watch_screen(self, screen: QScreen):
+        self._watched_screens.append(screen)
+        screen.geometryChanged.connect(self.invalidate)
+        self.invalidate()
+
+    def _unwatch_screen(self, screen: QScreen):
+        if screen in self._watched_screens:
+            self._watched_screens.remove(screen)
+        self.invalidate()
+
+
+class WindowEdgeIndex:
+    """
+    Process-wide spatial index of the visible top-level windows that use `stick_to_windows`, used to magnetically stick a dragged window to the edges of the others.
+
+    The left, right, top and bottom edges of every window are kept in lists sorted by coordinate, so the edges within the stick threshold of a dragged window are found with a binary search instead of a scan over every window. The lists are updated from each registered window's `RootEventFilter` (move, resize, show and hide). Windows are held weakly, and their entries are dropped when they are destroyed.
+    """
+
+    _TRACKED_EVENTS = (
+        QEvent.Type.Move,
+        QEvent.Type.Resize,
+        QEvent.Type.Show,
+        QEvent.Type.Hide,
+    )
+
+    def __init__(self):
+        self._handlers: dict[int, Callable[[QEvent], None]] = {}
+        self._windows: dict[int, ref[QWidget]] = {}
+        self._rects: dict[int, QRect] = {}
+        # Sorted (edge, window key) tuples. Right and bottom edges are exclusive.
+        self._lefts: list[tuple[int, int]] = []
+        self._rights: list[tuple[int, int]] = []
+        self._tops: list[tuple[int, int]] = []
+        self._bottoms: list[tuple[int, int]] = []
+
+    def add_window(self, window: QWidget):
+        """Starts tracking `window`, both as a window that can be snapped to and as a window that can snap."""
+        key = id(window)
+        if key in self._windows:
+            return
+        window_ref = self._windows[key] = ref(
+            window, lambda _, key=key: self._forget(key)
+        )
+
+        def on_window_event(event: QEvent):
+            # Not captured directly: the handler lives in a child of the window, so it would keep the window alive.
+            window = window_ref()
+            if window is None:
+                return
+            if event.type() == QEvent.Type.Hide:
+                self._unindex(key)
+            elif window.isVisible():
+                self._index(key, window.frameGeometry())
+
+        self._handlers[key] = on_window_event
+        event_filter = RootEventFilter.for_root(window)
+        for event_type in self._TRACKED_EVENTS:
+            event_filter.add_handler(event_type, on_window_event)
+        window.destroyed.connect(lambda *_, key=key: self._forget(key))
+        if window.isVisible():
+            self._index(key, window.frameGeometry())
+
+    def remove_window(self, window: QWidget):
+        """Stops tracking `window`."""
+        key = id(window)
+        if key in self._windows:
+            event_filter = RootEventFilter.for_root(window)
+            for event_type in self._TRACKED_EVENTS:
+                event_filter.remove_handler(event_type, self._handlers[key])
+            self._forget(key)
+
+    def snap(
+        self, window: QWidget, x: int, y: int, threshold: int
+    ) -> tuple[int, int]:
+        """
+        Gives the position `window` should be moved to instead of `(x, y)`, stuck to the closest edge of another indexed window within `threshold` pixels (horizontally and vertically independently).
+        """
+        key = id(window)
+        width = window.width()
+        height = window.height()
+
+        dx = self._closest_offset(
+            key, (x, x + width), (y, y + height), threshold, horizontal=True
+        )
+        dy = self._closest_offset(
+            key, (y, y + height), (x + dx, x + dx + width), threshold, horizontal=False
+        )
+        return x + dx, y + dy
+
+    def _closest_offset(
+        self,
+        key: int,
+        span: tuple[int, int],
+        cross_span: tuple[int, int],
+        threshold: int,
+        horizontal: bool,
+    ) -> int:
+        """Gives the smallest offset that lines up one end of `span` with a nearby edge of another window overlapping `cross_span` (give or take `threshold`), or `0`."""
+        edge_lists = (
+            (self._lefts, self._rights) if horizontal else (self._tops, self._bottoms)
+        )
+        best = None
+        for own_edge in span:
+            for edges in edge_lists:
+                i = bisect_left(edges, (own_edge - threshold,))
+                while i < len(edges) and edges[i][0] <= own_edge + threshold:
+                    edge, other_key = edges[i]
+                    i += 1
+                    if other_key == key:
+                        continue
+                    other = self._rects[other_key]
+                    if horizontal:
+                        other_start, other_end = other.top(), other.bottom() + 1
+                    else:
+                        other_start, other_end = other.left(), other.right() + 1
+                    if not (
+                        other_start - threshold < cross_span[1]
+                        and cross_span[0] < other_end + threshold
+                    ):
+                        continue
+                    offset = edge - own_edge
+                    if best is None or abs(offset) < abs(best):
+                        best = offset
+        return 0 if best is None else best
+
+    def _index(self, key: int, rect: QRect):
+        self._unindex(key)
+        self._rects[key] = rect
+        insort(self._lefts, (rect.left(), key))
+        insort(self._rights, (rect.right() + 1, key))
+        insort(self._tops, (rect.top(), key))
+        insort(self._bottoms, (rect.bottom() + 1, key))
+
+    def _unindex(self, key: int):
+        rect = self._rects.pop(key, None)
+        if rect is None:
+            return
+        for edges, edge in (
+            (self._lefts, rect.left()),
+            (self._rights, rect.right() + 1),
+            (self._tops, rect.top()),
+            (self._bottoms, rect.bottom() + 1),
+        ):
+            del edges[bisect_left(edges, (edge, key))]
+
+    def _forget(self, key: int):
+        self._unindex(key)
+        self._windows.pop(key, None)
+        self._handlers.pop(key, None)
+
+
+def _overlaps(geo: QRect, span: tuple[int, int], horizontal: bool) -> bool:
+    """Whether `geo` overlaps `span` along the horizontal (`True`) or vertical (`False`) axis."""
+    if horizontal:
+        return geo.left() < span[1] and span[0] < geo.right() + 1
+    return geo.top() < span[1] and span[0] < geo.bottom() + 1
+
+
+screen_edge_index = ScreenEdgeIndex()
+window_edge_index = WindowEdgeIndex()
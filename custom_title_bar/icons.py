@@ -0,0 +1,114 @@
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QCursor, QIcon, QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+
+class IconCache:
+    """
+    Process-wide, bounded LRU cache for the pixmaps and icons used by `TitleBtns`.
+
+    Entries are keyed by `(path or standard pixmap, btn_size, device pixel ratio, style)`, so every title bar after the first one with the same configuration gets its icons without touching the disk. `QPixmap` and `QIcon` are implicitly shared, so handing the same cached object to many buttons is cheap.
+
+    :param max_size: The maximum number of entries kept before the least recently used one is evicted. Defaults to `128`.
+    :type max_size: Optional[int]
+    """
+
+    def __init__(self, max_size: Optional[int] = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, QPixmap | QIcon] = OrderedDict()
+
+    def get(
+        self, key: Hashable, factory: Callable[[], QPixmap | QIcon]
+    ) -> QPixmap | QIcon:
+        """
+        Returns the entry for `key`, calling `factory` to build (and store) it on a miss.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = factory()
+        self._entries[key] = entry
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return entry
+
+    def clear(self):
+        """Drops every entry and resets the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        """Gives the current size, capacity and hit/miss counters of the cache."""
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def rasterize_icon(
+    path: str, btn_size: tuple[int, int], device_pixel_ratio: float
+) -> QPixmap:
+    """
+    Renders the image at `path` once, at exactly `btn_size` times `device_pixel_ratio` device pixels, so that `QToolButton` never has to rescale it while painting.
+
+    SVG files are rendered directly at the target resolution (crisp on HiDPI screens); other image formats are smoothly scaled once.
+
+    :param path: Path to the image file.
+    :type path: str
+
+    :param btn_size: The width and height in (device independent) pixels of the button.
+    :type btn_size: tuple(int, int)
+
+    :param device_pixel_ratio: The device pixel ratio of the screen the button is shown on.
+    :type device_pixel_ratio: float
+    """
+    width = round(btn_size[0] * device_pixel_ratio)
+    height = round(btn_size[1] * device_pixel_ratio)
+
+    if path.lower().endswith(".svg"):
+        pixmap = QPixmap(width, height)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        renderer = QSvgRenderer(path)
+        renderer.setAspectRatioMode(Qt.AspectRatioMode.KeepAspectRatio)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        renderer.render(painter)
+        painter.end()
+    else:
+        pixmap = QPixmap(path).scaled(
+            width,
+            height,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    return pixmap
+
+
+def shape_cursor(shape: Qt.CursorShape) -> QCursor:
+    """
+    Gives the shared `QCursor` of `shape`, to pass to `setCursor` in its place: given a shape, PySide builds a new `QCursor` for every call and never frees it.
+    """
+    cursor = _cursors.get(shape)
+    if cursor is None:
+        cursor = _cursors[shape] = QCursor(shape)
+    return cursor
+
+
+icon_cache = IconCache()
+_cursors: dict[Qt.CursorShape, QCursor] = {}
@@ -0,0 +1,162 @@
+import os
+import threading
+from collections import deque
+from typing import Any, Optional
+from weakref import WeakKeyDictionary
+
+from .probes import probes
+
+
+class _Counter:
+    __slots__ = ("count", "total_ns", "max_ns")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def add(self, duration_ns: int, count: int):
+        self.count += count
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def snapshot(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "max_us": self.max_ns / 1e3,
+        }
+
+
+class Instrumentation:
+    """
+    Opt-in counters and timings of the title bar's hot paths, process-wide and per window, with an optional Chrome trace of every probed call. The title bars all report to the shared instance, `custom_title_bar.instrumentation.instrumentation`.
+
+    The probed calls are `mouseMoveEvent`, `_check_stick`, `move` (of the dragged window or its ghost), `setIcon` (from the `TitleBtns._set_*_icons` methods), `setStyleSheet` (from `TitleBarTheme`) and the focus callbacks (`FocusDispatcher._on_activation_changed` and `TitleBtns.set_window_active`). They report through `probes.probes`, which this turns on; while disabled (the default), a probe only costs reading `probes.enabled`.
+
+    Per-window counters are keyed by the title bar's top-level window (see `CustomTitleBar.stats`) and dropped along with it. `setStyleSheet` calls made before the window is shown (while the title bar is being built) only count process-wide.
+    """
+
+    def __init__(self):
+        self._counters: dict[str, _Counter] = {}
+        self._window_counters: WeakKeyDictionary[Any, dict[str, _Counter]] = WeakKeyDictionary()
+        # Set while tracing: (name, window id, start, duration, count).
+        self._trace: Optional[deque[tuple[str, int, int, int, int]]] = None
+        # Windows -> the "thread" (row) they get in the trace, and its label.
+        self._window_ids: WeakKeyDictionary[Any, int] = WeakKeyDictionary()
+        self._window_labels: dict[int, str] = {}
+        self._next_window_id = 1
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the probed calls are being counted."""
+        return probes.enabled
+
+    def enable(self, trace: Optional[bool] = False, max_trace_events: Optional[int] = 1_000_000):
+        """
+        Starts counting (and timing) the probed calls.
+
+        :param trace: Whether to also record every call for `chrome_trace`/`write_chrome_trace`. Defaults to `False`.
+        :type trace: Optional[bool]
+
+        :param max_trace_events: The number of calls the trace keeps; older ones are dropped. Defaults to `1_000_000`.
+        :type max_trace_events: Optional[int]
+        """
+        if trace and (self._trace is None or self._trace.maxlen != max_trace_events):
+            self._trace = deque(self._trace or (), maxlen=max_trace_events)
+        elif not trace:
+            self._trace = None
+        probes.recorder = self._record
+        probes.enabled = True
+
+    def disable(self):
+        """Stops counting. The counters and the trace are kept until `reset`."""
+        probes.enabled = False
+
+    def reset(self):
+        """Clears the counters and the trace."""
+        self._counters.clear()
+        self._window_counters.clear()
+        self._window_ids.clear()
+        self._window_labels.clear()
+        if self._trace is not None:
+            self._trace.clear()
+
+    def _record(self, name: str, window: Any, start_ns: int, duration_ns: int, count: int):
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._counters[name] = _Counter()
+        counter.add(duration_ns, count)
+        if window is not None:
+            counters = self._window_counters.get(window)
+            if counters is None:
+                counters = self._window_counters[window] = {}
+            counter = counters.get(name)
+            if counter is None:
+                counter = counters[name] = _Counter()
+            counter.add(duration_ns, count)
+        if self._trace is not None:
+            self._trace.append((name, self._window_id(window), start_ns, duration_ns, count))
+
+    def stats(self, window: Optional[Any] = None) -> dict[str, dict]:
+        """
+        Gives a snapshot of the counters: for each probed call, its `count`, `total_ms`, `mean_us` (per recorded call) and `max_us`.
+
+        :param window: The top-level window to give the counters of. Defaults to `None` (the process-wide counters).
+        :type window: Optional[QWidget]
+        """
+        if window is None:
+            counters = self._counters
+        else:
+            counters = self._window_counters.get(window, {})
+        return {name: counter.snapshot() for name, counter in sorted(counters.items())}
+
+    def chrome_trace(self) -> dict:
+        """Gives the recorded calls in the Chrome trace event format (a "complete" event per call, one row per window), as loaded by `chrome://tracing` or Perfetto."""
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": window_id, "args": {"name": label}}
+            for window_id, label in self._window_labels.items()
+        ]
+        for name, window_id, start_ns, duration_ns, count in self._trace or ():
+            event = {
+                "name": name,
+                "cat": "custom_title_bar",
+                "ph": "X",
+                "ts": start_ns / 1e3,
+                "dur": duration_ns / 1e3,
+                "pid": pid,
+                "tid": window_id,
+            }
+            if count != 1:
+                event["args"] = {"count": count}
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str):
+        """Writes `chrome_trace` to the JSON file at `path`."""
+        import json
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file)
+
+    def _window_id(self, window: Any) -> int:
+        if window is None:
+            # Calls not tied to a window share the row of the (GUI) thread.
+            if 0 not in self._window_labels:
+                self._window_labels[0] = f"process ({threading.current_thread().name})"
+            return 0
+        window_id = self._window_ids.get(window)
+        if window_id is None:
+            window_id = self._window_ids[window] = self._next_window_id
+            self._next_window_id += 1
+            title = window.windowTitle() if hasattr(window, "windowTitle") else ""
+            self._window_labels[window_id] = f"{type(window).__name__} {window_id}" + (f": {title}" if title else "")
+        return window_id
+
+
+# Shared by every title bar.
+instrumentation = Instrumentation()
+
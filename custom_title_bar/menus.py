@@ -0,0 +1,318 @@
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QFrame,
+    QHBoxLayout,
+    QListView,
+    QMenu,
+    QScrollBar,
+    QWidget,
+    QWidgetAction,
+)
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSize,
+    Signal,
+)
+from PySide6.QtGui import QKeyEvent, QWheelEvent
+from collections.abc import Sequence
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+
+class LazyEntryModel(QAbstractListModel):
+    """
+    A list model showing a window of `window_size` consecutive entries of a `LazyMenu`, starting at `offset`.
+
+    Only the rows of the window exist for Qt, so laying out and painting the view costs the same however many entries there are; scrolling moves the window (see `set_offset`) instead of the view. A sequence (e.g. a list) is used as it is, without copying it. Any other iterable (e.g. a generator) is pulled in batches of `batch_size` entries as the window reaches the end of the entries pulled so far (see `fetch_more`), so entries that are never scrolled to are never produced.
+
+    :param text: Gives the text shown for an entry.
+    :type text: Callable[[Any], str]
+
+    :param window_size: The number of rows shown at once.
+    :type window_size: int
+
+    :param batch_size: The number of entries pulled from an iterable at a time (at least `window_size`).
+    :type batch_size: int
+
+    :param parent: The owner of the model. Defaults to `None`.
+    :type parent: Optional[QObject]
+    """
+
+    def __init__(
+        self,
+        text: Callable[[Any], str],
+        window_size: int,
+        batch_size: int,
+        parent=None,
+    ):
+        super().__init__(parent)
+        self.text = text
+        self.window_size = window_size
+        self.batch_size = max(batch_size, window_size)
+        self.offset = 0
+        self._entries: Sequence = ()
+        # Set while entries are left to pull from an iterable.
+        self._iterator: Optional[Iterator] = None
+
+    def set_entries(self, entries: Iterable):
+        """Replaces the entries of the model and moves the window back to the first entry."""
+        self.beginResetModel()
+        self.offset = 0
+        if isinstance(entries, Sequence):
+            self._entries = entries
+            self._iterator = None
+        else:
+            self._entries = []
+            self._iterator = iter(entries)
+            self._pull()
+        self.endResetModel()
+
+    def entry_count(self) -> int:
+        """Gives the number of entries (pulled so far, for an iterable)."""
+        return len(self._entries)
+
+    def entry(self, row: int) -> Any:
+        """Gives the entry shown in `row` of the window."""
+        return self._entries[self.offset + row]
+
+    def can_fetch_more(self) -> bool:
+        """Whether entries are left to pull from the iterable."""
+        return self._iterator is not None
+
+    def fetch_more(self):
+        """Pulls the next batch of entries from the iterable."""
+        if self._iterator is None:
+            return
+        rows = self.rowCount()
+        self._pull()
+        if self.rowCount() != rows:
+            self.beginResetModel()
+            self.endResetModel()
+
+    def set_offset(self, offset: int):
+        """Moves the window to start at the entry `offset`."""
+        offset = max(0, min(offset, len(self._entries) - self.window_size))
+        if offset == self.offset:
+            return
+        rows = self.rowCount()
+        self.offset = offset
+        if self.rowCount() != rows:
+            self.beginResetModel()
+            self.endResetModel()
+        elif rows:
+            self.dataChanged.emit(self.index(0), self.index(rows - 1))
+
+    def _pull(self):
+        batch = list(islice(self._iterator, self.batch_size))
+        if len(batch) < self.batch_size:
+            self._iterator = None
+        self._entries.extend(batch)
+
+    def rowCount(self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return max(0, min(self.window_size, len(self._entries) - self.offset))
+
+    def data(self, index: Union[QModelIndex, QPersistentModelIndex], role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return self.text(self._entries[self.offset + index.row()])
+        return None
+
+
+class _EntryListView(QListView):
+    """The list of a `LazyMenu`. Scrolling (with the wheel or by moving past the first or last row with the keys) is handed to the menu's scroll bar, which moves the model's window."""
+
+    def __init__(self, scroll_bar: QScrollBar):
+        super().__init__()
+        self.scroll_bar = scroll_bar
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        QApplication.sendEvent(self.scroll_bar, event)
+
+    def keyPressEvent(self, event: QKeyEvent) -> None:
+        row = self.currentIndex().row()
+        last_row = self.model().rowCount() - 1
+        key = event.key()
+        scroll_bar = self.scroll_bar
+        if key == Qt.Key.Key_Down and row == last_row:
+            scroll_bar.triggerAction(QScrollBar.SliderAction.SliderSingleStepAdd)
+        elif key == Qt.Key.Key_Up and row == 0:
+            scroll_bar.triggerAction(QScrollBar.SliderAction.SliderSingleStepSub)
+        elif key == Qt.Key.Key_PageDown:
+            scroll_bar.triggerAction(QScrollBar.SliderAction.SliderPageStepAdd)
+        elif key == Qt.Key.Key_PageUp:
+            scroll_bar.triggerAction(QScrollBar.SliderAction.SliderPageStepSub)
+        elif key == Qt.Key.Key_Home:
+            scroll_bar.triggerAction(QScrollBar.SliderAction.SliderToMinimum)
+            self.setCurrentIndex(self.model().index(0))
+        elif key == Qt.Key.Key_End:
+            scroll_bar.triggerAction(QScrollBar.SliderAction.SliderToMaximum)
+            self.setCurrentIndex(self.model().index(self.model().rowCount() - 1))
+        else:
+            super().keyPressEvent(event)
+            return
+        event.accept()
+
+
+class LazyMenu(QMenu):
+    """
+    A menu for very long lists of entries (e.g. recent files), which are only pulled from `provider` when the menu is about to be shown and are shown as a scrolling window of `visible_rows` rows.
+
+    The entries are cached until `invalidate` is called, so reopening the menu costs nothing, and a change of the list only costs calling the provider again the next time the menu is opened. No `QAction` is created per entry: the entries are shown in a `QListView` (in a single `QWidgetAction`) whose model only holds the visible rows (see `LazyEntryModel`), and scrolling moves that window over the entries. If `provider` returns a sequence, it is used without being copied, and other iterables (e.g. generators) are only consumed as the list is scrolled, so opening a menu of 10,000 entries costs as much as opening one of `visible_rows` entries.
+
+    Choosing an entry (with the mouse, or with the arrow keys and Enter) closes the menu and emits `entry_triggered` with the entry. Regular actions can still be added to the menu; they are shown below the entries.
+
+    :param title: The title of the menu.
+    :type title: str
+
+    :param provider: Called with no arguments to get the entries, each time the menu is about to be shown after `invalidate` (and the first time).
+    :type provider: Callable[[], Iterable]
+
+    :param text: Gives the text shown for an entry. Defaults to `str`.
+    :type text: Optional[Callable[[Any], str]]
+
+    :param visible_rows: The maximum number of entries shown at once; the others are scrolled to. Defaults to `20`.
+    :type visible_rows: Optional[int]
+
+    :param batch_size: The number of entries pulled at a time when `provider` returns an iterable that isn't a sequence. Defaults to `100`.
+    :type batch_size: Optional[int]
+
+    :param empty_text: The (disabled) entry shown when there are no entries. Defaults to `"Empty"`.
+    :type empty_text: Optional[str]
+
+    :param parent: The parent of the menu. Defaults to `None`.
+    :type parent: Optional[QWidget]
+    """
+
+    # Emitted with the entry the user chose.
+    entry_triggered = Signal(object)
+
+    # Width (in pixels) the entry list can take at most; longer entries are elided in the middle (so both the start and the end of e.g. a path stay visible).
+    MAXIMUM_WIDTH = 600
+
+    def __init__(
+        self,
+        title: str,
+        provider: Callable[[], Iterable],
+        text: Optional[Callable[[Any], str]] = str,
+        visible_rows: Optional[int] = 20,
+        batch_size: Optional[int] = 100,
+        empty_text: Optional[str] = "Empty",
+        parent=None,
+    ):
+        super().__init__(title, parent)
+        self.provider = provider
+        self.visible_rows = visible_rows
+        self._stale = True
+
+        self.model = LazyEntryModel(text, visible_rows, batch_size, parent=self)
+        self.scroll_bar = QScrollBar(Qt.Orientation.Vertical)
+        self.scroll_bar.setPageStep(visible_rows)
+        self.scroll_bar.valueChanged.connect(self._scroll_to)
+
+        view = self.view = _EntryListView(self.scroll_bar)
+        view.setModel(self.model)
+        view.setUniformItemSizes(True)
+        view.setFrameShape(QFrame.Shape.NoFrame)
+        view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        view.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        view.setTextElideMode(Qt.TextElideMode.ElideMiddle)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        # The menu's background shows through, so the entries look like the menu's other items.
+        view.viewport().setAutoFillBackground(False)
+        view.setStyleSheet("QListView { background: transparent; }")
+        # Rows are highlighted on hover, like menu items.
+        view.setMouseTracking(True)
+        view.entered.connect(view.setCurrentIndex)
+        view.clicked.connect(self._trigger)
+        view.activated.connect(self._trigger)
+
+        container = QWidget()
+        layout = QHBoxLayout(container)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(view)
+        layout.addWidget(self.scroll_bar)
+
+        self._list_action = QWidgetAction(self)
+        self._list_action.setDefaultWidget(container)
+        self.addAction(self._list_action)
+        self._empty_action = self.addAction(empty_text)
+        self._empty_action.setEnabled(False)
+
+        self.aboutToShow.connect(self._populate)
+
+    def invalidate(self):
+        """Marks the entries as changed: `provider` is called again the next time the menu is shown (or right away if the menu is open)."""
+        self._stale = True
+        if self.isVisible():
+            self._populate()
+
+    def entry_count(self) -> int:
+        """Gives the number of entries pulled from the provider so far."""
+        return self.model.entry_count()
+
+    def _populate(self):
+        if not self._stale:
+            # Opened again: start from the first entry, like a regular menu.
+            self.scroll_bar.setValue(0)
+            self.view.setCurrentIndex(QModelIndex())
+            return
+        self._stale = False
+        self.model.set_entries(self.provider())
+        self._update_scroll_range()
+        self.scroll_bar.setValue(0)
+        self._update_list_size()
+
+    def _update_scroll_range(self):
+        model = self.model
+        self.scroll_bar.setMaximum(max(0, model.entry_count() - model.window_size))
+        self.scroll_bar.setVisible(
+            self.scroll_bar.maximum() > 0 or model.can_fetch_more()
+        )
+
+    def _scroll_to(self, offset: int):
+        model = self.model
+        if offset == self.scroll_bar.maximum() and model.can_fetch_more():
+            model.fetch_more()
+            self._update_scroll_range()
+        model.set_offset(offset)
+
+    def _update_list_size(self):
+        view = self.view
+        rows = self.model.rowCount()
+        self._list_action.setVisible(rows > 0)
+        self._empty_action.setVisible(rows == 0)
+        if rows == 0:
+            return
+        # With uniform row heights, the first row gives the height of all of them.
+        row_height = view.sizeHintForRow(0)
+        width = max(view.sizeHintForIndex(self.model.index(row)).width() for row in range(rows))
+        view.setFixedSize(QSize(min(width, self.MAXIMUM_WIDTH), rows * row_height))
+        view.setCurrentIndex(QModelIndex())
+        if self.isVisible():
+            self.adjustSize()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._list_action.isVisible():
+            # For the arrow keys and Enter; the keys the list doesn't use (e.g. Escape) still reach the menu.
+            self.view.setFocus(Qt.FocusReason.PopupFocusReason)
+
+    def _trigger(self, index: QModelIndex):
+        if not self.isVisible() or not index.isValid():
+            # Already triggered by the other one of `clicked` and `activated`.
+            return
+        entry = self.model.entry(index.row())
+        # Close the whole menu chain (e.g. parent menus), like choosing a regular action does.
+        self.hide()
+        popup = QApplication.activePopupWidget()
+        while isinstance(popup, QMenu):
+            popup.hide()
+            popup = QApplication.activePopupWidget()
+        self.entry_triggered.emit(entry)
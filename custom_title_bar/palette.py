@@ -0,0 +1,402 @@
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QFrame,
+    QLineEdit,
+    QListView,
+    QMenu,
+    QVBoxLayout,
+    QWidget,
+    QWidgetAction,
+)
+from PySide6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    QPoint,
+)
+from PySide6.QtGui import QAction, QActionEvent, QKeyEvent, QKeySequence
+from heapq import nsmallest
+from itertools import islice
+from typing import Any, Optional, Union
+from weakref import ref
+
+# Separates the menus of an action's path, e.g. "File › Recent".
+PATH_SEPARATOR = " › "
+
+
+def strip_mnemonics(text: str) -> str:
+    """Gives an action's or menu's text without its mnemonics (`&`) and tab-separated shortcut."""
+    text = text.split("\t", 1)[0]
+    if "&" in text:
+        text = text.replace("&&", "\0").replace("&", "").replace("\0", "&")
+    return text
+
+
+def normalize(text: str) -> str:
+    """Gives the searchable form of an action's text: without mnemonics, lowercased and with its whitespace collapsed."""
+    return " ".join(strip_mnemonics(text).casefold().split())
+
+
+def trigrams(text: str) -> set[str]:
+    """Gives the three-character substrings of `text`."""
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class _Entry:
+    __slots__ = ("id", "action", "key", "menus", "available")
+
+    def __init__(self, id: int, action: QAction, key: str, menu: QWidget):
+        # Stands for the action in the index's sets (ints hash much faster than Qt objects).
+        self.id = id
+        self.action = action
+        self.key = key
+        # The watched menus the action is in; the first one gives its path.
+        self.menus = [menu]
+        self.available = action.isEnabled() and action.isVisible()
+
+
+class ActionIndex(QObject):
+    """
+    A search index over the actions reachable from a menu bar (through its menus and their submenus), for the `CommandPalette`.
+
+    Each action's text is indexed by the prefixes (of one and two characters) of its words and by its trigrams. A query word of one or two characters is looked up in the prefix index, and a longer one by intersecting the sets of its trigrams (then checked to be a substring), so a search only looks at the actions sharing the query's prefixes or trigrams instead of matching every action.
+
+    The index is kept up to date incrementally: it is an event filter of the menu bar and of every menu it reaches, and indexes, reindexes or removes an action on the `ActionAdded`, `ActionChanged` and `ActionRemoved` events, instead of walking the menus again. A menu that is destroyed is unwatched, so its actions are dropped with it.
+
+    :param menu_bar: The menu bar whose actions are indexed.
+    :type menu_bar: QWidget
+
+    :param parent: The owner of the index. Defaults to `None`.
+    :type parent: Optional[QObject]
+    """
+
+    def __init__(self, menu_bar: Optional[QWidget] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._entries: dict[QAction, _Entry] = {}
+        self._entries_by_id: dict[int, _Entry] = {}
+        self._next_id = 0
+        self._prefixes: dict[str, set[int]] = {}
+        self._trigrams: dict[str, set[int]] = {}
+        # Watched menus (and menu bars) -> the actions indexed from them (as an ordered set).
+        self._menu_actions: dict[QWidget, dict[QAction, None]] = {}
+        # Menu actions -> the (watched) menus they open.
+        self._submenus: dict[QAction, QMenu] = {}
+        # Watched menus -> the menu they were reached from (None for a menu bar).
+        self._parent_menus: dict[QWidget, Optional[QWidget]] = {}
+        self._handlers = {
+            QEvent.Type.ActionAdded: self._on_action_added,
+            QEvent.Type.ActionChanged: self._on_action_changed,
+            QEvent.Type.ActionRemoved: self._on_action_removed,
+        }
+        if menu_bar is not None:
+            self.watch(menu_bar)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def watch(self, menu: QWidget, parent_menu: Optional[QWidget] = None):
+        """Indexes the actions of `menu` (a menu bar or a menu) and of its submenus, and keeps them indexed as they change."""
+        if menu in self._menu_actions:
+            return
+        self._menu_actions[menu] = {}
+        self._parent_menus[menu] = parent_menu
+        menu.installEventFilter(self)
+        # Weak, so that the connection (which lasts as long as the menu) keeps neither the menu nor the index alive.
+        index_ref, menu_ref = ref(self), ref(menu)
+
+        def unwatch_destroyed(*_):
+            index, menu = index_ref(), menu_ref()
+            if index is not None and menu is not None:
+                index.unwatch(menu)
+
+        menu.destroyed.connect(unwatch_destroyed)
+        for action in menu.actions():
+            self._add(action, menu)
+
+    def unwatch(self, menu: QWidget):
+        """Removes the actions of `menu` and of its submenus from the index."""
+        actions = self._menu_actions.pop(menu, None)
+        if actions is None:
+            return
+        del self._parent_menus[menu]
+        try:
+            menu.removeEventFilter(self)
+        except RuntimeError:
+            # The menu is being deleted.
+            pass
+        for action in list(actions):
+            self._discard(action, menu)
+
+    def search(self, query: str, limit: Optional[int] = 50) -> list[QAction]:
+        """
+        Gives the enabled, visible actions matching `query`, best match first. Every word of the query must be found in an action's text: a word of one or two characters at the start of one of its words, a longer one anywhere.
+
+        The actions whose text starts with the query come first, then those where every query word starts a word, then the others; shorter texts first within each group. An empty query gives every action, in the order they were indexed (the order of the menus).
+
+        :param query: The text typed by the user.
+        :type query: str
+
+        :param limit: The maximum number of actions to give. Defaults to `50`.
+        :type limit: Optional[int]
+
+        :return: The matching actions.
+        :rtype: list[QAction]
+        """
+        query = normalize(query)
+        words = query.split()
+        if not words:
+            available = (entry.action for entry in self._entries.values() if entry.available)
+            return list(islice(available, limit))
+
+        postings = []
+        for word in words:
+            if len(word) < 3:
+                postings.append(self._prefixes.get(word, ()))
+            else:
+                postings.extend(self._trigrams.get(trigram, ()) for trigram in trigrams(word))
+        postings.sort(key=len)
+        if not postings[0]:
+            return []
+        candidates = set(postings[0]).intersection(*postings[1:])
+
+        long_words = [word for word in words if len(word) >= 3]
+        entries = self._entries_by_id
+        matches = []
+        for entry_id in candidates:
+            entry = entries[entry_id]
+            if entry.available and all(word in entry.key for word in long_words):
+                matches.append(entry)
+
+        def rank(entry: _Entry):
+            key = entry.key
+            if key.startswith(query):
+                group = 0
+            elif all(key.startswith(word) or f" {word}" in key for word in words):
+                group = 1
+            else:
+                group = 2
+            return group, len(key), key
+
+        return [entry.action for entry in nsmallest(limit, matches, key=rank)]
+
+    def path(self, action: QAction) -> str:
+        """Gives the titles of the menus leading to `action`, e.g. `"File › Recent"`."""
+        entry = self._entries.get(action)
+        titles = []
+        menu = entry.menus[0] if entry is not None else None
+        while isinstance(menu, QMenu):
+            titles.append(strip_mnemonics(menu.title()))
+            menu = self._parent_menus.get(menu)
+        return PATH_SEPARATOR.join(reversed(titles))
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        handler = self._handlers.get(event.type())
+        if handler is not None:
+            handler(watched, event)
+        return False
+
+    def _on_action_added(self, menu: QWidget, event: QActionEvent):
+        self._add(event.action(), menu)
+
+    def _on_action_removed(self, menu: QWidget, event: QActionEvent):
+        action = event.action()
+        actions = self._menu_actions.get(menu)
+        if actions is not None and action in actions:
+            del actions[action]
+            self._discard(action, menu)
+
+    def _on_action_changed(self, _menu: QWidget, event: QActionEvent):
+        action = event.action()
+        entry = self._entries.get(action)
+        if entry is None:
+            return
+        entry.available = action.isEnabled() and action.isVisible()
+        key = normalize(action.text())
+        if key != entry.key:
+            self._unindex(entry.id, entry.key)
+            entry.key = key
+            self._index(entry.id, key)
+
+    def _add(self, action: QAction, menu: QWidget):
+        submenu = action.menu()
+        if submenu is not None:
+            self._menu_actions[menu][action] = None
+            self._submenus[action] = submenu
+            self.watch(submenu, parent_menu=menu)
+            return
+        if action.isSeparator() or isinstance(action, QWidgetAction):
+            return
+        self._menu_actions[menu][action] = None
+        entry = self._entries.get(action)
+        if entry is not None:
+            # Already indexed from another menu.
+            entry.menus.append(menu)
+            return
+        entry = _Entry(self._next_id, action, normalize(action.text()), menu)
+        self._next_id += 1
+        self._entries[action] = entry
+        self._entries_by_id[entry.id] = entry
+        self._index(entry.id, entry.key)
+
+    def _discard(self, action: QAction, menu: QWidget):
+        submenu = self._submenus.pop(action, None)
+        if submenu is not None:
+            self.unwatch(submenu)
+            return
+        entry = self._entries.get(action)
+        if entry is None:
+            return
+        entry.menus.remove(menu)
+        if entry.menus:
+            # Still in another menu.
+            return
+        del self._entries[action]
+        del self._entries_by_id[entry.id]
+        self._unindex(entry.id, entry.key)
+
+    def _index(self, entry_id: int, key: str):
+        prefixes = self._prefixes
+        for word in key.split():
+            prefixes.setdefault(word[:1], set()).add(entry_id)
+            if len(word) > 1:
+                prefixes.setdefault(word[:2], set()).add(entry_id)
+        index = self._trigrams
+        for trigram in trigrams(key):
+            index.setdefault(trigram, set()).add(entry_id)
+
+    def _unindex(self, entry_id: int, key: str):
+        for word in key.split():
+            for prefix in {word[:1], word[:2]}:
+                self._remove_posting(self._prefixes, prefix, entry_id)
+        for trigram in trigrams(key):
+            self._remove_posting(self._trigrams, trigram, entry_id)
+
+    @staticmethod
+    def _remove_posting(postings: dict[str, set[int]], key: str, entry_id: int):
+        entry_ids = postings.get(key)
+        if entry_ids is not None:
+            entry_ids.discard(entry_id)
+            if not entry_ids:
+                del postings[key]
+
+
+class _ResultModel(QAbstractListModel):
+    """The actions found by a `CommandPalette`, shown with the path of menus leading to them."""
+
+    def __init__(self, index: ActionIndex, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.action_index = index
+        self.actions: list[QAction] = []
+
+    def set_actions(self, actions: list[QAction]):
+        self.beginResetModel()
+        self.actions = actions
+        self.endResetModel()
+
+    def rowCount(self, parent: Union[QModelIndex, QPersistentModelIndex] = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.actions)
+
+    def data(self, index: Union[QModelIndex, QPersistentModelIndex], role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        action = self.actions[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            text = strip_mnemonics(action.text())
+            path = self.action_index.path(action)
+            shortcut = action.shortcut().toString(QKeySequence.SequenceFormat.NativeText)
+            text = f"{path}{PATH_SEPARATOR}{text}" if path else text
+            return f"{text}    {shortcut}" if shortcut else text
+        if role == Qt.ItemDataRole.DecorationRole:
+            icon = action.icon()
+            return None if icon.isNull() else icon
+        return None
+
+
+class CommandPalette(QFrame):
+    """
+    A popup to find and trigger any action of a title bar's menus by typing part of its text, backed by an `ActionIndex`. Each keystroke runs one search of the index, so the results keep up with typing however many actions there are.
+
+    Until something is typed, every action is listed. The arrow and page keys move through the results, Enter triggers the selected action (or the first one) and Escape closes the palette.
+
+    :param index: The index of the actions to search.
+    :type index: ActionIndex
+
+    :param limit: The maximum number of results shown. Defaults to `50`.
+    :type limit: Optional[int]
+
+    :param parent: The window the palette is shown over. Defaults to `None`.
+    :type parent: Optional[QWidget]
+    """
+
+    # Width of the palette (in pixels), and the number of result rows it shows at most.
+    WIDTH = 500
+    VISIBLE_ROWS = 12
+
+    def __init__(
+        self,
+        index: ActionIndex,
+        limit: Optional[int] = 50,
+        parent: Optional[QWidget] = None,
+    ):
+        super().__init__(parent, Qt.WindowType.Popup)
+        self.action_index = index
+        self.limit = limit
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+
+        self.line_edit = QLineEdit()
+        self.line_edit.setPlaceholderText("Search commands")
+        self.line_edit.setClearButtonEnabled(True)
+        self.line_edit.textChanged.connect(self.search)
+        self.line_edit.installEventFilter(self)
+
+        self.model = _ResultModel(index, parent=self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.view.setTextElideMode(Qt.TextElideMode.ElideMiddle)
+        self.view.clicked.connect(self._trigger)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(4)
+        layout.addWidget(self.line_edit)
+        layout.addWidget(self.view)
+
+    def popup(self, window: QWidget):
+        """Shows the palette (with an empty query, so listing every action) at the top of `window`."""
+        self.line_edit.clear()
+        self.search("")
+        width = min(self.WIDTH, window.width())
+        row_height = self.fontMetrics().height() + 6
+        self.resize(width, self.line_edit.sizeHint().height() + self.VISIBLE_ROWS * row_height + 12)
+        self.move(window.mapToGlobal(QPoint((window.width() - width) // 2, 40)))
+        self.show()
+        self.line_edit.setFocus(Qt.FocusReason.PopupFocusReason)
+
+    def search(self, query: str):
+        """Shows the actions matching `query`."""
+        self.model.set_actions(self.action_index.search(query, limit=self.limit))
+        if self.model.actions:
+            self.view.setCurrentIndex(self.model.index(0))
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.KeyPress:
+            key = event.key()
+            if key in (Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_PageUp, Qt.Key.Key_PageDown):
+                QApplication.sendEvent(self.view, QKeyEvent(event.type(), key, event.modifiers()))
+                return True
+            if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                self._trigger(self.view.currentIndex())
+                return True
+        return False
+
+    def _trigger(self, index: QModelIndex):
+        if not index.isValid():
+            return
+        action = self.model.actions[index.row()]
+        self.hide()
+        action.trigger()
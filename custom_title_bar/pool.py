@@ -0,0 +1,93 @@
+from PySide6.QtWidgets import QWidget, QMainWindow
+from typing import Any, Optional
+from weakref import WeakSet
+
+from .config import TitleBarConfig
+from .events import focus_dispatcher
+from .geometry import screen_edge_index
+from .icons import icon_cache
+from .theme import TitleBarTheme
+from .title_bar import CustomTitleBar
+
+
+class TitleBarPool:
+    """
+    Factory for apps with many windows using the same title bar settings.
+
+    The pool holds a single `TitleBarConfig` and `TitleBarTheme` built from the settings, and every `CustomTitleBar` it creates shares them by reference: the config, the theme (and so one compiled set of stylesheets, installed once in the application's stylesheet with `app_level=True`), the icons and multi-mode icons (through `icon_cache`), the screen index and the focus dispatcher. What remains per window are the widgets themselves.
+
+    :param theme: The theme shared by the title bars. Defaults to a theme built from the styling parameters in `kwargs`.
+    :type theme: Optional[TitleBarTheme]
+
+    :param app_level: Whether the default theme installs its rules once in the application's stylesheet (see `TitleBarTheme`) instead of setting a stylesheet on every widget. Ignored if `theme` is given. Defaults to `True`.
+    :type app_level: Optional[bool]
+
+    :param kwargs: Any other parameters of `CustomTitleBar`, used for every title bar of the pool.
+    """
+
+    def __init__(
+        self,
+        theme: Optional[TitleBarTheme] = None,
+        app_level: Optional[bool] = True,
+        **kwargs: Any,
+    ):
+        style_kwargs = {
+            name: kwargs.pop(name)
+            for name in TitleBarTheme.STYLE_FIELDS
+            if name in kwargs
+        }
+        if theme is None:
+            theme = TitleBarTheme(**style_kwargs, app_level=app_level)
+        self.theme = theme
+        config = kwargs.pop("config", None) or TitleBarConfig()
+        config_kwargs = {
+            name: kwargs.pop(name)
+            for name in TitleBarConfig.field_names()
+            if name in kwargs
+        }
+        self.config = config.replace(**config_kwargs)
+        self.kwargs = kwargs
+        self._title_bars: WeakSet[CustomTitleBar] = WeakSet()
+
+    def create(self, root: QWidget | QMainWindow, **overrides: Any) -> CustomTitleBar:
+        """
+        Creates a `CustomTitleBar` for `root` with the pool's settings and theme.
+
+        :param root: The root window whose title bar is being replaced.
+        :type root: QWidget | QMainWindow
+
+        :param overrides: Parameters of `CustomTitleBar` to use instead of the pool's for this title bar. Overridden settings get a theme and config derived from the pool's (shared with every other title bar with the same overrides).
+        """
+        kwargs = {**self.kwargs, **overrides}
+        theme = kwargs.pop("theme", self.theme)
+        config = kwargs.pop("config", self.config)
+        style_overrides = {
+            name: kwargs.pop(name)
+            for name in TitleBarTheme.STYLE_FIELDS
+            if name in kwargs
+        }
+        if style_overrides:
+            theme = theme.replace(**style_overrides)
+        config_overrides = {
+            name: kwargs.pop(name)
+            for name in TitleBarConfig.field_names()
+            if name in kwargs
+        }
+        if config_overrides:
+            config = config.replace(**config_overrides)
+        title_bar = CustomTitleBar(root=root, theme=theme, config=config, **kwargs)
+        self._title_bars.add(title_bar)
+        return title_bar
+
+    def __len__(self):
+        return len(self._title_bars)
+
+    def stats(self) -> dict:
+        """Gives the number of live title bars of the pool and the state of the shared resources."""
+        return {
+            "title_bars": len(self._title_bars),
+            "theme": self.theme.name,
+            "icon_cache": icon_cache.stats(),
+            "focus_listeners": focus_dispatcher.listener_count(),
+            "screens": len(screen_edge_index.geometries),
+        }
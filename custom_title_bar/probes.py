@@ -0,0 +1,45 @@
+from time import perf_counter_ns
+from typing import Any, Callable, Optional
+
+# Kept free of imports beyond the standard library's basics, since `theme` (which is probed too) has to stay quick to import without Qt. The counters, the trace and their export live in `instrumentation`, which is only imported when it is used.
+
+
+class Probes:
+    """
+    The switch the probed hot paths check before timing themselves, and the recorder they report to. `Instrumentation.enable` turns it on; while it is off, a probe only costs reading `enabled`::
+
+        start = perf_counter_ns() if probes.enabled else 0
+        ...  # the probed call
+        if start:
+            probes.record("move", window, start)
+    """
+
+    def __init__(self):
+        self.enabled = False
+        # Called with (name, window, start, duration, count) while enabled.
+        self.recorder: Optional[Callable[[str, Any, int, int, int], None]] = None
+
+    def record(self, name: str, window: Any, start_ns: int, count: Optional[int] = 1):
+        """
+        Records a call of `name` that started at `start_ns` (from `time.perf_counter_ns`) and ends now.
+
+        :param name: The name of the probed call.
+        :type name: str
+
+        :param window: The top-level window the call was made for, or `None` if it isn't tied to one.
+        :type window: Optional[QWidget]
+
+        :param start_ns: When the call started.
+        :type start_ns: int
+
+        :param count: The number of calls made in that time (e.g. `4` for the four buttons' `setIcon`). Defaults to `1`.
+        :type count: Optional[int]
+        """
+        duration_ns = perf_counter_ns() - start_ns
+        recorder = self.recorder
+        if recorder is not None:
+            recorder(name, window, start_ns, duration_ns, count)
+
+
+# Shared by every title bar.
+probes = Probes()
@@ -0,0 +1,244 @@
+from PySide6.QtWidgets import QWidget, QRubberBand
+from PySide6.QtCore import Qt, QEvent, QObject, QPoint, QRect, QSize
+from PySide6.QtGui import QMouseEvent
+from typing import Optional
+
+from .events import FrameCoalescer, RootEventFilter, connect_slot
+from .icons import shape_cursor
+
+# Sides of the window each grip lies on.
+GRIP_SIDES = (
+    Qt.Edge.LeftEdge,
+    Qt.Edge.TopEdge,
+    Qt.Edge.RightEdge,
+    Qt.Edge.BottomEdge,
+)
+
+EDGE_CURSORS = {
+    Qt.Edge.LeftEdge: Qt.CursorShape.SizeHorCursor,
+    Qt.Edge.RightEdge: Qt.CursorShape.SizeHorCursor,
+    Qt.Edge.TopEdge: Qt.CursorShape.SizeVerCursor,
+    Qt.Edge.BottomEdge: Qt.CursorShape.SizeVerCursor,
+    Qt.Edge.LeftEdge | Qt.Edge.TopEdge: Qt.CursorShape.SizeFDiagCursor,
+    Qt.Edge.RightEdge | Qt.Edge.BottomEdge: Qt.CursorShape.SizeFDiagCursor,
+    Qt.Edge.RightEdge | Qt.Edge.TopEdge: Qt.CursorShape.SizeBDiagCursor,
+    Qt.Edge.LeftEdge | Qt.Edge.BottomEdge: Qt.CursorShape.SizeBDiagCursor,
+}
+
+
+def edges_at(side: Qt.Edge, pos: QPoint, size: QSize, corner: int) -> Qt.Edge:
+    """Gives the window edges to resize when a grip on `side` (of size `size`) is pressed at `pos`: `side` itself, plus the adjacent side if `pos` is within `corner` pixels of one of the grip's ends."""
+    if side in (Qt.Edge.LeftEdge, Qt.Edge.RightEdge):
+        if pos.y() < corner:
+            return side | Qt.Edge.TopEdge
+        if pos.y() >= size.height() - corner:
+            return side | Qt.Edge.BottomEdge
+    else:
+        if pos.x() < corner:
+            return side | Qt.Edge.LeftEdge
+        if pos.x() >= size.width() - corner:
+            return side | Qt.Edge.RightEdge
+    return side
+
+
+def resized_geometry(
+    geometry: QRect,
+    edges: Qt.Edge,
+    delta: QPoint,
+    minimum: QSize,
+    maximum: QSize,
+) -> QRect:
+    """Gives `geometry` with its `edges` moved by `delta`, keeping the size within `minimum`-`maximum` and the opposite edges in place."""
+    x, y, width, height = geometry.x(), geometry.y(), geometry.width(), geometry.height()
+    if edges & Qt.Edge.LeftEdge:
+        new_width = min(max(width - delta.x(), minimum.width()), maximum.width())
+        x += width - new_width
+        width = new_width
+    elif edges & Qt.Edge.RightEdge:
+        width = min(max(width + delta.x(), minimum.width()), maximum.width())
+    if edges & Qt.Edge.TopEdge:
+        new_height = min(max(height - delta.y(), minimum.height()), maximum.height())
+        y += height - new_height
+        height = new_height
+    elif edges & Qt.Edge.BottomEdge:
+        height = min(max(height + delta.y(), minimum.height()), maximum.height())
+    return QRect(x, y, width, height)
+
+
+class ResizeGrip(QWidget):
+    """
+    A transparent strip along one side of a frameless window that resizes the window when dragged. The ends of the strip resize the adjacent side too (the corners). The actual resizing is done by the `WindowResizer` owning the grip.
+
+    :param resizer: The resizer owning the grip.
+    :type resizer: WindowResizer
+
+    :param side: The side of the window the grip lies on.
+    :type side: Qt.Edge
+    """
+
+    def __init__(self, resizer: "WindowResizer", side: Qt.Edge):
+        super().__init__(resizer.window)
+        self.resizer = resizer
+        self.side = side
+        self.setMouseTracking(True)
+        self.setCursor(shape_cursor(EDGE_CURSORS[side]))
+
+    def _edges_at(self, pos: QPoint) -> Qt.Edge:
+        return edges_at(self.side, pos, self.size(), self.resizer.corner_size)
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.resizer.start(
+                self._edges_at(event.position().toPoint()),
+                event.globalPosition().toPoint(),
+            )
+        event.accept()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        if self.resizer.edges is not None:
+            self.resizer.resize_to(event.globalPosition().toPoint())
+        else:
+            # Hovering: show the cursor of the side or corner under the mouse.
+            self.setCursor(
+                shape_cursor(EDGE_CURSORS[self._edges_at(event.position().toPoint())])
+            )
+        event.accept()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.resizer.finish()
+        event.accept()
+
+
+class WindowResizer(QObject):
+    """
+    Gives a frameless window back the resizing its native frame provided, with a `ResizeGrip` on each of its sides (the corners are hit-tested at the ends of the grips). The grips follow the window's size and are hidden while it is maximized or full screen.
+
+    While resizing, the window's geometry changes at most once per display frame (through a `FrameCoalescer`, with the latest mouse position), so heavy content isn't laid out for every mouse event. With `preview=True`, the window isn't touched at all until the mouse is released: a rubber band shows the new geometry instead, and the window is resized once.
+
+    :param window: The top-level window to resize.
+    :type window: QWidget
+
+    :param margin: The width (in pixels) of the grips along the window's sides. Defaults to `5`.
+    :type margin: Optional[int]
+
+    :param preview: Whether to show the new geometry as a rubber band and only resize the window on release. Defaults to `False`.
+    :type preview: Optional[bool]
+    """
+
+    def __init__(
+        self,
+        window: QWidget,
+        margin: Optional[int] = 5,
+        preview: Optional[bool] = False,
+    ):
+        super().__init__(window)
+        self.window = window
+        self.margin = margin
+        self.corner_size = max(4 * margin, 16)
+        self.preview = preview
+        # Set while a resize is in progress.
+        self.edges: Optional[Qt.Edge] = None
+        self.coalesced_resize_events = 0
+        self._start_pos = QPoint()
+        self._start_geometry = QRect()
+        self._minimum = QSize()
+        self._maximum = QSize()
+        self._geometry = QRect()
+        # Created on the first resize.
+        self._coalescer: Optional[FrameCoalescer] = None
+        self._rubber_band: Optional[QRubberBand] = None
+
+        self.grips = [ResizeGrip(self, side) for side in GRIP_SIDES]
+        event_filter = RootEventFilter.for_root(window)
+        event_filter.add_handler(QEvent.Type.Resize, self._place_grips)
+        event_filter.add_handler(QEvent.Type.Show, self._place_grips)
+        event_filter.add_handler(QEvent.Type.WindowStateChange, self._place_grips)
+        self._place_grips()
+
+    def _place_grips(self, _event: Optional[QEvent] = None):
+        """Lays the grips along the window's sides (above its content), or hides them if the window fills the screen."""
+        window = self.window
+        hidden = bool(
+            window.windowState()
+            & (Qt.WindowState.WindowMaximized | Qt.WindowState.WindowFullScreen)
+        )
+        width, height, margin = window.width(), window.height(), self.margin
+        geometries = {
+            Qt.Edge.LeftEdge: QRect(0, 0, margin, height),
+            Qt.Edge.TopEdge: QRect(margin, 0, width - 2 * margin, margin),
+            Qt.Edge.RightEdge: QRect(width - margin, 0, margin, height),
+            Qt.Edge.BottomEdge: QRect(margin, height - margin, width - 2 * margin, margin),
+        }
+        for grip in self.grips:
+            grip.setHidden(hidden)
+            if not hidden:
+                grip.setGeometry(geometries[grip.side])
+                grip.raise_()
+
+    def start(self, edges: Qt.Edge, global_pos: QPoint):
+        """Starts resizing the `edges` of the window, from the mouse position `global_pos`."""
+        window = self.window
+        self.edges = edges
+        self._start_pos = global_pos
+        self._start_geometry = window.geometry()
+        self._geometry = self._start_geometry
+        # Looked up once per resize rather than on every mouse move.
+        self._minimum = window.minimumSize().expandedTo(window.minimumSizeHint())
+        self._maximum = window.maximumSize()
+
+        if self._coalescer is None:
+            self._coalescer = FrameCoalescer(callback=self._apply_geometry, parent=window)
+        self._coalescer.reset_counters()
+        if self.preview:
+            if self._rubber_band is None:
+                # A top-level rubber band, so it isn't clipped to the window.
+                self._rubber_band = QRubberBand(QRubberBand.Shape.Rectangle)
+                connect_slot(window, "destroyed()", self._rubber_band, "deleteLater()")
+            self._rubber_band.setGeometry(self._start_geometry)
+            self._rubber_band.show()
+
+    def resize_to(self, global_pos: QPoint):
+        """Resizes the window (or the rubber band) for the mouse having moved to `global_pos`, at most once per frame."""
+        self._geometry = resized_geometry(
+            self._start_geometry,
+            self.edges,
+            global_pos - self._start_pos,
+            self._minimum,
+            self._maximum,
+        )
+        self._coalescer.submit(self._geometry)
+
+    def finish(self):
+        """Ends the resize, applying the final geometry."""
+        if self.edges is None:
+            return
+        self.edges = None
+        self._coalescer.flush()
+        self.coalesced_resize_events = self._coalescer.coalesced
+        if self.preview:
+            self._rubber_band.hide()
+            if self._geometry != self.window.geometry():
+                self.window.setGeometry(self._geometry)
+
+    def _apply_geometry(self, geometry: QRect):
+        if self.preview:
+            self._rubber_band.setGeometry(geometry)
+        else:
+            self.window.setGeometry(geometry)
+
+    def uninstall(self):
+        """Removes the grips and the resizer's event handlers from the window."""
+        event_filter = RootEventFilter.for_root(self.window)
+        for event_type in (
+            QEvent.Type.Resize,
+            QEvent.Type.Show,
+            QEvent.Type.WindowStateChange,
+        ):
+            event_filter.remove_handler(event_type, self._place_grips)
+        for grip in self.grips:
+            grip.deleteLater()
+        self.grips.clear()
+        if self._rubber_band is not None:
+            self._rubber_band.deleteLater()
+        self.deleteLater()
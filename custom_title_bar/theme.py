@@ -0,0 +1,399 @@
+import sys
+from collections import OrderedDict
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Optional
+
+from .probes import probes
+
+# PySide6 is only imported once a theme is applied to widgets, so themes can be built and compiled (e.g. by tools that only deal with the styling) without loading Qt.
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QMenu, QWidget
+
+
+def _window_of(widget: "QWidget") -> Optional["QWidget"]:
+    # Widgets are mostly styled while their window is being built (e.g. a title bar before it is added to its root), when `window()` isn't the window they end up in yet.
+    window = widget.window()
+    return window if window.isVisible() else None
+
+
+class TitleBarTheme:
+    """
+    The colors, fonts and additional QSS of a `CustomTitleBar`, compiled into stylesheets once and shared by every title bar that uses an equal theme.
+
+    Themes with equal values share the same compiled stylesheets (and the same name), so constructing one theme per window costs nothing extra. Both are kept for the `CACHE_SIZE` most recently used distinct themes. With `app_level=True`, the theme installs its rules once in the application's stylesheet, scoped by object name, and each styled widget only gets an object name: N windows then cost one stylesheet parse instead of one per widget. The installed rules are kept in one block of the application's stylesheet, which holds the rules of the `CACHE_SIZE` most recently used themes.
+
+    The parameters have the same meaning and defaults as the corresponding parameters of `CustomTitleBar`, except for `root_bg_color`, which defaults to the palette's window color.
+
+    :param app_level: Whether to install the rules in the application's stylesheet instead of setting a stylesheet on every widget. Calling `QApplication.setStyleSheet` afterwards replaces the installed rules; call `install(force=True)` to restore them. Defaults to `False`.
+    :type app_level: Optional[bool]
+    """
+
+    STYLE_FIELDS = (
+        "root_bg_color",
+        "title_bar_bg_color",
+        "root_border_radius",
+        "title_bar_text_bg_color",
+        "title_bar_text_font_size",
+        "title_bar_text_font_color",
+        "title_bar_text_font",
+        "title_bar_text_font_weight",
+        "title_bar_text_additional_qss",
+        "menu_bar_border",
+        "menu_bar_bg_color",
+        "menu_bar_border_radius",
+        "menu_bar_padding",
+        "menu_bar_font",
+        "menu_bar_font_color",
+        "menu_bar_font_size",
+        "menu_bar_additional_qss",
+        "menu_bar_item_bg_color",
+        "menu_bar_item_additional_qss",
+        "menu_bar_item_hover_bg_color",
+        "menu_bar_item_hover_additional_qss",
+        "menu_bar_dropdown_additional_qss",
+        "menu_bar_dropdown_font",
+        "menu_bar_dropdown_item_padding",
+        "menu_bar_dropdown_item_bg_color",
+        "menu_bar_dropdown_item_additional_qss",
+        "menu_bar_dropdown_item_hover_bg_color",
+        "menu_bar_dropdown_item_hover_additional_qss",
+    )
+    COMPONENTS = ("central", "container", "btns", "text", "menu")
+
+    # The number of distinct themes whose compiled stylesheets and names are kept.
+    CACHE_SIZE = 64
+
+    # Shared between all themes: compiled stylesheets and names per distinct theme, least recently used first.
+    _compiled: OrderedDict[tuple, dict[str, str]] = OrderedDict()
+    _names: OrderedDict[tuple, str] = OrderedDict()
+    _name_count = 0
+    # The rules of the installed themes by name, least recently used first, and the markers around them in the application's stylesheet.
+    _installed: OrderedDict[str, str] = OrderedDict()
+    _BLOCK_START = "/* custom-title-bar themes */"
+    _BLOCK_END = "/* end of custom-title-bar themes */"
+
+    def __init__(
+        self,
+        root_bg_color: Optional[str] = None,
+        title_bar_bg_color: Optional[str] = "",
+        root_border_radius: Optional[int] = 10,
+        title_bar_text_bg_color: Optional[str] = None,
+        title_bar_text_font_size: Optional[str] = "15px",
+        title_bar_text_font_color: Optional[str] = "#fff",
+        title_bar_text_font: Optional[str] = "arial",
+        title_bar_text_font_weight: Optional[str] = "bold",
+        title_bar_text_additional_qss: Optional[str] = "",
+        menu_bar_border: Optional[str] = "0px solid black",
+        menu_bar_bg_color: Optional[str] = "",
+        menu_bar_border_radius: Optional[str] = "0px",
+        menu_bar_padding: Optional[str] = "0px",
+        menu_bar_font: Optional[str] = "arial",
+        menu_bar_font_color: Optional[str] = "#fff",
+        menu_bar_font_size: Optional[str] = "14px",
+        menu_bar_additional_qss: Optional[str] = "",
+        menu_bar_item_bg_color: Optional[str] = "",
+        menu_bar_item_additional_qss: Optional[str] = "",
+        menu_bar_item_hover_bg_color: Optional[str] = "",
+        menu_bar_item_hover_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_font: Optional[str] = None,
+        menu_bar_dropdown_item_padding: Optional[str] = "3px 10px",
+        menu_bar_dropdown_item_bg_color: Optional[str] = "",
+        menu_bar_dropdown_item_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_item_hover_bg_color: Optional[str] = "",
+        menu_bar_dropdown_item_hover_additional_qss: Optional[str] = "",
+        app_level: Optional[bool] = False,
+    ):
+        self.root_bg_color = root_bg_color
+        self.title_bar_bg_color = title_bar_bg_color
+        self.root_border_radius = root_border_radius
+        self.title_bar_text_bg_color = title_bar_text_bg_color
+        self.title_bar_text_font_size = title_bar_text_font_size
+        self.title_bar_text_font_color = title_bar_text_font_color
+        self.title_bar_text_font = title_bar_text_font
+        self.title_bar_text_font_weight = title_bar_text_font_weight
+        self.title_bar_text_additional_qss = title_bar_text_additional_qss
+        self.menu_bar_border = menu_bar_border
+        self.menu_bar_bg_color = menu_bar_bg_color
+        self.menu_bar_border_radius = menu_bar_border_radius
+        self.menu_bar_padding = menu_bar_padding
+        self.menu_bar_font = menu_bar_font
+        self.menu_bar_font_color = menu_bar_font_color
+        self.menu_bar_font_size = menu_bar_font_size
+        self.menu_bar_additional_qss = menu_bar_additional_qss
+        self.menu_bar_item_bg_color = menu_bar_item_bg_color
+        self.menu_bar_item_additional_qss = menu_bar_item_additional_qss
+        self.menu_bar_item_hover_bg_color = menu_bar_item_hover_bg_color
+        self.menu_bar_item_hover_additional_qss = menu_bar_item_hover_additional_qss
+        self.menu_bar_dropdown_additional_qss = menu_bar_dropdown_additional_qss
+        self.menu_bar_dropdown_font = menu_bar_dropdown_font
+        self.menu_bar_dropdown_item_padding = menu_bar_dropdown_item_padding
+        self.menu_bar_dropdown_item_bg_color = menu_bar_dropdown_item_bg_color
+        self.menu_bar_dropdown_item_additional_qss = (
+            menu_bar_dropdown_item_additional_qss
+        )
+        self.menu_bar_dropdown_item_hover_bg_color = (
+            menu_bar_dropdown_item_hover_bg_color
+        )
+        self.menu_bar_dropdown_item_hover_additional_qss = (
+            menu_bar_dropdown_item_hover_additional_qss
+        )
+        self.app_level = app_level
+
+        self._key = tuple(getattr(self, name) for name in self.STYLE_FIELDS)
+        # Kept by the theme, so that it keeps its name (which scopes its app-level rules) once evicted from the cache.
+        self._name = TitleBarTheme._name_for(self._key)
+
+    def __eq__(self, other):
+        if not isinstance(other, TitleBarTheme):
+            return NotImplemented
+        return (self._key, self.app_level) == (other._key, other.app_level)
+
+    def __hash__(self):
+        return hash((self._key, self.app_level))
+
+    @property
+    def name(self) -> str:
+        """A name shared by the themes with equal values, used to scope the app-level rules."""
+        return self._name
+
+    def values(self) -> dict:
+        """Gives the theme's values as keyword arguments for `TitleBarTheme` (without `app_level`)."""
+        return {name: getattr(self, name) for name in self.STYLE_FIELDS}
+
+    def replace(self, **changes) -> "TitleBarTheme":
+        """Gives a copy of this theme with `changes` applied."""
+        values = self.values()
+        values["app_level"] = self.app_level
+        values.update(changes)
+        return TitleBarTheme(**values)
+
+    @property
+    def stylesheets(self) -> dict[str, str]:
+        """The compiled stylesheet of each component in `COMPONENTS`, compiled once per distinct theme."""
+        # The app-level stylesheets are scoped by the name, which equal themes only share while it is cached.
+        key = (self._key, self._name if self.app_level else None)
+        cache = TitleBarTheme._compiled
+        compiled = cache.get(key)
+        if compiled is not None:
+            cache.move_to_end(key)
+            return compiled
+
+        compiled = cache[key] = {
+            component: sys.intern(qss) for component, qss in self._compile().items()
+        }
+        while len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
+        return compiled
+
+    @classmethod
+    def _name_for(cls, key: tuple) -> str:
+        names = TitleBarTheme._names
+        name = names.get(key)
+        if name is not None:
+            names.move_to_end(key)
+            return name
+
+        name = names[key] = f"ctb-theme-{TitleBarTheme._name_count}"
+        TitleBarTheme._name_count += 1
+        while len(names) > cls.CACHE_SIZE:
+            names.popitem(last=False)
+        return name
+
+    def install(self, force: Optional[bool] = False):
+        """
+        Adds the theme's rules to the application's stylesheet, once per distinct theme. Only used with `app_level=True`.
+
+        The rules of all installed themes are kept in one block of the application's stylesheet, which is replaced (rather than appended to) when a theme is added, so the rest of the stylesheet is left alone. Once more than `CACHE_SIZE` themes were installed, the rules of the least recently used one are dropped.
+
+        :param force: Whether to install the rules even if they were installed before (e.g. after the application's stylesheet was replaced). Defaults to `False`.
+        :type force: Optional[bool]
+        """
+        if not self.app_level:
+            return
+        installed = TitleBarTheme._installed
+        if self.name in installed and not force:
+            installed.move_to_end(self.name)
+            return
+        from PySide6.QtWidgets import QApplication
+
+        installed[self.name] = "\n".join(
+            self.stylesheets[component] for component in self.COMPONENTS
+        )
+        installed.move_to_end(self.name)
+        while len(installed) > self.CACHE_SIZE:
+            installed.popitem(last=False)
+
+        app = QApplication.instance()
+        current = app.styleSheet()
+        block = "\n".join((self._BLOCK_START, *installed.values(), self._BLOCK_END))
+        block_start = current.find(self._BLOCK_START)
+        block_end = current.find(self._BLOCK_END, block_start)
+        if block_start != -1 and block_end != -1:
+            qss = f"{current[:block_start]}{block}{current[block_end + len(self._BLOCK_END):]}"
+        else:
+            qss = f"{current}\n{block}" if current else block
+        if qss != current:
+            start = perf_counter_ns() if probes.enabled else 0
+            app.setStyleSheet(qss)
+            if start:
+                probes.record("setStyleSheet", None, start)
+
+    def style_widget(self, widget: "QWidget", component: str):
+        """
+        Applies the theme to `widget`, which is the `component` (one of `COMPONENTS`) of a title bar.
+        """
+        if not self.app_level:
+            if component == "central":
+                widget.setObjectName("central-widget-tag")
+            start = perf_counter_ns() if probes.enabled else 0
+            widget.setStyleSheet(self.stylesheets[component])
+            if start:
+                probes.record("setStyleSheet", _window_of(widget), start)
+            return
+
+        from PySide6.QtCore import Qt
+
+        self.install()
+        if widget.styleSheet():
+            # A widget's own stylesheet would take precedence over the app-level rules.
+            start = perf_counter_ns() if probes.enabled else 0
+            widget.setStyleSheet("")
+            if start:
+                probes.record("setStyleSheet", _window_of(widget), start)
+        widget.setObjectName(f"{self.name}-{component}")
+        if widget.testAttribute(Qt.WidgetAttribute.WA_WState_Polished):
+            widget.style().unpolish(widget)
+            widget.style().polish(widget)
+
+    def tag_menu(self, menu: "QMenu"):
+        """Marks a `QMenu` added to the menu bar so the app-level dropdown rules apply to it."""
+        if self.app_level:
+            menu.setProperty("titleBarTheme", self.name)
+
+    def _compile(self) -> dict[str, str]:
+        radius = self.root_border_radius
+        dropdown_font = (
+            self.menu_bar_font
+            if self.menu_bar_dropdown_font is None
+            else self.menu_bar_dropdown_font
+        )
+        central = f"background-color:{self.root_bg_color or 'palette(window)'}; border-radius: {radius}px"
+        container = f"border-top-left-radius: {radius}px; border-top-right-radius:{radius}px; background-color:{self.title_bar_bg_color};"
+        btns = "border: 0px"
+        text = f"""
+                background-color: {self.title_bar_text_bg_color}; 
+                font-size: {self.title_bar_text_font_size}; 
+                font-family: '{self.title_bar_text_font}';
+                font-weight: {self.title_bar_text_font_weight};
+                color: {self.title_bar_text_font_color};
+                {self.title_bar_text_additional_qss}
+        """
+        menu_rules = [
+            # Main bar
+            (
+                "QMenuBar",
+                f"""
+                    border: {self.menu_bar_border};
+                    border-radius: {self.menu_bar_border_radius};
+                    background-color:{self.menu_bar_bg_color};
+                    padding: {self.menu_bar_padding};
+                    font-family: {self.menu_bar_font};
+                    color: {self.menu_bar_font_color};
+                    font-size: {self.menu_bar_font_size};
+                    {self.menu_bar_additional_qss}
+                """,
+            ),
+            # Menu bar items
+            (
+                "QMenuBar::item",
+                f"""
+                    background-color: {self.menu_bar_item_bg_color};
+                    {self.menu_bar_item_additional_qss}
+                """,
+            ),
+            # Menu bar items hover
+            (
+                "QMenuBar::item:selected",
+                f"""
+                    background-color: {self.menu_bar_item_hover_bg_color};
+                    {self.menu_bar_item_hover_additional_qss}
+                """,
+            ),
+            # Sub menu's dropdown
+            (
+                "QMenu",
+                f"""
+                    border-radius: 0px;
+                    padding: 0px;
+                    font-family: {dropdown_font};
+                    {self.menu_bar_dropdown_additional_qss}
+                """,
+            ),
+            # Sub menu's dropdown's items
+            (
+                "QMenu::item",
+                f"""
+                    padding: {self.menu_bar_dropdown_item_padding};
+                    background-color: {self.menu_bar_dropdown_item_bg_color};
+                    {self.menu_bar_dropdown_item_additional_qss}
+                """,
+            ),
+            # Sub menu's dropdown's items hover
+            (
+                "QMenu::item::selected",
+                f"""
+                    background-color: {self.menu_bar_dropdown_item_hover_bg_color};
+                    {self.menu_bar_dropdown_item_hover_additional_qss}
+                """,
+            ),
+            # Entries of a `LazyMenu`, styled like the dropdown's items
+            (
+                "QMenu QListView::item",
+                f"""
+                    padding: {self.menu_bar_dropdown_item_padding};
+                    background-color: {self.menu_bar_dropdown_item_bg_color};
+                    {self.menu_bar_dropdown_item_additional_qss}
+                """,
+            ),
+            (
+                "QMenu QListView::item:selected",
+                f"""
+                    background-color: {self.menu_bar_dropdown_item_hover_bg_color};
+                    {self.menu_bar_dropdown_item_hover_additional_qss}
+                """,
+            ),
+        ]
+
+        if not self.app_level:
+            return {
+                "central": f"#central-widget-tag {{{central}}}",
+                "container": container,
+                "btns": btns,
+                "text": text,
+                "menu": "".join(
+                    f"{selector} {{{body}}}" for selector, body in menu_rules
+                ),
+            }
+
+        name = self.name
+        menu_selectors = {
+            "QMenuBar": f"QMenuBar#{name}-menu",
+            "QMenuBar::item": f"QMenuBar#{name}-menu::item",
+            "QMenuBar::item:selected": f"QMenuBar#{name}-menu::item:selected",
+            "QMenu": f'QMenu[titleBarTheme="{name}"], #{name}-menu QMenu',
+            "QMenu::item": f'QMenu[titleBarTheme="{name}"]::item, #{name}-menu QMenu::item',
+            "QMenu::item::selected": f'QMenu[titleBarTheme="{name}"]::item::selected, #{name}-menu QMenu::item::selected',
+            "QMenu QListView::item": f'QMenu[titleBarTheme="{name}"] QListView::item, #{name}-menu QMenu QListView::item',
+            "QMenu QListView::item:selected": f'QMenu[titleBarTheme="{name}"] QListView::item:selected, #{name}-menu QMenu QListView::item:selected',
+        }
+        return {
+            "central": f"QWidget#{name}-central {{{central}}}",
+            # Like a selector-less widget stylesheet, the container rule also applies to its children.
+            "container": f"#{name}-container, #{name}-container * {{{container}}}",
+            "btns": f"#{name}-btns, #{name}-btns * {{{btns}}}",
+            "text": f"QLabel#{name}-text {{{text}}}",
+            "menu": "\n".join(
+                f"{menu_selectors[selector]} {{{body}}}" for selector, body in menu_rules
+            ),
+        }
@@ -0,0 +1,1081 @@
+from PySide6.QtWidgets import (
+    QWidget,
+    QMainWindow,
+    QHBoxLayout,
+    QVBoxLayout,
+    QSizePolicy,
+    QMenu,
+)
+from PySide6.QtCore import Qt, QEvent, QPoint
+from PySide6.QtGui import QKeySequence, QMouseEvent, QShortcut
+from time import perf_counter_ns
+from typing import Any, Callable, Iterable, Optional
+
+from .animation import WindowStateAnimator
+from .drag import DragGhost
+from .drag_trace import DragSummary, DragTracer
+from .events import FrameCoalescer, RootEventFilter, connect_slot, frame_interval
+from .geometry import screen_edge_index, window_edge_index
+from .menus import LazyMenu
+from .palette import ActionIndex, CommandPalette
+from .probes import probes
+from .resize import WindowResizer
+from .config import TitleBarConfig
+from .theme import TitleBarTheme
+from .widgets import TitleBtns, TitleMenuBar, TitleText
+
+
+class CustomTitleBar(QWidget):
+    """
+    Implements a custom title bar which automatically replaces default title bar of a `QWidget` or `QMainWindow`. `CustomTitleBar` should be placed in the central widget of the root.
+
+    If the root is a `QMainWindow`, simply place `CustomTitleBar` as the first item in the `centralWidget`.
+
+    If the root is a `QWidget`, place a layout, then a central widget in that layout, then place a vertical layout in the central widget, then place the the `CustomTitleBar`, then after that, place a layout which holds all of your app's other content (this is important because it will allow you to add back in contents margins that have to be removed from the higher level elements).
+
+    Parameters
+    ========================
+
+    Title bar parameters
+    ------------------------
+    :param root: The root window whose title bar is being replaced.
+    :type root: QWidget | QMainWindow
+
+    :param root_bg_color: The background color of the root (parent) widget. Defaults to the detected root background color.
+    :type root_bg_color: Optional[str]
+
+    :param title_bar_bg_color: The background color of the title bar section. Defaults to `""`.
+    :type title_bar_bg_color: Optional[str]
+
+    :param stick_to_sides: Whether the window will slightly stick when it reaches the screen edges, but then if the user continues to drag it, it will continue past the edges (i.e., the same behavior seen in MacOS). Defaults to `True`.
+    :type stick_to_sides: Optional[bool]
+
+    :param root_border_radius: The pixel about of bevel (rounding) of the window. Rounded corners need a translucent window, so if it is `0` when the window is first shown, the window is created opaque instead, sparing the per-pixel alpha compositing. While the window is maximized or full screen, where the corners can't be seen, its corners are square. Defaults to `10`.
+    :type root_border_radius: Optional[int]
+
+    :param title_bar_bottom_padding: The padding (in pixels) at the bottom of the title bar. Defaults to `0`.
+    :type title_bar_bottom_padding: Optional[int]
+
+    :param title_bar_right_padding: The padding (in pixels) to the right of the title bar. Defaults to `12`.
+    :type title_bar_right_padding: Optional[int]
+
+    :param title_bar_left_padding: The padding (in pixels) to the left of the title bar. Defaults to `6`.
+    :type title_bar_left_padding: Optional[int]
+
+    :param title_bar_top_padding: The padding (in pixels) at the top of the title bar. Defaults to `10`.
+    :type title_bar_top_padding: Optional[int]
+
+    :param title_bar_to_menu_bar_padding: The padding (in pixels) between the title bar and the menu bar. Defaults to `5`.
+    :type title_bar_to_menu_bar_padding: Optional[int]
+
+    :param stick_to_windows: Whether a dragged window should magnetically stick to the edges of the app's other windows that have this enabled. Defaults to `False`.
+    :type stick_to_windows: Optional[bool]
+
+    :param window_stick_threshold: The distance (in pixels) within which a dragged window sticks to another window's edge. Defaults to `10`.
+    :type window_stick_threshold: Optional[int]
+
+    :param coalesce_drag_moves: Whether window drags should apply at most one `move()` per display frame (using the latest mouse position) instead of one per mouse event. The number of coalesced events of the last drag is stored in `coalesced_drag_events`. Defaults to `False`.
+    :type coalesce_drag_moves: Optional[bool]
+
+    :param drag_mode: How a window is dragged: `"live"` moves the window itself with the mouse; `"outline"` and `"snapshot"` instead move a lightweight `DragGhost` (an outline of the window, or a snapshot of it grabbed when the drag starts) while the window's content updates are frozen, and move the window once, when the mouse is released. The deferred modes suit translucent windows with expensive content, where every move forces a full repaint. Sticking to the screen sides and to other windows applies to the ghost in the same way. Defaults to `"live"`.
+    :type drag_mode: Optional[str]
+
+    :param animate_window_state: Whether maximizing, restoring and minimizing (with the buttons or by double-clicking the title bar) should be animated. The window is grabbed into a snapshot once, the snapshot is animated to the target geometry at the display's refresh rate, and the window's state only changes at the end (see `WindowStateAnimator`), so the content isn't laid out on every frame. Defaults to `False`.
+    :type animate_window_state: Optional[bool]
+
+    :param window_state_animation_duration: The length (in milliseconds) of the transitions of `animate_window_state`. Defaults to `150`.
+    :type window_state_animation_duration: Optional[int]
+
+    :param maximize_on_double_click: Whether double-clicking the title bar should maximize the window, or restore it if it is maximized. Defaults to `True`.
+    :type maximize_on_double_click: Optional[bool]
+
+    :param command_palette_shortcut: A key sequence (e.g. `"Ctrl+Shift+P"`) that opens the command palette of the window, which finds any action of the title bar's menus as its text is typed (see `show_command_palette`). Defaults to `None` (no shortcut).
+    :type command_palette_shortcut: Optional[str]
+
+    :param theme: A `TitleBarTheme` holding the colors, fonts and additional QSS of the title bar. If given, it takes precedence over the individual color, font and QSS parameters below; sharing one theme between many title bars means their stylesheets are compiled only once. Defaults to a theme built from the individual parameters.
+    :type theme: Optional[TitleBarTheme]
+
+    :param config: A `TitleBarConfig` holding the other (non-styling) settings of the title bar. If given, it takes precedence over the individual parameters it covers (all but the styling ones and `title_bar_text_title_text`). Title bars with equal settings share one config either way. Defaults to a config built from the individual parameters.
+    :type config: Optional[TitleBarConfig]
+
+    :param lazy_init: Whether the button icons and the stylesheets should only be loaded and applied when the title bar is first shown (in one pass, before the first paint), and the menu bar only be created once `add_menu_item` is first called. This cuts the construction time of windows that are built up front but shown later. Note that a title bar without menus then has no (empty) menu bar. Defaults to `False`.
+    :type lazy_init: Optional[bool]
+
+    :param resizable: Whether the root window can be resized by dragging its sides and corners, which `FramelessWindowHint` otherwise prevents. Grips (see `WindowResizer`) are laid along the window's sides for this; the window's geometry changes at most once per display frame while resizing. The grips lie over the outermost `resize_margin` pixels of the window's content and take their mouse input. Defaults to `False`.
+    :type resizable: Optional[bool]
+
+    :param resize_margin: The width (in pixels) of the band along the window's sides that resizes it. Defaults to `5`.
+    :type resize_margin: Optional[int]
+
+    :param resize_preview: Whether resizing should only show the new geometry as a rubber band and resize the window once, when the mouse is released, instead of resizing it live. Defaults to `False`.
+    :type resize_preview: Optional[bool]
+
+    Title bar buttons parameters
+    --------------------------------
+    :param close_btn_default_img_path: Path to the image file being used for the default close button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarCloseButton` will be used. Defaults to `None`.
+    :type close_btn_default_img_path: Optional[str]
+
+    :param min_btn_default_img_path: Path to the image file being used for the default minimize button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarMinButton` will be used. Defaults to `None`.
+    :type min_btn_default_img_path: Optional[str]
+
+    :param max_btn_default_img_path: Path to the image file being used for the default maximize button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarMaxButton` will be used. Defaults to `None`.
+    :type max_btn_default_img_path: Optional[str]
+
+    :param normal_btn_default_img_path: Path to the image file being used for the default normal button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarNormalButton` will be used. Defaults to `None`.
+    :type normal_btn_default_img_path: Optional[str]
+
+    :param disabled_btns_on_focus_out: Whether or not the appearance of the buttons should change to a disabled appearance upon focus out of the application. Defaults to `True`.
+    :type disabled_btns_on_focus_out: Optional[bool]
+
+    :param disabled_btn_image_path: Path to the image file being used for the disabled buttons. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarMinButton` will be used. Defaults to `None`.
+    :type disabled_btn_image_path: Optional[str]
+
+    :param btn_size: The width and height in pixels of the buttons. Defaults to `(14, 14)`.
+    :type btn_size: Optional[tuple(int, int)]
+
+    :param change_btns_on_hover: Flag for whether buttons should change from default to hover variant on hover. If `True`, file paths for the hover variants must be given in addition to paths for the default variants. If `False`, only the default variants' paths must be specified. Defaults to `False`.
+    :type change_btns_on_hover: Optional[bool]
+
+    :param use_icon_modes: Flag for whether each button should get a single multi-mode `QIcon` (default, hover and disabled pixmaps as its Normal, Active/Selected and Disabled modes) so that Qt picks the pixmap while painting. Hover then runs no Python code and only repaints the button under the cursor (instead of all buttons switching to their hover variant together). Defaults to `False`.
+    :type use_icon_modes: Optional[bool]
+
+    :param change_cursor_on_btn_hover: Flag for whether the cursor should change when hovering over the buttons. Defaults to `False`.
+    :type change_cursor_on_btn_hover: Optional[bool]
+
+    :param btn_hover_cursor_shape: Specifies what cursor shape to use for button hovers. Defaults to `Qt.CursorShape.PointingHandCursor`.
+    :type btn_hover_cursor_shape: Optional[Qt.CursorShape]
+
+    :param close_btn_hover_img_path: Path to the image file being used for the hover close button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarCloseButton` will be used. Defaults to `None`.
+    :type close_btn_hover_img_path: Optional[str]
+
+    :param min_btn_hover_img_path: Path to the image file being used for the hover min button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarMinButton` will be used. Defaults to `None`.
+    :type min_btn_hover_img_path: Optional[str]
+
+    :param max_btn_hover_img_path: Path to the image file being used for the hover max button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarMaxButton` will be used. Defaults to `None`.
+    :type max_btn_hover_img_path: Optional[str]
+
+    :param normal_btn_hover_img_path: Path to the image file being used for the hover normal button. If path is `None`, `QStyle.StandardPixmap.SP_TitleBarNormalButton` will be used. Defaults to `None`.
+    :type normal_btn_hover_img_path: Optional[str]
+
+    Title bar text parameters
+    ------------------------------
+    :param title_bar_text_title_text: The text for title of the window. Defaults to `""`.
+    :type title_bar_text_title_text: Optional[str]
+
+    :param title_bar_text_bg_color: The background color for title of the window. Defaults to the same color as the title bar.
+    :type title_bar_text_bg_color: Optional[str]
+
+    :param title_bar_text_font_size: The font size for title of the window. Defaults to `"15px"`.
+    :type title_bar_text_font_size: Optional[str]
+
+    :param title_bar_text_font_color: The font color for title of the window. Defaults to `"#fff"`.
+    :type title_bar_text_font_color: Optional[str]
+
+    :param title_bar_text_font: The font for title of the window. Defaults to `"arial"`.
+    :type title_bar_text_font: Optional[str]
+
+    :param title_bar_text_font_weight: The font weight for title of the window. Defaults to `"bold"`.
+    :type title_bar_text_font_weight: Optional[str]
+
+    :param title_bar_text_additional_qss: The font weight for title of the window. Defaults to `"bold"`.
+    :type title_bar_text_additional_qss: Optional[str]
+
+    Title bar menu parameters
+    ----------------------------
+    :param menu_bar_border: The border of the menu bar. Defaults to `"0px solid black"`.
+    :type menu_bar_border: Optional[str]
+
+    :param menu_bar_bg_color: The background color of the menu bar. Defaults to `""`.
+    :type menu_bar_bg_color: Optional[str]
+
+    :param menu_bar_border_radius: The border radius of the menu bar. Defaults to `"0px"`.
+    :type menu_bar_border_radius: Optional[str]
+
+    :param menu_bar_padding: The padding (space between border and content) of the menu bar. Defaults to `"0px"`.
+    :type menu_bar_padding: Optional[str]
+
+    :param menu_bar_font: The font family of the menu bar. Defaults to `"arial"`.
+    :type menu_bar_font: Optional[str]
+
+    :param menu_bar_font_color: The font color of menu bar text. Defaults to `"#fff"`.
+    :type menu_bar_font_color: Optional[str]
+
+    :param menu_bar_font_size: The font size of the menu bar. Defaults to `"14px"`.
+    :type menu_bar_font_size: Optional[str]
+
+    :param menu_bar_additional_qss: Any additional QSS for the menu bar. Defaults to `""`.
+    :type menu_bar_additional_qss: Optional[str]
+
+    :param menu_bar_item_bg_color: The background color of the menu bar items (the menus). Defaults to `""`.
+    :type menu_bar_item_bg_color: Optional[str]
+
+    :param menu_bar_item_additional_qss: Additional QSS for the menu bar items (the menus). Defaults to `""`.
+    :type menu_bar_item_additional_qss: Optional[str]
+
+    :param menu_bar_item_hover_bg_color: The background hover color of menu bar items (the menus). Defaults to `""`.
+    :type menu_bar_item_hover_bg_color: Optional[str]
+
+    :param menu_bar_item_hover_additional_qss: Additional QSS for menu bar items hover. Defaults to `""`.
+    :type menu_bar_item_hover_additional_qss: Optional[str]
+
+    :param menu_bar_dropdown_font: The font family for the dropdowns of the menus. Defaults to the same font as `menu_bar_font`.
+    :type menu_bar_dropdown_font: Optional[str].
+
+    :param menu_bar_dropdown_additional_qss: Additional QSS for the actual dropdown area of the menu items. Defaults to `""`.
+    :type menu_bar_dropdown_additional_qss: Optional[str]
+
+    :param menu_bar_dropdown_item_padding: The padding for the dropdown items. Defaults to `"3px 10px"`.
+    :type menu_bar_dropdown_item_padding: Optional[str]
+
+    :param menu_bar_dropdown_item_bg_color: The background color for the dropdown items. Defaults to `""`.
+    :type menu_bar_dropdown_item_bg_color: Optional[str]
+
+    :param menu_bar_dropdown_item_additional_qss: Additional QSS for the dropdown items. Defaults to `""`.
+    :type menu_bar_dropdown_item_additional_qss: Optional[str]
+
+    :param menu_bar_dropdown_item_hover_bg_color: The background color of the dropdown items upon hover. Defaults to `""`.
+    :type menu_bar_dropdown_item_hover_bg_color: Optional[str]
+
+    :param menu_bar_dropdown_item_hover_additional_qss: Additional QSS for the dropdown items upon hover. Defaults to `""`.
+    :type menu_bar_dropdown_item_hover_additional_qss: Optional[str]
+
+    """
+
+    # Parameters (besides the `TitleBarTheme` ones) that `update_style` can change.
+    LAYOUT_FIELDS = (
+        "title_bar_top_padding",
+        "title_bar_bottom_padding",
+        "title_bar_left_padding",
+        "title_bar_right_padding",
+        "title_bar_to_menu_bar_padding",
+    )
+
+    # Components styled with the square-cornered theme on the opaque render path.
+    FRAME_COMPONENTS = ("central", "container")
+
+    # Root events that can mean the root's central widget or layout has been set.
+    ROOT_INIT_EVENTS = (
+        QEvent.Type.ChildAdded,
+        QEvent.Type.LayoutRequest,
+        QEvent.Type.Polish,
+    )
+
+    def __init__(
+        self,
+        root: QWidget | QMainWindow,
+        # title bar params
+        root_bg_color=None,
+        title_bar_bg_color="",
+        stick_to_sides=True,
+        root_border_radius=10,
+        title_bar_bottom_padding=0,
+        title_bar_right_padding=12,
+        title_bar_left_padding=6,
+        title_bar_top_padding=10,
+        title_bar_to_menu_bar_padding=5,
+        stick_to_windows: Optional[bool] = False,
+        window_stick_threshold: Optional[int] = 10,
+        coalesce_drag_moves: Optional[bool] = False,
+        drag_mode: Optional[str] = "live",
+        animate_window_state: Optional[bool] = False,
+        window_state_animation_duration: Optional[int] = 150,
+        maximize_on_double_click: Optional[bool] = True,
+        command_palette_shortcut: Optional[str] = None,
+        theme: Optional["TitleBarTheme"] = None,
+        config: Optional[TitleBarConfig] = None,
+        lazy_init: Optional[bool] = False,
+        resizable: Optional[bool] = False,
+        resize_margin: Optional[int] = 5,
+        resize_preview: Optional[bool] = False,
+        # btn params
+        btn_to_title_margin: Optional[int] = 10,
+        close_btn_default_img_path: Optional[str] = None,
+        min_btn_default_img_path: Optional[str] = None,
+        max_btn_default_img_path: Optional[str] = None,
+        normal_btn_default_img_path: Optional[str] = None,
+        disabled_btns_on_focus_out: Optional[bool] = True,
+        disabled_btn_img_path: Optional[str] = None,
+        btn_size: Optional[tuple[int, int]] = (12, 12),
+        change_btns_on_hover: Optional[bool] = False,
+        use_icon_modes: Optional[bool] = False,
+        change_cursor_on_btn_hover: Optional[bool] = False,
+        btn_hover_cursor_shape: Optional[Qt.CursorShape] = None,
+        close_btn_hover_img_path: Optional[str] = None,
+        min_btn_hover_img_path: Optional[str] = None,
+        max_btn_hover_img_path: Optional[str] = None,
+        normal_btn_hover_img_path: Optional[str] = None,
+        # text params
+        title_bar_text_title_text: Optional[str] = "",
+        title_bar_text_bg_color: Optional[str] = None,
+        title_bar_text_font_size: Optional[str] = "15px",
+        title_bar_text_font_color: Optional[str] = "#fff",
+        title_bar_text_font: Optional[str] = "arial",
+        title_bar_text_font_weight: Optional[str] = "bold",
+        title_bar_text_additional_qss: Optional[str] = "",
+        # menu params
+        menu_bar_border: Optional[str] = "0px solid black",
+        menu_bar_bg_color: Optional[str] = "",
+        menu_bar_border_radius: Optional[str] = "0px",
+        menu_bar_padding: Optional[str] = "0px",
+        menu_bar_font: Optional[str] = "arial",
+        menu_bar_font_color: Optional[str] = "#fff",
+        menu_bar_font_size: Optional[str] = "14px",
+        menu_bar_additional_qss: Optional[str] = "",
+        menu_bar_item_bg_color: Optional[str] = "",
+        menu_bar_item_additional_qss: Optional[str] = "",
+        menu_bar_item_hover_bg_color: Optional[str] = "",
+        menu_bar_item_hover_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_font: Optional[str] = None,
+        menu_bar_dropdown_item_padding: Optional[str] = "3px 10px",
+        menu_bar_dropdown_item_bg_color: Optional[str] = "",
+        menu_bar_dropdown_item_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_item_hover_bg_color: Optional[str] = "",
+        menu_bar_dropdown_item_hover_additional_qss: Optional[str] = "",
+    ):
+        super().__init__()
+        self.root = root
+        if config is None:
+            config = TitleBarConfig(
+                stick_to_sides=stick_to_sides,
+                title_bar_bottom_padding=title_bar_bottom_padding,
+                title_bar_right_padding=title_bar_right_padding,
+                title_bar_left_padding=title_bar_left_padding,
+                title_bar_top_padding=title_bar_top_padding,
+                title_bar_to_menu_bar_padding=title_bar_to_menu_bar_padding,
+                stick_to_windows=stick_to_windows,
+                window_stick_threshold=window_stick_threshold,
+                coalesce_drag_moves=coalesce_drag_moves,
+                drag_mode=drag_mode,
+                animate_window_state=animate_window_state,
+                window_state_animation_duration=window_state_animation_duration,
+                maximize_on_double_click=maximize_on_double_click,
+                command_palette_shortcut=command_palette_shortcut,
+                lazy_init=lazy_init,
+                resizable=resizable,
+                resize_margin=resize_margin,
+                resize_preview=resize_preview,
+                btn_to_title_margin=btn_to_title_margin,
+                close_btn_default_img_path=close_btn_default_img_path,
+                min_btn_default_img_path=min_btn_default_img_path,
+                max_btn_default_img_path=max_btn_default_img_path,
+                normal_btn_default_img_path=normal_btn_default_img_path,
+                disabled_btns_on_focus_out=disabled_btns_on_focus_out,
+                disabled_btn_img_path=disabled_btn_img_path,
+                btn_size=btn_size,
+                change_btns_on_hover=change_btns_on_hover,
+                use_icon_modes=use_icon_modes,
+                change_cursor_on_btn_hover=change_cursor_on_btn_hover,
+                btn_hover_cursor_shape=btn_hover_cursor_shape,
+                close_btn_hover_img_path=close_btn_hover_img_path,
+                min_btn_hover_img_path=min_btn_hover_img_path,
+                max_btn_hover_img_path=max_btn_hover_img_path,
+                normal_btn_hover_img_path=normal_btn_hover_img_path,
+            )
+        self.config = config.interned()
+        self.title_bar_text_title_text = title_bar_text_title_text
+        self.coalesced_drag_events = 0
+        self.drag_move_coalescer = (
+            FrameCoalescer(callback=self._apply_drag_move, parent=self)
+            if self.config.coalesce_drag_moves
+            else None
+        )
+        self.drag_ghost: Optional[DragGhost] = None
+        # Set by `trace_drags`.
+        self.drag_tracer: Optional[DragTracer] = None
+        # Where the window is shown to be (by the ghost) during a deferred drag.
+        self._ghost_pos: Optional[QPoint] = None
+
+        if theme is None:
+            theme = TitleBarTheme(
+                root_bg_color=root_bg_color,
+                title_bar_bg_color=title_bar_bg_color,
+                root_border_radius=root_border_radius,
+                title_bar_text_bg_color=title_bar_text_bg_color,
+                title_bar_text_font_size=title_bar_text_font_size,
+                title_bar_text_font_color=title_bar_text_font_color,
+                title_bar_text_font=title_bar_text_font,
+                title_bar_text_font_weight=title_bar_text_font_weight,
+                title_bar_text_additional_qss=title_bar_text_additional_qss,
+                menu_bar_border=menu_bar_border,
+                menu_bar_bg_color=menu_bar_bg_color,
+                menu_bar_border_radius=menu_bar_border_radius,
+                menu_bar_padding=menu_bar_padding,
+                menu_bar_font=menu_bar_font,
+                menu_bar_font_color=menu_bar_font_color,
+                menu_bar_font_size=menu_bar_font_size,
+                menu_bar_additional_qss=menu_bar_additional_qss,
+                menu_bar_item_bg_color=menu_bar_item_bg_color,
+                menu_bar_item_additional_qss=menu_bar_item_additional_qss,
+                menu_bar_item_hover_bg_color=menu_bar_item_hover_bg_color,
+                menu_bar_item_hover_additional_qss=menu_bar_item_hover_additional_qss,
+                menu_bar_dropdown_additional_qss=menu_bar_dropdown_additional_qss,
+                menu_bar_dropdown_font=menu_bar_dropdown_font,
+                menu_bar_dropdown_item_padding=menu_bar_dropdown_item_padding,
+                menu_bar_dropdown_item_bg_color=menu_bar_dropdown_item_bg_color,
+                menu_bar_dropdown_item_additional_qss=menu_bar_dropdown_item_additional_qss,
+                menu_bar_dropdown_item_hover_bg_color=menu_bar_dropdown_item_hover_bg_color,
+                menu_bar_dropdown_item_hover_additional_qss=menu_bar_dropdown_item_hover_additional_qss,
+            )
+        self.theme = theme
+        self._lazy_init_pending = False
+        # Whether the opaque render path is in use (see `_update_render_path`); set once initialized.
+        self.opaque: Optional[bool] = None
+        self.resizer: Optional[WindowResizer] = None
+        self._pending_menus: list[QMenu] = []
+        # Set while waiting for the root's central widget or layout (see `_wait_for_root`).
+        self._root_check: Optional[Callable[[QEvent], None]] = None
+        # Created by the first `show_command_palette`.
+        self.action_index: Optional[ActionIndex] = None
+        self.command_palette: Optional[CommandPalette] = None
+        self._command_palette_shortcut: Optional[QShortcut] = None
+
+        if isinstance(root, QMainWindow):
+            self.is_QMainWindow = True
+            if not root.centralWidget():
+                self._check_central_widget(root)
+            else:
+                self.central_layout_or_widget = root.centralWidget()
+                self._initialize(root=root)
+        else:
+            self.is_QMainWindow = False
+            if not root.layout():
+                self._check_main_layout(root)
+            else:
+                root.setContentsMargins(0, 0, 0, 0)
+                root.layout().setContentsMargins(0, 0, 0, 0)
+                self.central_layout_or_widget = root.layout().itemAt(0).widget()
+                self._initialize(root=root)
+
+    def __getattr__(self, name: str):
+        # The settings are read from the shared config and theme rather than stored on every title bar.
+        if name in TitleBarConfig.field_names():
+            return getattr(self.config, name)
+        if name in TitleBarTheme.STYLE_FIELDS:
+            return getattr(self.theme, name)
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    # Init content
+    def _initialize(self, root):
+
+        self._get_screen_limits()
+        if self.config.stick_to_windows:
+            window_edge_index.add_window(root.window())
+
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+        self.central_layout_or_widget.setObjectName("central-widget-tag")
+
+        root.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint | Qt.WindowType.NoDropShadowWindowHint
+        )
+        # The central widget paints the whole window, so the root needn't fill its background first.
+        root.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+        self._update_render_path()
+        RootEventFilter.for_root(root).add_handler(
+            QEvent.Type.WindowStateChange, self._update_render_path
+        )
+        if self.config.resizable:
+            self.resizer = WindowResizer(
+                root.window(),
+                margin=self.config.resize_margin,
+                preview=self.config.resize_preview,
+            )
+        if self.config.command_palette_shortcut:
+            self._command_palette_shortcut = QShortcut(
+                QKeySequence(self.config.command_palette_shortcut), root.window()
+            )
+            self._command_palette_shortcut.activated.connect(self.show_command_palette)
+        self.central_layout_or_widget.layout().setContentsMargins(0, 0, 0, 0)
+        self.central_layout_or_widget.setContentsMargins(0, 0, 0, 0)
+        self._lazy_init_pending = self.config.lazy_init
+        if not self.config.lazy_init:
+            self._frame_theme().style_widget(self.central_layout_or_widget, "central")
+
+        # Layout to hold container
+        master_layout = QVBoxLayout(self)
+        master_layout.setSpacing(0)
+        master_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Container to hold content
+        title_bar_container = QWidget(self)
+        title_bar_container.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        master_layout.addWidget(title_bar_container)
+        if not self.config.lazy_init:
+            self._frame_theme().style_widget(title_bar_container, "container")
+        self.title_bar_container = title_bar_container
+
+        # Container layout
+        container_layout = QVBoxLayout(title_bar_container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.setSpacing(0)
+
+        # Title bar layout
+        title_bar_layout = QHBoxLayout()
+        title_bar_layout.setAlignment(Qt.AlignLeft)
+
+        container_layout.addLayout(title_bar_layout)
+        self.title_bar_layout = title_bar_layout
+        self._apply_paddings()
+
+        self.title_btns = TitleBtns(
+            root=self.root,
+            theme=self.theme,
+            config=self.config,
+        )
+        title_bar_layout.addWidget(self.title_btns)
+        self.title_text = TitleText(
+            title_bar_text_title_text=self.title_bar_text_title_text,
+            theme=self.theme,
+            lazy_init=self.config.lazy_init,
+        )
+        title_bar_layout.addWidget(self.title_text)
+
+        self.container_layout = container_layout
+        self.menu_bar = None
+        if not self.config.lazy_init or self._pending_menus:
+            self._create_menu_bar()
+        for menu in self._pending_menus:
+            self.menu_bar.add_menu_item(menu=menu)
+        self._pending_menus.clear()
+
+        if self.isVisible():
+            # The root was only set up after being shown.
+            self.finish_lazy_init()
+
+    def _create_menu_bar(self):
+        self.menu_bar = TitleMenuBar(theme=self.theme, lazy_init=self._lazy_init_pending)
+        self.container_layout.addWidget(self.menu_bar)
+        if self.action_index is not None:
+            self.action_index.watch(self.menu_bar)
+
+    def event(self, event: QEvent) -> bool:
+        if event.type() == QEvent.Type.Polish:
+            # Sent while the window is first shown, before its layout is activated and anything is painted.
+            self.finish_lazy_init()
+        return super().event(event)
+
+    def showEvent(self, event):
+        self.finish_lazy_init()
+        super().showEvent(event)
+
+    def finish_lazy_init(self):
+        """
+        Loads the button icons and applies the stylesheets that were deferred by `lazy_init`, all in one pass. Called automatically when the title bar is first shown (once it is polished, so the window is laid out with the final styles); does nothing if there is nothing left to do.
+        """
+        if not self._lazy_init_pending:
+            return
+        self._lazy_init_pending = False
+        frame_theme = self._frame_theme()
+        frame_theme.style_widget(self.central_layout_or_widget, "central")
+        frame_theme.style_widget(self.title_bar_container, "container")
+        for widget in (self.title_btns, self.title_text, self.menu_bar):
+            if widget is not None:
+                widget.theme = self.theme
+                widget.finish_lazy_init()
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.location = event.position().toPoint()
+            self._get_screen_limits()
+            cur_x = self.root.window().x()
+            self.starts_off_screen_left = (
+                True if cur_x < self.screen_geo_left else False
+            )
+            self.starts_off_screen_right = (
+                True
+                if (cur_x + self.root.window().width()) > self.screen_geo_right
+                else False
+            )
+            if self.drag_move_coalescer is not None:
+                self.drag_move_coalescer.reset_counters()
+            if self.drag_tracer is not None:
+                self.drag_tracer.begin(frame_interval(self.root.window()))
+
+        super().mousePressEvent(event)
+        event.accept()
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        start = perf_counter_ns() if probes.enabled else 0
+        if (
+            self.location is not None
+            and self.config.drag_mode != "live"
+            and self._ghost_pos is None
+        ):
+            self._start_ghost_drag()
+        window_pos = self._drag_window_pos()
+        self.previous_x = window_pos.x()
+
+        if self.location is not None:
+            if self.drag_tracer is not None:
+                self.drag_tracer.event(event.timestamp())
+
+            cur_x = window_pos.x()
+            if (cur_x > self.screen_geo_left) and self.starts_off_screen_left:
+                self.starts_off_screen_left = False
+            elif (
+                (cur_x + self.root.window().width()) < self.screen_geo_right
+            ) and self.starts_off_screen_right:
+                self.starts_off_screen_right = False
+
+            diff = self._drag_local_pos(event) - self.location
+            new_x = cur_x + diff.x()
+            new_y = window_pos.y() + diff.y()
+
+            if (
+                (self.config.stick_to_sides)
+                and (not self.starts_off_screen_left)
+                and (not self.starts_off_screen_right)
+            ):
+                new_x = self._check_stick(new_x)
+
+            if self.config.stick_to_windows:
+                new_x, new_y = window_edge_index.snap(
+                    self.root.window(), new_x, new_y, self.config.window_stick_threshold
+                )
+
+            if self._ghost_pos is not None:
+                self._ghost_pos = QPoint(new_x, new_y)
+            if self.drag_move_coalescer is not None:
+                self.drag_move_coalescer.submit((new_x, new_y))
+            else:
+                self._apply_drag_move((new_x, new_y))
+
+        super().mouseMoveEvent(event)
+        event.accept()
+        if start:
+            probes.record("mouseMoveEvent", self.root.window(), start)
+
+    def _check_stick(self, new_x):
+        start = perf_counter_ns() if probes.enabled else 0
+        window = self.root.window()
+        window_width = window.width()
+        window_right_side = window_width + new_x
+        window_top = self._drag_window_pos().y()
+        window_bottom = window_top + window.height()
+
+        # Left side
+        if new_x < self.previous_x:  # mouse is moving leftwards
+            screen_left = screen_edge_index.next_left_edge(
+                new_x, window_top, window_bottom
+            )
+            if screen_left is not None:
+                if screen_left - self.stick_threshold < new_x < screen_left:
+                    new_x = screen_left
+                elif new_x <= screen_left - self.stick_threshold:
+                    new_x += self.stick_threshold
+
+        # Right side
+        if new_x > self.previous_x:  # mouse if moving rightwards
+            screen_right = screen_edge_index.previous_right_edge(
+                window_right_side, window_top, window_bottom
+            )
+            if screen_right is not None:
+                if screen_right + self.stick_threshold > window_right_side > screen_right:
+                    new_x = screen_right - window_width
+                elif window_right_side >= screen_right + self.stick_threshold:
+                    new_x -= self.stick_threshold
+
+        if start:
+            probes.record("_check_stick", window, start)
+        return new_x
+
+    def _apply_drag_move(self, pos: tuple[int, int]):
+        """Moves the root window (or its ghost, during a deferred drag) to the latest drag position, possibly handed over by `drag_move_coalescer`."""
+        start = perf_counter_ns() if probes.enabled else 0
+        if self._ghost_pos is not None:
+            self.drag_ghost.move(*pos)
+        else:
+            self.root.window().move(*pos)
+        if start:
+            probes.record("move", self.root.window(), start)
+        if self.drag_tracer is not None:
+            self.drag_tracer.moved()
+
+    def _drag_window_pos(self) -> QPoint:
+        """Gives the position the dragged window is at, or is shown at by the ghost during a deferred drag."""
+        if self._ghost_pos is not None:
+            return self._ghost_pos
+        return self.root.window().pos()
+
+    def _drag_local_pos(self, event: QMouseEvent) -> QPoint:
+        """Gives the mouse position relative to the title bar as if the window had moved along with the ghost."""
+        if self._ghost_pos is None:
+            return event.position().toPoint()
+        window = self.root.window()
+        return (
+            event.globalPosition().toPoint()
+            - self._ghost_pos
+            - self.mapTo(window, QPoint(0, 0))
+        )
+
+    def _start_ghost_drag(self):
+        """Shows the ghost over the window and freezes the window's updates until the drag ends."""
+        window = self.root.window()
+        if self.drag_ghost is None:
+            self.drag_ghost = DragGhost(self.config.drag_mode)
+            # The ghost is a top-level widget, so it isn't deleted along with the title bar.
+            connect_slot(self, "destroyed()", self.drag_ghost, "deleteLater()")
+        self.drag_ghost.start(window)
+        self._ghost_pos = window.pos()
+        self._window_updates_enabled = window.updatesEnabled()
+        window.setUpdatesEnabled(False)
+
+    def _finish_ghost_drag(self):
+        """Hides the ghost and moves the window to where it was dropped, in a single move."""
+        window = self.root.window()
+        pos = self._ghost_pos
+        self._ghost_pos = None
+        self.drag_ghost.finish()
+        window.setUpdatesEnabled(self._window_updates_enabled)
+        if pos != window.pos():
+            start = perf_counter_ns() if probes.enabled else 0
+            window.move(pos)
+            if start:
+                probes.record("move", window, start)
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        self.location = None
+        if self.drag_move_coalescer is not None:
+            self.drag_move_coalescer.flush()
+            self.coalesced_drag_events = self.drag_move_coalescer.coalesced
+        if self._ghost_pos is not None:
+            self._finish_ghost_drag()
+        if self.drag_tracer is not None:
+            self.drag_tracer.end()
+        super().mouseReleaseEvent(event)
+        event.accept()
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        if (
+            self.config.maximize_on_double_click
+            and event.button() == Qt.MouseButton.LeftButton
+        ):
+            self.toggle_maximized()
+            event.accept()
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def toggle_maximized(self):
+        """Maximizes the root window, or restores it if it is maximized (animated if `animate_window_state` is set)."""
+        window = self.root.window()
+        if self.config.animate_window_state:
+            animator = WindowStateAnimator.for_window(
+                window, duration=self.config.window_state_animation_duration
+            )
+            if animator.target_state & Qt.WindowState.WindowMaximized:
+                animator.show_normal()
+            else:
+                animator.show_maximized()
+        elif window.windowState() & Qt.WindowState.WindowMaximized:
+            window.showNormal()
+        else:
+            window.showMaximized()
+
+    def show_command_palette(self):
+        """
+        Opens the command palette over the window: a search field listing the actions of the title bar's menus (and their submenus) that match the typed text, the chosen one being triggered. See `CommandPalette`.
+
+        The actions are indexed (see `ActionIndex`) when the palette is first opened; after that, the index follows the changes of the menus, so opening the palette and typing don't walk the menus again.
+        """
+        window = self.root.window()
+        if self.command_palette is None:
+            self.action_index = ActionIndex(parent=self)
+            if getattr(self, "menu_bar", None) is not None:
+                self.action_index.watch(self.menu_bar)
+            self.command_palette = CommandPalette(self.action_index, parent=window)
+        self.command_palette.popup(window)
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Gives a snapshot of the instrumentation counters of the title bar's window: for each probed call (`mouseMoveEvent`, `_check_stick`, `move`, `setIcon`, `setStyleSheet`, `set_window_active`), its `count`, `total_ms`, `mean_us` and `max_us`. Empty unless `instrumentation.enable()` was called; see `Instrumentation`.
+        """
+        from .instrumentation import instrumentation
+
+        return instrumentation.stats(self.root.window())
+
+    def trace_drags(
+        self, callback: Optional[Callable[[DragSummary], None]] = None
+    ) -> DragTracer:
+        """
+        Starts measuring the input-to-move latency and the dropped frames of the window's drags, replacing any previous tracer. Set `drag_tracer` back to `None` to stop.
+
+        :param callback: Called with the `DragSummary` of every finished drag. Defaults to `None` (the summary is logged instead).
+        :type callback: Optional[Callable[[DragSummary], None]]
+
+        :return: The tracer, whose `last_summary` is the summary of the latest drag.
+        :rtype: DragTracer
+        """
+        self.drag_tracer = DragTracer(callback)
+        return self.drag_tracer
+
+    def _get_screen_limits(self):
+        """Gets the limits of the screen the root window is on in order to implement sticking."""
+        self.previous_x = self.root.window().pos().x()
+
+        self.screen_geo = screen_edge_index.screen_geometry_at(
+            self.root.window().geometry().center()
+        )
+        self.screen_geo_left = self.screen_geo.left()
+        self.screen_geo_right = self.screen_geo.right()
+        self.screen_geo_top = self.screen_geo.top()
+        self.screen_geo_bottom = self.screen_geo.bottom()
+
+        self.stick_threshold = 30
+        self.stick_threshold_left = self.screen_geo_left - self.stick_threshold
+        self.stick_threshold_right = self.stick_threshold + self.screen_geo_right
+
+    def update_style(self, **changes):
+        """
+        Changes the colors, fonts, additional QSS and/or paddings of the title bar without rebuilding it.
+
+        The changes are diffed against the current values, and only the sub-widgets whose stylesheet actually changes (central widget, title bar container, buttons, `TitleText`, `TitleMenuBar`) are restyled, all within a single updates-disabled batch on the root window, so it repaints once.
+
+        :param changes: Any of the styling parameters of `TitleBarTheme`, plus `title_bar_top_padding`, `title_bar_bottom_padding`, `title_bar_left_padding`, `title_bar_right_padding` and `title_bar_to_menu_bar_padding`.
+        """
+        unknown = set(changes) - set(TitleBarTheme.STYLE_FIELDS) - set(self.LAYOUT_FIELDS)
+        if unknown:
+            raise TypeError(
+                f"update_style() got unexpected keyword arguments: {', '.join(sorted(unknown))}"
+            )
+
+        theme_changes = {
+            name: value
+            for name, value in changes.items()
+            if name in TitleBarTheme.STYLE_FIELDS
+        }
+        layout_changes = {
+            name: value for name, value in changes.items() if name in self.LAYOUT_FIELDS
+        }
+        theme = self.theme.replace(**theme_changes) if theme_changes else self.theme
+        self._restyle(theme, layout_changes)
+
+    def set_theme(self, theme: "TitleBarTheme"):
+        """
+        Swaps the title bar's theme (e.g. to toggle between a dark and a light theme), restyling only the sub-widgets whose stylesheet differs. See `update_style`.
+
+        :param theme: The new theme.
+        :type theme: TitleBarTheme
+        """
+        self._restyle(theme, {})
+
+    def _restyle(self, theme: "TitleBarTheme", layout_changes: dict):
+        """Applies `theme` and `layout_changes` to the sub-widgets whose styling changed, in one batch."""
+        old_stylesheets = self.theme.stylesheets
+        new_stylesheets = theme.stylesheets
+        changed_components = [
+            component
+            for component in TitleBarTheme.COMPONENTS
+            if new_stylesheets[component] != old_stylesheets[component]
+        ]
+        layout_changes = {
+            name: value
+            for name, value in layout_changes.items()
+            if getattr(self.config, name) != value
+        }
+
+        self.theme = theme
+        if layout_changes:
+            self.config = self.config.replace(**layout_changes)
+
+        if not hasattr(self, "title_bar_container"):
+            # Not initialized yet; the new values are picked up by `_initialize`.
+            return
+        if self._lazy_init_pending:
+            # Not styled yet; the new theme is picked up by `finish_lazy_init`.
+            if layout_changes:
+                self._apply_paddings()
+            self._update_render_path()
+            return
+        if not changed_components and not layout_changes:
+            return
+
+        window = self.root.window()
+        updates_enabled = window.updatesEnabled()
+        window.setUpdatesEnabled(False)
+        try:
+            widgets = {
+                "central": self.central_layout_or_widget,
+                "container": self.title_bar_container,
+                "btns": self.title_btns,
+                "text": self.title_text,
+                "menu": self.menu_bar,
+            }
+            for widget in widgets.values():
+                if widget is not None and widget is not self.central_layout_or_widget:
+                    widget.theme = theme
+            frame_theme = self._frame_theme()
+            for component in changed_components:
+                if widgets[component] is not None:
+                    component_theme = (
+                        frame_theme if component in self.FRAME_COMPONENTS else theme
+                    )
+                    component_theme.style_widget(widgets[component], component)
+            if "menu" in changed_components and self.menu_bar is not None:
+                for action in self.menu_bar.actions():
+                    if action.menu() is not None:
+                        theme.tag_menu(action.menu())
+
+            if layout_changes:
+                self._apply_paddings()
+            # A change of `root_border_radius` to or from 0 switches the render path.
+            self._update_render_path()
+        finally:
+            window.setUpdatesEnabled(updates_enabled)
+
+    def _frame_theme(self) -> "TitleBarTheme":
+        """Gives the theme for the central widget and the title bar container, whose corners are square on the opaque render path."""
+        if self.opaque and self.theme.root_border_radius:
+            return self.theme.replace(root_border_radius=0)
+        return self.theme
+
+    def _update_render_path(self, _event: Optional[QEvent] = None):
+        """
+        Switches between the rounded render path and the opaque one (square corners, which paint every pixel of the window). The opaque path is used while the window is maximized or full screen, where the corners can't be seen anyway, when `root_border_radius` is 0, and when the window isn't translucent.
+
+        Rounded corners need a translucent window, but Qt only applies `WA_TranslucentBackground` when the native window is created, so it is only set (to whether `root_border_radius` isn't 0) until then, i.e. before the window is first shown. Afterwards, only the corners are switched.
+        """
+        if not self.root.testAttribute(Qt.WidgetAttribute.WA_WState_Created):
+            self.root.setAttribute(
+                Qt.WidgetAttribute.WA_TranslucentBackground,
+                self.theme.root_border_radius != 0,
+            )
+        opaque = (
+            self.theme.root_border_radius == 0
+            or not self.root.testAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+            or bool(
+                self.root.window().windowState()
+                & (Qt.WindowState.WindowMaximized | Qt.WindowState.WindowFullScreen)
+            )
+        )
+        if opaque == self.opaque:
+            return
+        self.opaque = opaque
+        if hasattr(self, "title_bar_container") and not self._lazy_init_pending:
+            frame_theme = self._frame_theme()
+            frame_theme.style_widget(self.central_layout_or_widget, "central")
+            frame_theme.style_widget(self.title_bar_container, "container")
+
+    def _apply_paddings(self):
+        self.title_bar_container.setContentsMargins(
+            self.config.title_bar_left_padding,
+            self.config.title_bar_top_padding,
+            self.config.title_bar_right_padding,
+            self.config.title_bar_bottom_padding,
+        )
+        self.title_bar_layout.setContentsMargins(
+            self.config.btn_size[0] // 2, 0, 0, self.config.title_bar_to_menu_bar_padding
+        )
+
+    def set_title(self, title: str):
+        """
+        Changes the title shown in the title bar. Safe to call from any thread and many times per second (e.g. for live progress): updates are coalesced to at most one per display frame, long titles are elided to the free width, and nothing is repainted if the visible text stays the same. See `TitleText.set_title`.
+
+        :param title: The new title.
+        :type title: str
+        """
+        self.title_bar_text_title_text = title
+        if hasattr(self, "title_text"):
+            self.title_text.set_title(title)
+
+    def add_menu_item(self, menu: QMenu):
+        """
+        Adds a `QMenu` to the `QMenuBar` that's inside the `TitleMenuBar` of the `CustomTitleBar`.
+
+        :param menu: The menu to be added. The menu should already have all of its actions added beforehand; for menus with very many (or often changing) entries, use `add_lazy_menu` instead.
+        :type menu: QMenu
+        """
+        if not hasattr(self, "menu_bar"):
+            # The root's central widget/layout isn't set yet; added by `_initialize`.
+            self._pending_menus.append(menu)
+            return
+        if self.menu_bar is None:
+            self._create_menu_bar()
+        self.menu_bar.add_menu_item(menu=menu)
+
+    def add_lazy_menu(
+        self,
+        title: str,
+        provider: Callable[[], Iterable],
+        text: Optional[Callable[[Any], str]] = str,
+        visible_rows: Optional[int] = 20,
+    ) -> LazyMenu:
+        """
+        Adds a menu whose entries are pulled from `provider` when it is opened (and cached until `LazyMenu.invalidate` is called), and shown as a scrolling list instead of one `QAction` each. Meant for menus with thousands of entries, like recent files. Connect to the `entry_triggered` signal of the returned menu to handle the chosen entry.
+
+        :param title: The title of the menu.
+        :type title: str
+
+        :param provider: Called with no arguments to get the entries (a sequence or any iterable, e.g. a generator).
+        :type provider: Callable[[], Iterable]
+
+        :param text: Gives the text shown for an entry. Defaults to `str`.
+        :type text: Optional[Callable[[Any], str]]
+
+        :param visible_rows: The maximum number of entries shown at once. Defaults to `20`.
+        :type visible_rows: Optional[int]
+
+        :return: The added menu.
+        :rtype: LazyMenu
+        """
+        menu = LazyMenu(title, provider, text=text, visible_rows=visible_rows)
+        self.add_menu_item(menu)
+        return menu
+
+    def uninstall(self):
+        """
+        Removes the title bar's hooks from the root window: its handlers on the root's `RootEventFilter` (window state changes and pending initialization), the resize grips, the command palette shortcut and the tracking for `stick_to_windows`. Handlers other code registered on the same `RootEventFilter` are left alone. The title bar stays in place but no longer reacts to the root.
+        """
+        if self._root_check is not None:
+            self._stop_waiting_for_root(self._root_check)
+        event_filter = RootEventFilter.for_root(self.root)
+        event_filter.remove_handler(
+            QEvent.Type.WindowStateChange, self._update_render_path
+        )
+        title_btns = getattr(self, "title_btns", None)
+        if title_btns is not None:
+            title_btns.stop_monitoring_root()
+        if self.resizer is not None:
+            self.resizer.uninstall()
+            self.resizer = None
+        if self._command_palette_shortcut is not None:
+            self._command_palette_shortcut.deleteLater()
+            self._command_palette_shortcut = None
+        window_edge_index.remove_window(self.root.window())
+
+    def _check_central_widget(self, root):
+        """If the centralWidget of root has not been set yet, watch root's child and layout events to call the initialization of CustomTitleBar once it is (this way, it doesn't matter whether the user sets the central widget before or after creating a CustomTitleBar)"""
+
+        def check(_event):
+            if root.centralWidget() is not None:
+                self._stop_waiting_for_root(check)
+                self.central_layout_or_widget = root.centralWidget()
+                self._initialize(root=root)
+
+        self._wait_for_root(check)
+
+    def _check_main_layout(self, root):
+        """If the topmost layout of the root has not been set yet, watch root's child and layout events to call the initialization of CustomTitleBar once it is (this way, it doesn't matter whether the user sets the central widget before or after creating a CustomTitleBar)"""
+
+        def check(_event):
+            if root.layout() is not None:
+                self._stop_waiting_for_root(check)
+                self.central_layout_or_widget = root
+                self._initialize(root=root)
+
+        self._wait_for_root(check)
+
+    def _wait_for_root(self, check: Callable[[QEvent], None]):
+        """Calls `check` on the root's ChildAdded and LayoutRequest events, and on its Polish event (sent when it is first shown) as a last resort."""
+        self._root_check = check
+        event_filter = RootEventFilter.for_root(self.root)
+        for event_type in self.ROOT_INIT_EVENTS:
+            event_filter.add_handler(event_type, check)
+
+    def _stop_waiting_for_root(self, check: Callable[[QEvent], None]):
+        self._root_check = None
+        event_filter = RootEventFilter.for_root(self.root)
+        for event_type in self.ROOT_INIT_EVENTS:
+            event_filter.remove_handler(event_type, check)
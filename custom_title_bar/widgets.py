@@ -0,0 +1,803 @@
+from PySide6.QtWidgets import (
+    QWidget,
+    QMainWindow,
+    QHBoxLayout,
+    QLabel,
+    QSizePolicy,
+    QToolButton,
+    QStyle,
+    QStyleOption,
+    QMenuBar,
+    QMenu,
+)
+from PySide6.QtCore import Qt, QEvent, QPointF, QSize, Signal
+from PySide6.QtGui import QFontMetrics, QIcon, QPainter, QPixmap, QStaticText
+from threading import Lock, get_ident
+from time import perf_counter_ns
+from typing import Optional
+
+from .animation import WindowStateAnimator
+from .events import FrameCoalescer, RootEventFilter, connect_slot, focus_dispatcher
+from .icons import icon_cache, rasterize_icon, shape_cursor
+from .probes import probes
+from .config import TitleBarConfig
+from .theme import TitleBarTheme
+
+
+class TitleBtns(QWidget):
+
+    def __init__(
+        self,
+        root: QWidget | QMainWindow,
+        theme: Optional["TitleBarTheme"] = None,
+        config: Optional[TitleBarConfig] = None,
+        btn_to_title_margin: Optional[int] = 10,
+        close_btn_default_img_path: Optional[str] = None,
+        min_btn_default_img_path: Optional[str] = None,
+        max_btn_default_img_path: Optional[str] = None,
+        normal_btn_default_img_path: Optional[str] = None,
+        disabled_btns_on_focus_out: Optional[bool] = True,
+        disabled_btn_img_path: Optional[str] = None,
+        btn_size: Optional[tuple[int, int]] = (12, 12),
+        change_btns_on_hover: Optional[bool] = False,
+        use_icon_modes: Optional[bool] = False,
+        change_cursor_on_btn_hover: Optional[bool] = False,
+        btn_hover_cursor_shape: Optional[Qt.CursorShape] = None,
+        close_btn_hover_img_path: Optional[str] = None,
+        min_btn_hover_img_path: Optional[str] = None,
+        max_btn_hover_img_path: Optional[str] = None,
+        normal_btn_hover_img_path: Optional[str] = None,
+        lazy_init: Optional[bool] = False,
+    ):
+        """Initializes close, min, max, and normal title bar buttons and associated functionality.
+
+        :param root: The root window whose titlebar is being replaced.
+        :type root: QWidget | QMainWindow
+
+        :param theme: The theme whose stylesheet is applied to the buttons. Defaults to the default `TitleBarTheme`.
+        :type theme: Optional[TitleBarTheme]
+
+        :param config: The settings of the buttons. If given, it takes precedence over the individual parameters below. Defaults to a config built from them.
+        :type config: Optional[TitleBarConfig]
+
+        :param close_btn_default_img_path: Path to the image file being used for the default close button. If path is None, QStyle.StandardPixmap.SP_TitleBarCloseButton will be used. Defaults to None.
+        :type close_btn_default_img_path: Optional[str]
+
+        :param min_btn_default_img_path: Path to the image file being used for the default minimize button. If path is None, QStyle.StandardPixmap.SP_TitleBarMinButton will be used. Defaults to None.
+        :type min_btn_default_img_path: Optional[str]
+
+        :param max_btn_default_img_path: Path to the image file being used for the default maximize button. If path is None, QStyle.StandardPixmap.SP_TitleBarMaxButton will be used. Defaults to None.
+        :type max_btn_default_img_path: Optional[str]
+
+        :param normal_btn_default_img_path: Path to the image file being used for the default normal button. If path is None, QStyle.StandardPixmap.SP_TitleBarNormalButton will be used. Defaults to None.
+        :type normal_btn_hover_img_path: Optional[str]
+
+        :param disabled_btns_on_focus_out: Whether or not the appearance of the buttons should change to a disabled appearance upon focus out of the application. Defaults to True.
+        :type disable_btns_on_focus_out: Optional[bool]
+
+        :param disabled_btn_image_path: Path to the image file being used for the disabled buttons. If path is None, QStyle.StandardPixmap.SP_TitleBarMinButton will be used. Defaults to None.
+        :type disabled_btn_image_path: Optional[str]
+
+        :param btn_size: The width and height in pixels of the buttons. Defalts to (14, 14)
+        :type btn_size: Optional[tuple(int, int)]
+
+        :param change_btns_on_hover: Flag for whether buttons should change from default to hover variant on hover. If True, file paths for the hover variants must be given in addition to paths for the default variants. If False, only the default variants' paths must be specified. Defaults to False.
+        :type change_btns_on_hover: Optional[bool]
+
+        :param use_icon_modes: Flag for whether each button should get a single multi-mode QIcon, letting Qt pick the default, hover or disabled pixmap while painting instead of swapping icons from Python. Defaults to False.
+        :type use_icon_modes: Optional[bool]
+
+        :param change_cursor_on_btn_hover: Flag for whether the cursor should change when hovering over the buttons. Defaults to False.
+        :type change_cursor_on_btn_hover: Optional[bool]
+
+        :param btn_hover_cursor_shape: Specifies what cursor shape to use for button hovers. Defaults to Qt.CursorShape.PointingHandCursor.
+        :type btn_hover_cursor_shape: Optional[Qt.CursorShape]
+
+        :param close_btn_hover_img_path: Path to the image file being used for the hover close button. If path is None, QStyle.StandardPixmap.SP_TitleBarCloseButton will be used. Defaults to None.
+        :type normal_btn_hover_img_path: Optional[str]
+
+        :param min_btn_hover_img_path: Path to the image file being used for the hover min button. If path is None, QStyle.StandardPixmap.SP_TitleBarMinButton will be used. Defaults to None.
+        :type min_btn_hover_img_path: Optional[str]
+
+        :param max_btn_hover_img_path: Path to the image file being used for the hover max button. If path is None, QStyle.StandardPixmap.SP_TitleBarMaxButton will be used. Defaults to None.
+        :type max_btn_hover_img_path: Optional[str]
+
+        :param normal_btn_hover_img_path: Path to the image file being used for the hover normal button. If path is None, QStyle.StandardPixmap.SP_TitleBarNormalButton will be used. Defaults to None.
+        :type normal_btn_hover_img_path: Optional[str]
+
+        :param lazy_init: Whether loading the icons and applying the stylesheet should be left to a later `finish_lazy_init` call. Defaults to False.
+        :type lazy_init: Optional[bool]
+
+        """
+        super().__init__()
+
+        self.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+        if config is None:
+            config = TitleBarConfig(
+                btn_to_title_margin=btn_to_title_margin,
+                close_btn_default_img_path=close_btn_default_img_path,
+                min_btn_default_img_path=min_btn_default_img_path,
+                max_btn_default_img_path=max_btn_default_img_path,
+                normal_btn_default_img_path=normal_btn_default_img_path,
+                disabled_btns_on_focus_out=disabled_btns_on_focus_out,
+                disabled_btn_img_path=disabled_btn_img_path,
+                btn_size=btn_size,
+                change_btns_on_hover=change_btns_on_hover,
+                use_icon_modes=use_icon_modes,
+                change_cursor_on_btn_hover=change_cursor_on_btn_hover,
+                btn_hover_cursor_shape=btn_hover_cursor_shape,
+                close_btn_hover_img_path=close_btn_hover_img_path,
+                min_btn_hover_img_path=min_btn_hover_img_path,
+                max_btn_hover_img_path=max_btn_hover_img_path,
+                normal_btn_hover_img_path=normal_btn_hover_img_path,
+                lazy_init=lazy_init,
+            )
+        self.config = config.interned()
+        btn_size = self.config.btn_size
+
+        self.theme = theme if theme is not None else TitleBarTheme()
+        self.setContentsMargins(0, 0, 0, 0)
+
+        self.root = root
+        self.current_icons = None
+        self.window_active = True
+        self._lazy_init_pending = self.config.lazy_init
+        self._monitor_root_window_state_change()
+        self.setAttribute(Qt.WidgetAttribute.WA_Hover)
+
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, self.config.btn_to_title_margin, 0)
+        layout.setSpacing(6)
+        self.setLayout(layout)
+
+        self.close_btn = QToolButton()
+        self.min_btn = QToolButton()
+        self.max_btn = QToolButton()
+        self.normal_btn = QToolButton()
+
+        for btn in [self.close_btn, self.min_btn, self.max_btn, self.normal_btn]:
+            btn.setFixedSize(btn_size[0], btn_size[1])
+            # The icons are pre-rasterized at this size, so painting is a plain blit.
+            btn.setIconSize(QSize(btn_size[0], btn_size[1]))
+            btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            if self.config.change_btns_on_hover:
+                btn.setCursor(
+                    shape_cursor(
+                        self.config.btn_hover_cursor_shape
+                        or Qt.CursorShape.PointingHandCursor
+                    )
+                )
+            if self.config.use_icon_modes:
+                # QIcon's Active mode is only used for hovered auto-raise buttons.
+                btn.setAutoRaise(True)
+            layout.addWidget(btn)
+
+        self.normal_btn.setVisible(False)
+        if not self.config.lazy_init:
+            self._load_appearance()
+        self._add_btn_func()
+        if self.config.disabled_btns_on_focus_out:
+            self._monitor_root_focus()
+
+    def finish_lazy_init(self):
+        """
+        Loads the icons and applies the stylesheet if that was deferred with `lazy_init`.
+        """
+        if not self._lazy_init_pending:
+            return
+        self._lazy_init_pending = False
+        self._load_appearance()
+
+    def _load_appearance(self):
+        """
+        Applies the stylesheet, loads the icons and sets the ones matching the root window's activation.
+        """
+        self.theme.style_widget(self, "btns")
+        self._get_icons()
+        if self.config.use_icon_modes:
+            self._build_mode_icons()
+        self.set_window_active(self.window_active)
+
+    def enterEvent(self, event):
+        """
+        Adds to the enterEvent to trigger the `_set_hover_icons` method if change_btns_on_hover is True.
+        """
+        if self.config.change_btns_on_hover and not self.config.use_icon_modes:
+            self._set_hover_icons()
+        super().enterEvent(event)
+        event.accept()
+
+    def leaveEvent(self, event):
+        """
+        Adds to the leaveEvent to trigger the `_set_default_icons` method if change_btns_on_hover is True.
+        """
+        if self.config.change_btns_on_hover and not self.config.use_icon_modes:
+            self._set_default_icons()
+        super().leaveEvent(event)
+        event.accept()
+
+    def _get_icons(self):
+        """
+        Initalizes the button icon attributes with either the icon file path, or a default icon if no file path is provided. Icons are looked up in the process-wide `icon_cache`, so only the first title bar with a given configuration decodes them. The hover variants are only loaded if `change_btns_on_hover` is True (otherwise they are the default ones).
+        """
+        self.icon_close_btn_default = self._load_icon(
+            self.config.close_btn_default_img_path,
+            QStyle.StandardPixmap.SP_TitleBarCloseButton,
+        )
+        self.icon_min_btn_default = self._load_icon(
+            self.config.min_btn_default_img_path, QStyle.StandardPixmap.SP_TitleBarMinButton
+        )
+        self.icon_max_btn_default = self._load_icon(
+            self.config.max_btn_default_img_path, QStyle.StandardPixmap.SP_TitleBarMaxButton
+        )
+        self.icon_normal_btn_default = self._load_icon(
+            self.config.normal_btn_default_img_path,
+            QStyle.StandardPixmap.SP_TitleBarNormalButton,
+        )
+
+        if self.config.change_btns_on_hover:
+            self.icon_close_btn_hover = self._load_icon(
+                self.config.close_btn_hover_img_path,
+                QStyle.StandardPixmap.SP_TitleBarCloseButton,
+            )
+            self.icon_min_btn_hover = self._load_icon(
+                self.config.min_btn_hover_img_path, QStyle.StandardPixmap.SP_TitleBarMinButton
+            )
+            self.icon_max_btn_hover = self._load_icon(
+                self.config.max_btn_hover_img_path, QStyle.StandardPixmap.SP_TitleBarMaxButton
+            )
+            self.icon_normal_btn_hover = self._load_icon(
+                self.config.normal_btn_hover_img_path,
+                QStyle.StandardPixmap.SP_TitleBarNormalButton,
+            )
+        else:
+            self.icon_close_btn_hover = self.icon_close_btn_default
+            self.icon_min_btn_hover = self.icon_min_btn_default
+            self.icon_max_btn_hover = self.icon_max_btn_default
+            self.icon_normal_btn_hover = self.icon_normal_btn_default
+
+        self.icon_disabled = self._load_icon(
+            self.config.disabled_btn_img_path, QStyle.StandardPixmap.SP_TitleBarMinButton
+        )
+
+    def _load_icon(
+        self, path: Optional[str], standard_pixmap: QStyle.StandardPixmap
+    ) -> QPixmap:
+        """
+        Returns the (cached) pixmap for `path`, or the style's standard icon for `standard_pixmap` if `path` is `None`, rasterized at exactly `btn_size` times the device pixel ratio.
+        """
+        btn_size = self.config.btn_size
+        device_pixel_ratio = self.devicePixelRatioF()
+
+        if path is not None:
+            # Image files don't depend on the style, so they are shared across styles.
+            key = (path, btn_size, device_pixel_ratio, None)
+            return icon_cache.get(
+                key, lambda: rasterize_icon(path, btn_size, device_pixel_ratio)
+            )
+
+        style = self.style()
+        key = (standard_pixmap, btn_size, device_pixel_ratio, style.objectName())
+        return icon_cache.get(
+            key,
+            lambda: style.standardIcon(standard_pixmap).pixmap(
+                QSize(*btn_size), device_pixel_ratio
+            ),
+        )
+
+    def _set_default_icons(self):
+        """
+        Changes the buttons to have the default appearance.
+        """
+        if self.current_icons == "default":
+            return
+        self.current_icons = "default"
+        start = perf_counter_ns() if probes.enabled else 0
+        self.close_btn.setIcon(self.icon_close_btn_default)
+        self.min_btn.setIcon(self.icon_min_btn_default)
+        self.max_btn.setIcon(self.icon_max_btn_default)
+        self.normal_btn.setIcon(self.icon_normal_btn_default)
+        if start:
+            probes.record("setIcon", self.root.window(), start, count=4)
+
+    def _set_hover_icons(self):
+        """
+        Changes the buttons to have the hover appearance.
+        """
+        if self.current_icons == "hover":
+            return
+        self.current_icons = "hover"
+        start = perf_counter_ns() if probes.enabled else 0
+        self.close_btn.setIcon(self.icon_close_btn_hover)
+        self.min_btn.setIcon(self.icon_min_btn_hover)
+        self.max_btn.setIcon(self.icon_max_btn_hover)
+        self.normal_btn.setIcon(self.icon_normal_btn_hover)
+        if start:
+            probes.record("setIcon", self.root.window(), start, count=4)
+
+    def _set_disabled_icons(self):
+        """
+        Changes the buttons to have the disabled appearance.
+        """
+        if self.current_icons == "disabled":
+            return
+        self.current_icons = "disabled"
+        start = perf_counter_ns() if probes.enabled else 0
+        self.close_btn.setIcon(self.icon_disabled)
+        self.min_btn.setIcon(self.icon_disabled)
+        self.max_btn.setIcon(self.icon_disabled)
+        self.normal_btn.setIcon(self.icon_disabled)
+        if start:
+            probes.record("setIcon", self.root.window(), start, count=4)
+
+    def _build_mode_icons(self):
+        """
+        Builds, for every button, one multi-mode `QIcon` for when the root window is active and one for when it is inactive. The hover pixmap is used for the Active and Selected modes (if `change_btns_on_hover` is True) and the disabled pixmap for the Disabled mode. Like the pixmaps, the icons are shared through `icon_cache`.
+        """
+        self.mode_icons = {}
+        for name in ("close", "min", "max", "normal"):
+            default = getattr(self, f"icon_{name}_btn_default")
+            hover = (
+                getattr(self, f"icon_{name}_btn_hover")
+                if self.config.change_btns_on_hover
+                else None
+            )
+            for active in (True, False):
+                normal = default if active else self.icon_disabled
+                # The pixmaps come from `icon_cache` too, so their cache keys identify them.
+                key = (
+                    "mode-icon",
+                    normal.cacheKey(),
+                    (hover or normal).cacheKey(),
+                    self.icon_disabled.cacheKey(),
+                )
+                self.mode_icons[name, active] = icon_cache.get(
+                    key,
+                    lambda normal=normal, hover=hover: self._mode_icon(
+                        normal, hover or normal
+                    ),
+                )
+
+    def _mode_icon(self, normal: QPixmap, hover: QPixmap) -> QIcon:
+        icon = QIcon()
+        icon.addPixmap(normal, QIcon.Mode.Normal)
+        icon.addPixmap(hover, QIcon.Mode.Active)
+        icon.addPixmap(hover, QIcon.Mode.Selected)
+        icon.addPixmap(self.icon_disabled, QIcon.Mode.Disabled)
+        return icon
+
+    def _set_mode_icons(self, active: bool):
+        """
+        Sets the multi-mode icons for an active (or inactive) root window.
+        """
+        icons = "mode-active" if active else "mode-inactive"
+        if self.current_icons == icons:
+            return
+        self.current_icons = icons
+        start = perf_counter_ns() if probes.enabled else 0
+        self.close_btn.setIcon(self.mode_icons["close", active])
+        self.min_btn.setIcon(self.mode_icons["min", active])
+        self.max_btn.setIcon(self.mode_icons["max", active])
+        self.normal_btn.setIcon(self.mode_icons["normal", active])
+        if start:
+            probes.record("setIcon", self.root.window(), start, count=4)
+
+    def _add_btn_func(self):
+        """
+        Connects the functionality to the buttons.
+        """
+        connect_slot(self.close_btn, "clicked()", self.root, "close()")
+        if self.config.animate_window_state:
+            self.max_btn.clicked.connect(self._animate_maximize)
+            self.min_btn.clicked.connect(self._animate_minimize)
+            self.normal_btn.clicked.connect(self._animate_restore)
+        else:
+            connect_slot(self.max_btn, "clicked()", self.root, "showMaximized()")
+            connect_slot(self.min_btn, "clicked()", self.root, "showMinimized()")
+            connect_slot(self.normal_btn, "clicked()", self.root, "showNormal()")
+
+    def _window_state_animator(self) -> WindowStateAnimator:
+        return WindowStateAnimator.for_window(
+            self.root.window(), duration=self.config.window_state_animation_duration
+        )
+
+    def _animate_maximize(self):
+        self._window_state_animator().show_maximized()
+
+    def _animate_minimize(self):
+        self._window_state_animator().show_minimized()
+
+    def _animate_restore(self):
+        self._window_state_animator().show_normal()
+
+    def _monitor_root_window_state_change(self):
+        """
+        Monitors for changes in the root window's state (minimized, maximized, normal) through the root's `RootEventFilter`, calling the `adjust_btn_display` method on each change.
+        """
+        RootEventFilter.for_root(self.root).add_handler(
+            QEvent.Type.WindowStateChange, self.adjust_btn_display
+        )
+
+    def stop_monitoring_root(self):
+        """Stops the monitoring of the root window's state started by `_monitor_root_window_state_change`."""
+        RootEventFilter.for_root(self.root).remove_handler(
+            QEvent.Type.WindowStateChange, self.adjust_btn_display
+        )
+
+    def adjust_btn_display(self, _event: Optional[QEvent] = None):
+        """
+        Makes the normal button hidden and the maximize button visible if the root's window state is normal, and makes the normal button visible and the maximize button hidden if the root's window state is maximized.
+        """
+        if self.root.windowState() == Qt.WindowState.WindowMaximized:
+            self.normal_btn.setVisible(True)
+            self.max_btn.setVisible(False)
+        else:
+            self.normal_btn.setVisible(False)
+            self.max_btn.setVisible(True)
+
+    def _monitor_root_focus(self):
+        """
+        Registers the buttons with the process-wide `focus_dispatcher`, which calls `set_window_active` when the root window is activated or deactivated.
+        """
+        focus_dispatcher.register(self.root.window(), self)
+
+    def set_window_active(self, active: bool):
+        """
+        Sets the default icons if the root window became active, and the disabled icons if it became inactive.
+        """
+        self.window_active = active
+        if self._lazy_init_pending:
+            # Picked up by `finish_lazy_init`.
+            return
+        start = perf_counter_ns() if probes.enabled else 0
+        if self.config.use_icon_modes:
+            self._set_mode_icons(active)
+        elif active:
+            self._set_default_icons()
+        else:
+            self._set_disabled_icons()
+        if start:
+            probes.record("set_window_active", self.root.window(), start)
+
+
+class TitleText(QLabel):
+    """
+    The title of the window, shown next to the buttons.
+
+    The title can be changed at any rate and from any thread with `set_title`: updates are handed to the GUI thread and coalesced to at most one per display frame, so only the latest title is shown. The label is as wide as its title, like a plain `QLabel`; when the title bar leaves it less room, it shrinks and the title is elided to the width it gets. The font metrics and the laid-out text (a `QStaticText`) are cached, and the label is only repainted if the visible text changed.
+    """
+
+    # Emitted by `set_title` to hand the pending title over to the GUI thread.
+    _title_requested = Signal()
+
+    def __init__(
+        self,
+        title_bar_text_title_text: Optional[str] = "",
+        title_bar_text_bg_color: Optional[str] = None,
+        title_bar_text_font_size: Optional[str] = "15px",
+        title_bar_text_font_color: Optional[str] = "#fff",
+        title_bar_text_font: Optional[str] = "arial",
+        title_bar_text_font_weight: Optional[str] = "bold",
+        title_bar_text_additional_qss: Optional[str] = "",
+        theme: Optional["TitleBarTheme"] = None,
+        lazy_init: Optional[bool] = False,
+    ):
+        """
+        Initializes the title bar text.
+
+        :param title_bar_text_title_text: The text for title of the window. Defaults to "".
+        :type title_bar_text_title_text: Optional[str].
+        :param title_bar_text_bg_color: The background color for title of the window. Defaults to the same color as the title bar.
+        :type title_bar_text_bg_color: Optional[str].
+        :param title_bar_text_font_size: The font size for title of the window. Defaults to "15px".
+        :type title_bar_text_font_size: Optional[str].
+        :param title_bar_text_font_color: The font color for title of the window. Defaults to "#fff".
+        :type title_bar_text_font_color: Optional[str].
+        :param title_bar_text_font: The font for title of the window. Defaults to "arial".
+        :type title_bar_text_font: Optional[str].
+        :param title_bar_text_font_weight: The font weight for title of the window. Defaults to "bold".
+        :type title_bar_text_font_weight: Optional[str].
+        :param title_bar_text_additional_qss: The font weight for title of the window. Defaults to "bold".
+        :type title_bar_text_additional_qss: Optional[str].
+        :param theme: The theme whose title text stylesheet is applied. If given, it takes precedence over the other styling parameters. Defaults to a theme built from them.
+        :type theme: Optional[TitleBarTheme].
+        :param lazy_init: Whether applying the stylesheet should be left to a later `finish_lazy_init` call. Defaults to False.
+        :type lazy_init: Optional[bool].
+
+        """
+        super().__init__()
+        self.setAlignment(Qt.AlignVCenter)
+        # As wide as the title, but can be shrunk by the layout (see `minimumSizeHint`).
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self.setContentsMargins(0, 0, 0, 0)
+        # The stylesheet background is drawn by `paintEvent`, only behind the (elided) title.
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground)
+
+        self._title = title_bar_text_title_text or ""
+        self._static_text = QStaticText()
+        self._static_text.setTextFormat(Qt.TextFormat.PlainText)
+        self._metrics: Optional[QFontMetrics] = None
+        # (title, width) the static text was elided for.
+        self._elided_for: Optional[tuple[str, int]] = None
+        self._elided_width = 0
+        # Titles set from other threads wait here for the GUI thread (the one the label was created in).
+        self._gui_thread = get_ident()
+        self._pending_title: Optional[str] = None
+        self._pending_lock = Lock()
+        # Connected by the first `set_title` from another thread.
+        self._title_requested_connected = False
+        # Created by the first `set_title`.
+        self._title_coalescer: Optional[FrameCoalescer] = None
+
+        if theme is None:
+            theme = TitleBarTheme(
+                title_bar_text_bg_color=title_bar_text_bg_color,
+                title_bar_text_font_size=title_bar_text_font_size,
+                title_bar_text_font_color=title_bar_text_font_color,
+                title_bar_text_font=title_bar_text_font,
+                title_bar_text_font_weight=title_bar_text_font_weight,
+                title_bar_text_additional_qss=title_bar_text_additional_qss,
+            )
+        self.theme = theme
+        self._lazy_init_pending = lazy_init
+        if not lazy_init:
+            self.theme.style_widget(self, "text")
+
+    def finish_lazy_init(self):
+        """Applies the stylesheet if that was deferred with `lazy_init`."""
+        if not self._lazy_init_pending:
+            return
+        self._lazy_init_pending = False
+        self.theme.style_widget(self, "text")
+
+    def set_title(self, title: str):
+        """
+        Shows `title`. Safe to call from any thread and at any rate: the title is shown by the GUI thread at the latest at the end of the current display frame, and titles superseded before then are skipped.
+
+        :param title: The new title.
+        :type title: str
+        """
+        if get_ident() == self._gui_thread:
+            if self._pending_title is not None:
+                # Superseded by this title.
+                with self._pending_lock:
+                    self._pending_title = None
+            self._submit_title(title)
+            return
+        with self._pending_lock:
+            scheduled = self._pending_title is not None
+            self._pending_title = title
+            if not self._title_requested_connected:
+                self._title_requested.connect(self._take_pending_title)
+                self._title_requested_connected = True
+        if not scheduled:
+            # Queued to the GUI thread.
+            self._title_requested.emit()
+
+    def _take_pending_title(self):
+        with self._pending_lock:
+            title = self._pending_title
+            self._pending_title = None
+        if title is not None:
+            self._submit_title(title)
+
+    def _submit_title(self, title: str):
+        if self._title_coalescer is None:
+            self._title_coalescer = FrameCoalescer(callback=self.setText, parent=self)
+        self._title_coalescer.submit(title)
+
+    def text(self) -> str:
+        """Gives the full (not elided) title."""
+        return self._title
+
+    def setText(self, text: str):
+        """Shows `text` right away. Must be called from the GUI thread; see `set_title` otherwise."""
+        if text != self._title:
+            self._title = text
+            # The label is as wide as its title.
+            self.updateGeometry()
+        self._update_elided_text()
+
+    def _font_metrics(self) -> QFontMetrics:
+        if self._metrics is None:
+            self._metrics = QFontMetrics(self.font())
+        return self._metrics
+
+    def _text_size(self, text: str) -> QSize:
+        # Measured the way `QLabel` measures its text (including the indent it gives framed labels), so the label looks the same.
+        size = self._font_metrics().size(Qt.TextFlag.TextSingleLine, text)
+        if self.indent() < 0 and self.frameWidth() > 0:
+            size.setWidth(size.width() + self._font_metrics().horizontalAdvance("x"))
+        return size
+
+    def _update_elided_text(self):
+        """Elides the title to the label's width, repainting only if the visible text changed."""
+        width = self.contentsRect().width()
+        if (self._title, width) == self._elided_for:
+            return
+        self._elided_for = (self._title, width)
+        elided = self._font_metrics().elidedText(
+            self._title, Qt.TextElideMode.ElideRight, width
+        )
+        if elided == self._static_text.text():
+            return
+        self._static_text.setText(elided)
+        self._elided_width = self._text_size(elided).width()
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        margins = self.contentsMargins()
+        return self._text_size(self._title).grownBy(margins)
+
+    def minimumSizeHint(self) -> QSize:
+        # The title is elided rather than widening the window.
+        return QSize(0, self.sizeHint().height())
+
+    def changeEvent(self, event: QEvent):
+        if event.type() in (QEvent.Type.FontChange, QEvent.Type.StyleChange):
+            self._metrics = None
+            self._elided_for = None
+            # Forces the title to be elided and measured again with the new font.
+            self._static_text.setText("")
+            self._static_text.prepare(font=self.font())
+            self.updateGeometry()
+            self._update_elided_text()
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_elided_text()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self.contentsRect()
+        option = QStyleOption()
+        option.initFrom(self)
+        option.rect.setWidth(self.width() - rect.width() + self._elided_width)
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        x = rect.x()
+        if self.indent() < 0 and self.frameWidth() > 0:
+            x += self._font_metrics().horizontalAdvance("x") // 2
+        y = rect.y() + (rect.height() - self._font_metrics().height()) / 2
+        painter.drawStaticText(QPointF(x, y), self._static_text)
+        painter.end()
+
+
+class TitleMenuBar(QMenuBar):
+    def __init__(
+        self,
+        menu_bar_border: Optional[str] = "0px solid black",
+        menu_bar_bg_color: Optional[str] = "",
+        menu_bar_border_radius: Optional[str] = "0px",
+        menu_bar_padding: Optional[str] = "0px",
+        menu_bar_font: Optional[str] = "arial",
+        menu_bar_font_color: Optional[str] = "#fff",
+        menu_bar_font_size: Optional[str] = "14px",
+        menu_bar_additional_qss: Optional[str] = "",
+        menu_bar_item_bg_color: Optional[str] = "",
+        menu_bar_item_additional_qss: Optional[str] = "",
+        menu_bar_item_hover_bg_color: Optional[str] = "",
+        menu_bar_item_hover_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_font: Optional[str] = None,
+        menu_bar_dropdown_item_padding: Optional[str] = "3px 10px",
+        menu_bar_dropdown_item_bg_color: Optional[str] = "",
+        menu_bar_dropdown_item_additional_qss: Optional[str] = "",
+        menu_bar_dropdown_item_hover_bg_color: Optional[str] = "",
+        menu_bar_dropdown_item_hover_additional_qss: Optional[str] = "",
+        theme: Optional["TitleBarTheme"] = None,
+        lazy_init: Optional[bool] = False,
+    ):
+        """
+        Creates a default menu bar for the `CustomTitleBar` which can be used to add menu items and actions with the `add_menu_item` method.
+
+        :param menu_bar_border: The border of the menu bar. Defaults to "0px solid black".
+        :type menu_bar_border: Optional[str]
+        :param menu_bar_bg_color: The background color of the menu bar. Defaults to "".
+        :type menu_bar_bg_color: Optional[str]
+        :param menu_bar_border_radius: The border radius of the menu bar. Defaults to "0px".
+        :type menu_bar_border_radius: Optional[str]
+        :param menu_bar_padding: The padding (space between border and content) of the menu bar. Defaults to "0px".
+        :type menu_bar_padding: Optional[str]
+        :param menu_bar_font: The font family of the menu bar. Defaults to "arial".
+        :type menu_bar_font: Optional[str]
+        :param menu_bar_font_color: The font color of menu bar text. Defaults to "#fff".
+        :type menu_bar_font_color: Optional[str]
+        :param menu_bar_font_size: The font size of the menu bar. Defaults to "14px".
+        :type menu_bar_font_size: Optional[str]
+        :param menu_bar_additional_qss: Any additional QSS for the menu bar. Defaults to "".
+        :type menu_bar_additional_qss: Optional[str]
+
+        :param menu_bar_item_bg_color: The background color of the menu bar items (the menus). Defaults to "".
+        :type menu_bar_item_bg_color: Optional[str]
+        :param menu_bar_item_additional_qss: Additional QSS for the menu bar items (the menus). Defaults to "".
+        :type menu_bar_item_additional_qss: Optional[str]
+
+        :param menu_bar_item_hover_bg_color: The background hover color of menu bar items (the menus). Defaults to "".
+        :type menu_bar_item_hover_bg_color: Optional[str]
+        :param menu_bar_item_hover_bg_color: The background hover color of menu bar items (the menus). Defaults to "".
+        :param menu_bar_item_hover_additional_qss: Additional QSS for menu bar items hover. Defaults to "".
+        :type menu_bar_item_hover_additional_qss: Optional[str]
+
+        :param menu_bar_dropdown_font: The font family for the dropdowns of the menus. Defaults to the same font as `menu_bar_font`.
+        :type menu_bar_dropdown_font: Optional[str].
+        :param menu_bar_dropdown_additional_qss: Additional QSS for the actual dropdown area of the menu items. Defaults to "".
+        :type menu_bar_dropdown_additional_qss: Optional[str]
+
+        :param menu_bar_dropdown_item_padding: The padding for the dropdown items. Defaults to "3px 10px".
+        :type menu_bar_dropdown_item_padding: Optional[str]
+        :param menu_bar_dropdown_item_bg_color: The background color for the dropdown items. Defaults to "".
+        :type menu_bar_dropdown_item_bg_color: Optional[str]
+        :param menu_bar_dropdown_item_additional_qss: Additional QSS for the dropdown items. Defaults to ".
+        :type menu_bar_dropdown_item_additional_qss: Optional[str]
+
+        :param menu_bar_dropdown_item_hover_bg_color: The background color of the dropdown items upon hover. Defaults to "".
+        :type menu_bar_dropdown_item_hover_bg_color: Optional[str]
+        :param menu_bar_dropdown_item_hover_additional_qss: Additional QSS for the dropdown items upon hover. Defaults to "".
+        :type menu_bar_dropdown_item_hover_additional_qss: Optional[str]
+
+        :param theme: The theme whose menu bar stylesheet is applied. If given, it takes precedence over the other styling parameters. Defaults to a theme built from them.
+        :type theme: Optional[TitleBarTheme]
+
+        :param lazy_init: Whether applying the stylesheet should be left to a later `finish_lazy_init` call. Defaults to False.
+        :type lazy_init: Optional[bool]
+
+        """
+        super().__init__()
+
+        # Menu bar
+        self.menu = self
+        self.menu.setNativeMenuBar(False)
+
+        self.menu.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+
+        if theme is None:
+            theme = TitleBarTheme(
+                menu_bar_border=menu_bar_border,
+                menu_bar_bg_color=menu_bar_bg_color,
+                menu_bar_border_radius=menu_bar_border_radius,
+                menu_bar_padding=menu_bar_padding,
+                menu_bar_font=menu_bar_font,
+                menu_bar_font_color=menu_bar_font_color,
+                menu_bar_font_size=menu_bar_font_size,
+                menu_bar_additional_qss=menu_bar_additional_qss,
+                menu_bar_item_bg_color=menu_bar_item_bg_color,
+                menu_bar_item_additional_qss=menu_bar_item_additional_qss,
+                menu_bar_item_hover_bg_color=menu_bar_item_hover_bg_color,
+                menu_bar_item_hover_additional_qss=menu_bar_item_hover_additional_qss,
+                menu_bar_dropdown_additional_qss=menu_bar_dropdown_additional_qss,
+                menu_bar_dropdown_font=menu_bar_dropdown_font,
+                menu_bar_dropdown_item_padding=menu_bar_dropdown_item_padding,
+                menu_bar_dropdown_item_bg_color=menu_bar_dropdown_item_bg_color,
+                menu_bar_dropdown_item_additional_qss=menu_bar_dropdown_item_additional_qss,
+                menu_bar_dropdown_item_hover_bg_color=menu_bar_dropdown_item_hover_bg_color,
+                menu_bar_dropdown_item_hover_additional_qss=menu_bar_dropdown_item_hover_additional_qss,
+            )
+        self.theme = theme
+        self._lazy_init_pending = lazy_init
+        if not lazy_init:
+            self.theme.style_widget(self, "menu")
+
+        self.setVisible(True)
+
+    def finish_lazy_init(self):
+        """Applies the stylesheet if that was deferred with `lazy_init`."""
+        if not self._lazy_init_pending:
+            return
+        self._lazy_init_pending = False
+        self.theme.style_widget(self, "menu")
+        for action in self.actions():
+            if action.menu() is not None:
+                self.theme.tag_menu(action.menu())
+
+    def add_menu_item(self, menu: QMenu):
+        """Adds `QMenu` to the `CustomTitleBar`'s `QMenuBar`."""
+        self.theme.tag_menu(menu)
+        self.menu.addMenu(menu)
+
+    def return_menu_bar(self):
+        """Gives access to the menu bar."""
+        return self.menu